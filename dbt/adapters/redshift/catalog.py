@@ -0,0 +1,314 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt_common.dataclass_schema import dbtClassMixin, ValidationError
+from dbt_common.exceptions import DbtRuntimeError
+
+if TYPE_CHECKING:
+    import agate
+
+logger = AdapterLogger("Redshift")
+
+# bump this whenever the layout of the markers file changes, older files are then ignored
+CATALOG_MARKERS_VERSION = 2
+
+# the base and extended catalog queries are joined on these columns
+CATALOG_JOIN_COLUMNS = ("table_schema", "table_name")
+# dbt expects these as strings, whatever they look like
+CATALOG_TEXT_ONLY_COLUMNS = ["table_database", "table_schema", "table_name"]
+
+
+class CatalogRows(NamedTuple):
+    """The column names and raw rows of a catalog query, as returned by the cursor."""
+
+    column_names: List[str]
+    rows: List[Tuple[Any, ...]]
+
+
+class CatalogAssembler:
+    """
+    Assemble the catalog from the raw rows of the base and the extended catalog queries.
+
+    This does what joining the agate tables of both queries, filtering them to the used schemas
+    and merging the tables of every shard did, with a hash join over plain tuples instead. The
+    only agate table built is the final one, returned by `to_table`.
+
+    svv_table_info holds one row per table, so each base row matches at most one extended row.
+    """
+
+    def __init__(self, used_schemas: FrozenSet[Tuple[str, str]]) -> None:
+        self._used_schemas = frozenset((d.lower(), s.lower()) for d, s in used_schemas)
+        self.column_names: Optional[List[str]] = None
+        self.rows: List[Tuple[Any, ...]] = []
+        self._entry_rows: List[Dict[str, Any]] = []
+
+    def add(self, base: CatalogRows, extended: Optional[CatalogRows] = None) -> None:
+        """Left-join the `extended` rows of a shard to its `base` rows, and keep the used ones."""
+        column_names = list(base.column_names)
+        database_index = column_names.index("table_database")
+        schema_index, name_index = (column_names.index(c) for c in CATALOG_JOIN_COLUMNS)
+
+        stats: Dict[Tuple[Any, Any], Tuple[Any, ...]] = {}
+        missing: Tuple[Any, ...] = ()
+        if extended is not None:
+            ext_schema_index, ext_name_index = (
+                extended.column_names.index(c) for c in CATALOG_JOIN_COLUMNS
+            )
+            stats_indexes = [
+                index
+                for index, name in enumerate(extended.column_names)
+                if name not in CATALOG_JOIN_COLUMNS
+            ]
+            column_names.extend(extended.column_names[index] for index in stats_indexes)
+            missing = (None,) * len(stats_indexes)
+            for row in extended.rows:
+                key = (row[ext_schema_index], row[ext_name_index])
+                if key not in stats:
+                    stats[key] = tuple(row[index] for index in stats_indexes)
+
+        if self.column_names is None:
+            self.column_names = column_names
+        elif self.column_names != column_names:
+            raise DbtRuntimeError(
+                f"Catalog queries returned different columns: {self.column_names} and "
+                f"{column_names}"
+            )
+
+        used_schemas = self._used_schemas
+        for row in base.rows:
+            database, schema = row[database_index], row[schema_index]
+            # the schema may be present but None, which is not an error and is filtered out
+            if schema is None or (database.lower(), schema.lower()) not in used_schemas:
+                continue
+            if extended is None:
+                self.rows.append(tuple(row))
+            else:
+                self.rows.append(tuple(row) + stats.get((schema, row[name_index]), missing))
+
+    def add_entries(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Keep the used tables of a previous catalog.json, see `catalog_entry_rows`."""
+        for entry in entries:
+            metadata = entry["metadata"]
+            schema = metadata["schema"]
+            if (metadata["database"].lower(), schema.lower()) in self._used_schemas:
+                self._entry_rows.extend(catalog_entry_rows(entry))
+
+    def to_table(self) -> "agate.Table":
+        """
+        Build the catalog table, with the column types `table_from_rows` would infer.
+
+        Columns holding only booleans or numbers are typed from their python values, which is
+        what agate would end up with after testing every value. Only the other columns, mostly
+        strings that might still look like numbers or dates, go through agate's type tester.
+        """
+        import agate
+        from dbt_common.clients.agate_helper import (
+            Integer,
+            Number,
+            build_type_tester,
+            empty_table,
+        )
+
+        if self._entry_rows:
+            if self.column_names is None:
+                # nothing was queried, so the columns are the ones of the previous catalog
+                self.column_names = list({name: None for row in self._entry_rows for name in row})
+            self.rows.extend(
+                tuple(row.get(name) for name in self.column_names) for row in self._entry_rows
+            )
+            self._entry_rows = []
+
+        if self.column_names is None:
+            return empty_table()
+
+        column_types: List[Optional[agate.data_types.DataType]] = []
+        untyped: List[int] = []
+        for index, name in enumerate(self.column_names):
+            value_types = {type(row[index]) for row in self.rows} - {type(None)}
+            if name in CATALOG_TEXT_ONLY_COLUMNS or not value_types:
+                column_type = None
+            elif value_types == {bool}:
+                column_type = agate.data_types.Boolean()
+            elif value_types == {int}:
+                column_type = Integer()
+            elif value_types <= {int, float, Decimal}:
+                column_type = Number()
+            else:
+                column_type = None
+            if column_type is None:
+                untyped.append(index)
+            column_types.append(column_type)
+
+        if untyped:
+            tester = build_type_tester(CATALOG_TEXT_ONLY_COLUMNS, string_null_values=())
+            inferred = tester.run(
+                [[row[index] for index in untyped] for row in self.rows],
+                [self.column_names[index] for index in untyped],
+            )
+            for index, column_type in zip(untyped, inferred):
+                column_types[index] = column_type
+
+        return agate.Table(self.rows, self.column_names, column_types=column_types)
+
+
+def catalog_entry_rows(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Turn a table of catalog.json back into the rows of the catalog queries it was built from, one
+    per column. Stats that were not included in catalog.json come back as missing.
+    """
+    metadata = entry["metadata"]
+    table = {
+        "table_database": metadata["database"],
+        "table_schema": metadata["schema"],
+        "table_name": metadata["name"],
+        "table_type": metadata["type"],
+        "table_comment": metadata.get("comment"),
+    }
+    stats: Dict[str, Any] = {}
+    for stat_id, stat in entry.get("stats", {}).items():
+        # added by dbt itself when writing the catalog
+        if stat_id == "has_stats":
+            continue
+        for part in ("label", "value", "description", "include"):
+            stats[f"stats:{stat_id}:{part}"] = stat.get(part)
+
+    columns = sorted(entry.get("columns", {}).values(), key=lambda column: column["index"])
+    return [
+        {
+            **table,
+            "column_name": column["name"],
+            "column_index": column["index"],
+            "column_type": column["type"],
+            "column_comment": column.get("comment"),
+            "table_owner": metadata.get("owner"),
+            **stats,
+        }
+        for column in columns
+    ]
+
+
+def load_catalog_entries(path: str, database: str) -> Dict[str, Dict[str, Any]]:
+    """The tables of the catalog.json at `path` in `database`, by lowercase "schema.name"."""
+    try:
+        with open(path) as fp:
+            catalog = json.load(fp)
+    except (OSError, ValueError) as exc:
+        logger.debug(f"Could not read the previous catalog at '{path}': {exc}")
+        return {}
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for entry in [*catalog.get("nodes", {}).values(), *catalog.get("sources", {}).values()]:
+        metadata = entry.get("metadata", {})
+        if (metadata.get("database") or "").lower() != database.lower():
+            continue
+        entries[f"{metadata['schema']}.{metadata['name']}".lower()] = entry
+    return entries
+
+
+@dataclass
+class CatalogMarkers(dbtClassMixin):
+    """
+    The change markers of the tables in a catalog.json, written next to it while the catalog is
+    built incrementally.
+
+    Each table, by lowercase "schema.name", is stored with a cheap marker from the catalog, a list
+    of `[oid, owner_oid, comment_length, columns_hash, stats_hash]`. Recreating a relation
+    changes its oid, and changing the owner or most comments changes the next two. The columns
+    hash covers the name, type and type modifier of every column, so columns added, dropped,
+    renamed or altered in place change it. At the full catalog tier, the stats hash covers the
+    svv_table_info stats of the table, which loads and dist or sort key changes move.
+
+    Note: a comment replaced by one of the same length is not detected.
+    """
+
+    key: str
+    version: int = CATALOG_MARKERS_VERSION
+    markers: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str, key: str, catalog_path: str) -> Optional["CatalogMarkers"]:
+        """
+        Read the markers from `path`, returning None if they are missing, unreadable, stale or
+        older than the catalog at `catalog_path` was written.
+        """
+        try:
+            with open(path) as fp:
+                raw_markers = json.load(fp)
+            cls.validate(raw_markers)
+            markers = cls.from_dict(raw_markers)
+            # dbt writes catalog.json after the catalog was built, a catalog older than its
+            # markers is from an invocation that did not get that far
+            written_before = os.path.getmtime(catalog_path) < os.path.getmtime(path)
+        except FileNotFoundError:
+            logger.debug(f"No catalog markers found at '{path}'")
+            return None
+        except (OSError, ValueError, ValidationError) as exc:
+            logger.debug(f"Ignoring unreadable catalog markers at '{path}': {exc}")
+            return None
+
+        if markers.version != CATALOG_MARKERS_VERSION or markers.key != key:
+            logger.debug(f"Ignoring catalog markers at '{path}' taken for another target")
+            return None
+        if written_before:
+            logger.debug(f"Ignoring catalog markers at '{path}', newer than '{catalog_path}'")
+            return None
+
+        return markers
+
+    def save(self, path: str) -> None:
+        """Write the markers atomically, so a concurrent reader never sees a partial file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as fp:
+                json.dump(self.to_dict(), fp)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug(f"Could not write catalog markers to '{path}': {exc}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _digest(values: Iterable[Any]) -> int:
+    """A stable 60-bit hash of `values`, small enough for any JSON reader."""
+    text = "\x1f".join(str(value) for value in values)
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:15], 16)
+
+
+def catalog_markers(rows: Iterable, stats_rows: Iterable = ()) -> Dict[str, List[int]]:
+    """
+    Translate the raw rows of `redshift__get_catalog_markers_sql`, one per column of each
+    relation, and those of `redshift__get_catalog_stats_markers_sql` into markers.
+    """
+    markers: Dict[str, List[int]] = {}
+    columns: Dict[str, List[Tuple[int, str, int, int]]] = {}
+    for schema, name, relation_oid, owner_oid, comment_length, *column in rows:
+        key = f"{schema}.{name}".lower()
+        if key not in markers:
+            markers[key] = [int(value or 0) for value in (relation_oid, owner_oid, comment_length)]
+            columns[key] = []
+        attnum, attname, atttypid, atttypmod = column
+        if attnum is not None:
+            columns[key].append((int(attnum), str(attname), int(atttypid), int(atttypmod)))
+
+    stats = {f"{schema}.{name}".lower(): _digest(values) for schema, name, *values in stats_rows}
+    for key, marker in markers.items():
+        marker.append(_digest(sorted(columns[key])))
+        marker.append(stats.get(key, 0))
+    return markers
@@ -1,10 +1,24 @@
 import re
+import threading
+import time
 import redshift_connector
 import sqlparse
 
-from multiprocessing import Lock
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Tuple, Union, Optional, List, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    Tuple,
+    Union,
+    Optional,
+    List,
+    TYPE_CHECKING,
+)
 from dataclasses import dataclass, field
 
 from dbt.adapters.exceptions import FailedToConnectError
@@ -74,6 +88,17 @@ class RedshiftSSLMode(StrEnum):
     verify_full = "verify-full"
 
 
+class RedshiftCatalogTier(StrEnum):
+    """How much `dbt docs generate` reads about every relation, each tier adding to the last."""
+
+    # relations and their columns
+    COLUMNS = "columns"
+    # plus table and column comments, and owners
+    COMMENTS = "comments"
+    # plus the stats from svv_table_info
+    FULL = "full"
+
+
 SSL_MODE_TRANSLATION = {
     UserSSLMode.disable: None,
     UserSSLMode.allow: RedshiftSSLMode("verify-ca"),
@@ -139,6 +164,26 @@ class RedshiftCredentials(Credentials):
     autocommit: Optional[bool] = True
     access_key_id: Optional[str] = None
     secret_access_key: Optional[str] = None
+    # opt-in on-disk copy of the relations cache, reused between invocations while unchanged
+    relation_cache_snapshot_path: Optional[str] = None
+    # drop relations without cascade when pg_depend and the cache show nothing depends on them
+    check_drop_dependents: bool = False
+    # drop the backup relations of table and view models at the end of the run, off the model's thread
+    defer_backup_drops: bool = False
+    # apply grants and docs of table and view models after commit, on this many side connections
+    metadata_threads: int = 0
+    # opt-in previous catalog.json, whose unchanged tables are reused when generating docs
+    previous_catalog_path: Optional[str] = None
+    # trim the catalog to columns, or columns with comments and owners, for faster docs
+    catalog_tier: RedshiftCatalogTier = RedshiftCatalogTier.FULL
+    # describe the existing incremental models and snapshots in bulk when the run starts
+    prefetch_columns: bool = False
+    # where metadata freshness reads the last writes to sources from, see relation_last_modified.sql
+    last_modified_source: str = "sys_query_detail"
+    # only look this many days back for those writes, older sources are reported as stale
+    last_modified_lookback_days: Optional[int] = None
+    # compute the loaded_at_field freshness checks started within this many seconds in one query
+    freshness_batch_window: float = 0.0
 
     #
     # IAM identity center methods
@@ -388,9 +433,141 @@ def get_connection_method(
     return connect
 
 
+class DropLock:
+    """
+    Serialize drops that could cascade into each other, while letting unrelated drops run at the
+    same time.
+
+    Each drop holds a set of keys, the relations its cascade can reach. A drop waits until none
+    of its keys are held by another thread. Holding no particular keys means holding all of them,
+    for drops whose reach is unknown. A thread never waits for the keys it holds itself, since a
+    drop can still hold its keys until its transaction commits. Nor does a thread that holds any
+    keys wait for others, as the threads holding those could be waiting for its own.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        # the threads holding each key, once per hold
+        self._held: Dict[str, List[int]] = {}
+        self._exclusive: List[int] = []
+        self._exclusive_waiting = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def _holds_any(self, owner: int) -> bool:
+        return owner in self._exclusive or any(owner in holders for holders in self._held.values())
+
+    def _is_free(self, keys: Optional[FrozenSet[str]], owner: int) -> bool:
+        if self._holds_any(owner):
+            return True
+        if any(holder != owner for holder in self._exclusive):
+            return False
+        if keys is None:
+            return all(holder == owner for holders in self._held.values() for holder in holders)
+        if any(holder != owner for key in keys for holder in self._held.get(key, [])):
+            return False
+        # an exclusive drop is waiting, let it go first so it is not starved
+        return not self._exclusive_waiting or owner in self._exclusive
+
+    def acquire(self, keys: Optional[Iterable[str]] = None) -> Optional[FrozenSet[str]]:
+        """Wait for `keys`, or for every key, and hold them until `release` is called with them."""
+        lock_keys = frozenset(keys) if keys is not None else None
+        owner = threading.get_ident()
+        start = time.perf_counter()
+        with self._condition:
+            if lock_keys is None:
+                self._exclusive_waiting += 1
+            try:
+                self._condition.wait_for(lambda: self._is_free(lock_keys, owner))
+            finally:
+                if lock_keys is None:
+                    self._exclusive_waiting -= 1
+            if lock_keys is None:
+                self._exclusive.append(owner)
+            else:
+                for key in lock_keys:
+                    self._held.setdefault(key, []).append(owner)
+            waited = time.perf_counter() - start
+            self.waits += 1
+            self.wait_time += waited
+
+        logger.debug(
+            f"Waited {waited:.3f}s for the drop lock on "
+            f"{', '.join(sorted(lock_keys)) if lock_keys is not None else 'all relations'}"
+        )
+        return lock_keys
+
+    def release(self, lock_keys: Optional[FrozenSet[str]]) -> None:
+        """Release keys acquired by this thread."""
+        owner = threading.get_ident()
+        with self._condition:
+            if lock_keys is None:
+                self._exclusive.remove(owner)
+            else:
+                for key in lock_keys:
+                    self._held[key].remove(owner)
+                    if not self._held[key]:
+                        del self._held[key]
+            self._condition.notify_all()
+
+    @contextmanager
+    def hold(self, keys: Optional[Iterable[str]] = None) -> Iterator[None]:
+        lock_keys = self.acquire(keys)
+        try:
+            yield
+        finally:
+            self.release(lock_keys)
+
+
 class RedshiftConnectionManager(SQLConnectionManager):
     TYPE = "redshift"
 
+    def __init__(self, profile, mp_context) -> None:
+        super().__init__(profile, mp_context)
+        self.drop_lock = DropLock()
+        # the drop lock keys held until the open transaction of each thread ends
+        self._transaction_drop_locks: Dict[Hashable, List[Optional[FrozenSet[str]]]] = {}
+
+    def hold_drop_lock_until_commit(self, lock_keys: Optional[Iterable[str]]) -> None:
+        """
+        Hold the drop lock on `lock_keys` until the transaction open on this thread commits or
+        rolls back, for statements that only take effect for other transactions on commit.
+        """
+        held = self.drop_lock.acquire(lock_keys)
+        with self.lock:
+            self._transaction_drop_locks.setdefault(self.get_thread_identifier(), []).append(held)
+
+    def _release_transaction_drop_locks(self) -> None:
+        with self.lock:
+            held = self._transaction_drop_locks.pop(self.get_thread_identifier(), [])
+        for lock_keys in held:
+            self.drop_lock.release(lock_keys)
+
+    def commit(self):
+        try:
+            return super().commit()
+        finally:
+            self._release_transaction_drop_locks()
+
+    def rollback_if_open(self) -> None:
+        try:
+            super().rollback_if_open()
+        finally:
+            self._release_transaction_drop_locks()
+
+    def clear_transaction(self) -> None:
+        try:
+            super().clear_transaction()
+        finally:
+            self._release_transaction_drop_locks()
+
+    def release(self) -> None:
+        # closing the connection rolls back its open transaction
+        try:
+            super().release()
+        finally:
+            self._release_transaction_drop_locks()
+
     def cancel(self, connection: Connection):
         pid = connection.backend_pid  # type: ignore
         sql = f"select pg_terminate_backend({pid})"
@@ -443,21 +620,23 @@ class RedshiftConnectionManager(SQLConnectionManager):
             raise DbtRuntimeError(str(e)) from e
 
     @contextmanager
-    def fresh_transaction(self):
-        """On entrance to this context manager, hold an exclusive lock and
-        create a fresh transaction for redshift, then commit and begin a new
-        one before releasing the lock on exit.
+    def fresh_transaction(self, lock_keys: Optional[Iterable[str]] = None):
+        """On entrance to this context manager, commit the open transaction,
+        hold the drop lock and create a fresh transaction for redshift, then
+        commit and begin a new one before releasing the lock on exit.
+
+        :param lock_keys: The relations the enclosed statements can reach. If not
+            provided, the lock is held exclusively.
 
         See drop_relation in RedshiftAdapter for more information.
         """
-        drop_lock: Lock = self.lock
-
-        with drop_lock:
-            connection = self.get_thread_connection()
+        connection = self.get_thread_connection()
 
-            if connection.transaction_open:
-                self.commit()
+        # committing releases the keys held until then, which other drops may be waiting for
+        if connection.transaction_open:
+            self.commit()
 
+        with self.drop_lock.hold(lock_keys):
             self.begin()
             yield
             self.commit()
@@ -507,6 +686,14 @@ class RedshiftConnectionManager(SQLConnectionManager):
             table = agate_helper.empty_table()
         return response, table
 
+    def fetch_rows(self, sql: str) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Run `sql` and return its column names and raw rows, without building an agate table."""
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_query(sql, auto_begin=False)
+        if cursor.description is None:
+            return [], []
+        return [col[0] for col in cursor.description], [tuple(row) for row in cursor.fetchall()]
+
     def add_query(self, sql, auto_begin=True, bindings=None, abridge_sql_log=False):
         connection = None
         cursor = None
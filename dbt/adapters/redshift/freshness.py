@@ -0,0 +1,69 @@
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.base.impl import FreshnessResponse
+from dbt.adapters.contracts.connection import AdapterResponse
+
+
+class FreshnessRequest:
+    """A loaded_at_field freshness check waiting in a FreshnessBatcher."""
+
+    def __init__(self, source: BaseRelation, loaded_at_field: str, filter: Optional[str]) -> None:
+        self.source = source
+        self.loaded_at_field = loaded_at_field
+        self.filter = filter
+        self.result: Optional[Tuple[Optional[AdapterResponse], FreshnessResponse]] = None
+        self.error: Optional[Exception] = None
+        self._done = threading.Event()
+
+
+class FreshnessBatcher:
+    """
+    Gather the loaded_at_field freshness checks that dbt runs concurrently, one per thread, so
+    they are computed with a single query.
+
+    The first check to arrive waits up to `window` seconds for others, or until `max_size` of
+    them are pending, then runs the whole batch on its own connection while the others wait for
+    their result. If the batch fails, each check gets the error back and can be run on its own.
+    """
+
+    def __init__(self, window: float, max_size: int) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._condition = threading.Condition()
+        self._pending: List[FreshnessRequest] = []
+        self.batches = 0
+
+    def submit(
+        self,
+        request: FreshnessRequest,
+        run_batch: Callable[[List[FreshnessRequest]], Any],
+    ) -> FreshnessRequest:
+        with self._condition:
+            self._pending.append(request)
+            leader = len(self._pending) == 1
+            self._condition.notify_all()
+
+        if leader:
+            deadline = time.monotonic() + self.window
+            with self._condition:
+                while len(self._pending) < self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._pending = self._pending, []
+                self.batches += 1
+            try:
+                run_batch(batch)
+            except Exception as exc:
+                for pending in batch:
+                    pending.error = exc
+            finally:
+                for pending in batch:
+                    pending._done.set()
+
+        request._done.wait()
+        return request
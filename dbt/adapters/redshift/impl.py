@@ -1,21 +1,73 @@
+import contextvars
 import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 from dbt_common.contracts.constraints import ConstraintType
-from typing import Optional, Set, Any, Dict, Type, TYPE_CHECKING
+from typing import (
+    Optional,
+    Set,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
 from collections import namedtuple
-from dbt.adapters.base import PythonJobHelper
-from dbt.adapters.base.impl import AdapterConfig, ConstraintSupport
+from dbt.adapters.base import BaseRelation, Column, PythonJobHelper
+from dbt.adapters.base.relation import InformationSchema
+from dbt.adapters.base.impl import AdapterConfig, ConstraintSupport, FreshnessResponse
 from dbt.adapters.base.meta import available
 from dbt.adapters.capability import Capability, CapabilityDict, CapabilitySupport, Support
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.contracts.connection import AdapterResponse
+from dbt.adapters.contracts.macros import MacroResolverProtocol
+from dbt.adapters.contracts.relation import ComponentName, RelationType
 from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.events.types import CatalogGenerationError
+from dbt.adapters.exceptions import RelationReturnedMultipleResultsError
+from dbt.adapters.factory import get_adapter_package_names, get_adapter_type_names
+from dbt.adapters.reference_keys import _make_ref_key
+from dbt.adapters.relation_configs import RelationResults
 
 
 import dbt_common.exceptions
+from dbt_common.events.functions import warn_or_error
+from dbt_common.utils import executor
 
 from dbt.adapters.redshift import RedshiftConnectionManager, RedshiftRelation
+from dbt.adapters.redshift.connections import RedshiftCatalogTier
+from dbt.adapters.redshift.catalog import (
+    CatalogAssembler,
+    CatalogMarkers,
+    CatalogRows,
+    catalog_markers,
+    load_catalog_entries,
+)
+from dbt.adapters.redshift.freshness import FreshnessBatcher, FreshnessRequest
+from dbt.adapters.redshift.late_binding import LateBindingViewColumns, late_binding_column
+from dbt.adapters.redshift.mv_refresh import refresh_in_dependency_order
+from dbt.adapters.redshift.relation_cache import (
+    MaterializedViewDescriptions,
+    MaterializedViewRefreshState,
+    RelationCacheSnapshot,
+    RelationColumns,
+    RelationLink,
+    RelationLookups,
+    materialized_view_descriptions,
+    materialized_view_name,
+    materialized_view_refresh_state,
+    relation_cache_markers,
+)
+from dbt.adapters.redshift.utility import chunk_relations
 
 logger = AdapterLogger("Redshift")
 packages = ["redshift_connector", "redshift_connector.core"]
@@ -28,11 +80,64 @@ for package in packages:
     logger.set_adapter_dependency_log_level(package, level)
 
 GET_RELATIONS_MACRO_NAME = "redshift__get_relations"
+GET_RELATION_CACHE_MARKERS_MACRO_NAME = "redshift__get_relation_cache_markers"
+LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME = "redshift__list_relations_in_schemas"
+GET_RELATIONS_BY_NAME_MACRO_NAME = "redshift__get_relations_by_name"
+DROP_LEAF_RELATION_MACRO_NAME = "redshift__drop_leaf_relation"
+GET_RELATION_DEPENDENT_COUNT_MACRO_NAME = "redshift__get_relation_dependent_count"
+# the relation types redshift__drop_leaf_relation can drop
+LEAF_DROP_RELATION_TYPES = (
+    RelationType.Table,
+    RelationType.View,
+    RelationType.MaterializedView,
+)
+CAN_SELECT_FROM_MACRO_NAME = "redshift__can_select_from"
+NO_SVV_TABLE_INFO_WARNING_MACRO_NAME = "redshift__no_svv_table_info_warning"
+GET_CATALOG_MARKERS_SQL_MACRO_NAME = "redshift__get_catalog_markers_sql"
+GET_CATALOG_STATS_MARKERS_SQL_MACRO_NAME = "redshift__get_catalog_stats_markers_sql"
+GET_LATE_BINDING_VIEW_COLUMNS_MACRO_NAME = "redshift__get_late_binding_view_columns"
+GET_MATERIALIZED_VIEWS_SQL_MACRO_NAME = "redshift__get_materialized_views_sql"
+DESCRIBE_MATERIALIZED_VIEWS_MACRO_NAME = "redshift__describe_materialized_views"
+GET_MATERIALIZED_VIEW_REFRESH_STATE_MACRO_NAME = "redshift__get_materialized_view_refresh_state"
+GET_WLM_CONCURRENCY_MACRO_NAME = "redshift__get_wlm_concurrency"
+GET_COLUMNS_IN_RELATIONS_MACRO_NAME = "redshift__get_columns_in_relations"
+GET_EXTERNAL_SCHEMAS_MACRO_NAME = "redshift__get_external_schemas"
+# dispatched, redshift__get_relation_last_modified reads its options from the profile
+GET_RELATION_LAST_MODIFIED_MACRO_NAME = "get_relation_last_modified"
+COLLECT_FRESHNESS_BATCH_MACRO_NAME = "redshift__collect_freshness_batch"
+# the single check that batches replace, they are not used when a project overrides it
+COLLECT_FRESHNESS_MACRO_NAME = "collect_freshness"
+# the catalog macros that the sharded catalog replaces, unless a project overrides them
+GET_CATALOG_MACRO_NAME = "get_catalog"
+GET_CATALOG_RELATIONS_MACRO_NAME = "get_catalog_relations"
+# varchar(max) is a varchar of this many bytes
+VARCHAR_MAX_SIZE = 65535
+VARCHAR_MAX_PATTERN = re.compile(r"\(\s*max\s*\)", re.IGNORECASE)
+# the loaded_at_field freshness checks computed by one query
+FRESHNESS_BATCH_MAX_SOURCES = 100
+# the macros rendering the (base, extended) catalog queries for shards of schemas and relations
+CATALOG_BY_SCHEMA_MACRO_NAMES = (
+    "_redshift__get_base_catalog_by_schema_sql",
+    "_redshift__get_extended_catalog_by_schema_sql",
+)
+CATALOG_BY_RELATION_MACRO_NAMES = (
+    "_redshift__get_base_catalog_by_relation_sql",
+    "_redshift__get_extended_catalog_by_relation_sql",
+)
 
 if TYPE_CHECKING:
     import agate
 
 
+def _is_varchar(column: Column) -> bool:
+    return column.dtype.lower() in ("character varying", "varchar")
+
+
+def _with_varchar_max_size(data_type: str) -> str:
+    """`data_type` with the size of varchar(max) spelled out, which Column can parse."""
+    return VARCHAR_MAX_PATTERN.sub(f"({VARCHAR_MAX_SIZE})", data_type)
+
+
 @dataclass
 class RedshiftConfig(AdapterConfig):
     sort_type: Optional[str] = None
@@ -66,6 +171,24 @@ class RedshiftAdapter(SQLAdapter):
         }
     )
 
+    def __init__(self, config, mp_context) -> None:
+        super().__init__(config, mp_context)
+        self._relation_lookups = RelationLookups()
+        self._late_binding_columns = LateBindingViewColumns()
+        self._late_binding_columns_lock = threading.Lock()
+        self._relation_columns = RelationColumns()
+        self._materialized_views = MaterializedViewDescriptions()
+        self._materialized_views_lock = threading.Lock()
+        self._external_schemas: Optional[Set[str]] = None
+        self._freshness_batcher: Optional[FreshnessBatcher] = None
+        self._freshness_batcher_lock = threading.Lock()
+        self._deferred_drops: List[BaseRelation] = []
+        self._deferred_drops_lock = threading.Lock()
+        self._metadata_executor: Optional[ThreadPoolExecutor] = None
+        self._metadata_futures: Dict[Tuple[Hashable, str], List[Future]] = {}
+        self._metadata_lock = threading.Lock()
+        self._svv_table_info_selectable: Optional[bool] = None
+
     @classmethod
     def date_function(cls):
         return "getdate()"
@@ -81,13 +204,270 @@ class RedshiftAdapter(SQLAdapter):
             table was dropped by a concurrent transaction
 
         So, we need to lock around calls to the underlying
-        drop_relation() function.
+        drop_relation() function. Drops only wait for each other when
+        their cascades can reach a common relation, see _drop_lock_keys.
+
+        With `check_drop_dependents`, relations that nothing depends on
+        are dropped without CASCADE instead, in the current transaction.
 
         https://docs.aws.amazon.com/redshift/latest/dg/r_DROP_TABLE.html
         """
-        with self.connections.fresh_transaction():
+        transaction_was_open = self.has_open_transaction()
+        if self._is_leaf_relation(relation):
+            self._drop_leaf_relation(relation)
+            if not transaction_was_open and self.has_open_transaction():
+                # nothing else would commit the transaction the drop began
+                self.connections.commit()
+            return
+
+        with self.connections.fresh_transaction(self._drop_lock_keys(relation)):
             return super().drop_relation(relation)
 
+    @available
+    def drop_backup_relation(self, relation) -> str:
+        """
+        Drop the backup relation of a model once it is committed. With `defer_backup_drops`, the
+        drop is queued instead and runs once every node has run, before the on-run-end hooks, see
+        clear_transaction.
+        """
+        if relation is None:
+            return ""
+        if not self.config.credentials.defer_backup_drops:
+            self.drop_relation(relation)
+            return ""
+
+        with self.cache.lock:
+            if (relation.database, relation.schema) in self.cache and (
+                _make_ref_key(relation) not in self.cache.relations
+            ):
+                # the model had no previous version, so nothing was backed up
+                return ""
+        with self._deferred_drops_lock:
+            self._deferred_drops.append(relation)
+        return ""
+
+    def _drop_deferred_relations(self) -> None:
+        """Drop the queued backup relations concurrently, on their own connections."""
+        with self._deferred_drops_lock:
+            relations, self._deferred_drops = self._deferred_drops, []
+        if not relations:
+            return
+
+        start = time.perf_counter()
+        with executor(self.config) as tpe:
+            futures = [
+                tpe.submit_connected(
+                    self,
+                    f"drop_{relation.schema}_{relation.identifier}",
+                    self.drop_relation,
+                    relation,
+                )
+                for relation in relations
+            ]
+            failures = 0
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    # the models are built already, a leftover backup is only dropped next time
+                    failures += 1
+                    logger.warning(f"Could not drop a backup relation: {exc}")
+        logger.debug(
+            f"Dropped {len(relations) - failures} deferred backup relation(s) "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+
+    def _drop_leaf_relation(self, relation) -> None:
+        """
+        Drop `relation` without cascade. A cascading drop of one of its parents can still reach
+        it, so it holds its key in the drop lock until the drop is committed.
+        """
+        self.cache_dropped(relation)
+        lock_keys = self._drop_lock_keys(relation)
+        kwargs = {"relation": relation}
+        if self.connections.get_thread_connection().transaction_open:
+            self.connections.hold_drop_lock_until_commit(lock_keys)
+            self.execute_macro(DROP_LEAF_RELATION_MACRO_NAME, kwargs=kwargs)
+        elif self.config.credentials.autocommit:
+            with self.connections.drop_lock.hold(lock_keys):
+                self.execute_macro(DROP_LEAF_RELATION_MACRO_NAME, kwargs=kwargs)
+        else:
+            # without autocommit, a drop outside of a transaction would never be committed
+            self.connections.begin()
+            self.connections.hold_drop_lock_until_commit(lock_keys)
+            self.execute_macro(DROP_LEAF_RELATION_MACRO_NAME, kwargs=kwargs)
+            self.connections.commit()
+
+    @available
+    def has_open_transaction(self) -> bool:
+        connection = self.connections.get_if_exists()
+        return connection is not None and connection.transaction_open
+
+    @available
+    def leave_transaction_block(self) -> bool:
+        """
+        Commit the open transaction of this thread, if any, for a statement Redshift does not run
+        in a transaction block. Returns False when autocommit is off, as the driver would open one
+        for the statement anyway.
+        """
+        if not self.config.credentials.autocommit:
+            return False
+        if self.connections.get_thread_connection().transaction_open:
+            self.connections.commit()
+        return True
+
+    @available
+    def runs_metadata_in_background(self) -> bool:
+        return self.config.credentials.metadata_threads > 0
+
+    @available
+    def submit_relation_metadata(
+        self,
+        relation: BaseRelation,
+        grant_config: Optional[Dict[str, Any]],
+        should_revoke: bool,
+        docs_sql: List[str],
+    ) -> str:
+        """
+        Apply grants and persist docs for a committed relation on side connections, so the model's
+        thread can carry on. Grants and docs run concurrently, each in its own transaction. Their
+        failures are raised by wait_for_relation_metadata, which has to be called before anything
+        else touches the grants of `relation`, like the post-hooks that run outside the
+        transaction.
+        """
+        steps: List[Tuple[str, Callable[[], Any]]] = []
+        if grant_config:
+            kwargs = {
+                "relation": relation,
+                "grant_config": grant_config,
+                "should_revoke": should_revoke,
+            }
+            steps.append(("grants", lambda: self.execute_macro("apply_grants", kwargs=kwargs)))
+        if docs_sql:
+            steps.append(("docs", lambda: [self.execute(sql) for sql in docs_sql]))
+        if not steps:
+            return ""
+
+        with self._metadata_lock:
+            if self._metadata_executor is None:
+                self._metadata_executor = ThreadPoolExecutor(
+                    max_workers=self.config.credentials.metadata_threads,
+                    thread_name_prefix="metadata",
+                )
+            futures = [
+                # the invocation context has to follow the work onto the pool's threads
+                self._metadata_executor.submit(
+                    contextvars.copy_context().run,
+                    self._run_metadata_step,
+                    f"{name}_{relation.identifier}",
+                    step,
+                )
+                for name, step in steps
+            ]
+            key = (self.connections.get_thread_identifier(), str(relation))
+            self._metadata_futures.setdefault(key, []).extend(futures)
+        return ""
+
+    def _run_metadata_step(self, name: str, step: Callable[[], Any]) -> None:
+        """
+        Run `step` on the connection of this side thread, then commit it. The connection is kept
+        for the next step the thread runs, and closed in cleanup_connections.
+        """
+        with self.connection_named(name, should_release_connection=False):
+            connection = self.connections.get_thread_connection()
+            try:
+                step()
+            except BaseException:
+                # the connection is reused, it must not keep a failed transaction open
+                if connection.transaction_open:
+                    self.connections.rollback_if_open()
+                raise
+            if connection.transaction_open:
+                self.connections.commit()
+
+    @available
+    def wait_for_relation_metadata(self, relation: BaseRelation) -> str:
+        """Wait for the grants and docs submitted for `relation`, raising if any of them failed."""
+        with self._metadata_lock:
+            key = (self.connections.get_thread_identifier(), str(relation))
+            futures = self._metadata_futures.pop(key, [])
+
+        errors = []
+        for future in futures:
+            try:
+                future.result()
+            except Exception as exc:
+                errors.append(str(exc))
+        if errors:
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"Could not apply grants or docs to {relation} after commit: {'; '.join(errors)}"
+            )
+        return ""
+
+    def _abandon_relation_metadata(self) -> None:
+        """
+        Cancel the grants and docs this thread submitted but did not wait for, as its model
+        failed in between, and wait for those already running.
+        """
+        thread = self.connections.get_thread_identifier()
+        with self._metadata_lock:
+            keys = [key for key in self._metadata_futures if key[0] == thread]
+            futures = [future for key in keys for future in self._metadata_futures.pop(key)]
+        running = [future for future in futures if not future.cancel()]
+        for future in running:
+            try:
+                future.result()
+            except Exception as exc:
+                logger.debug(f"Grants or docs of a failed model failed too: {exc}")
+        if futures:
+            logger.debug(
+                f"Cancelled {len(futures) - len(running)} and drained {len(running)} grant and "
+                "docs step(s) of a failed model"
+            )
+
+    def release_connection(self) -> None:
+        # a model's thread releases its connection once the model ran, even if it failed
+        self._abandon_relation_metadata()
+        super().release_connection()
+
+    def _is_leaf_relation(self, relation) -> bool:
+        """
+        Whether nothing depends on `relation`, according to the links in the relations cache and
+        to pg_depend. Without `check_drop_dependents`, every relation is dropped with cascade, since
+        dependents created outside of dbt are not in the cache.
+        """
+        # links are only cached for the target database
+        database = self.config.credentials.database
+        if (
+            not self.config.credentials.check_drop_dependents
+            or relation.type not in LEAF_DROP_RELATION_TYPES
+            or (relation.database or database).lower() != database.lower()
+            or (relation.database, relation.schema) not in self.cache
+        ):
+            return False
+        with self.cache.lock:
+            cached = self.cache.relations.get(_make_ref_key(relation))
+            if cached is not None and cached.referenced_by:
+                return False
+
+        result = self.execute_macro(
+            GET_RELATION_DEPENDENT_COUNT_MACRO_NAME, kwargs={"relation": relation}
+        )
+        return int(result[0][0]) == 0
+
+    def _drop_lock_keys(self, relation) -> Optional[Set[str]]:
+        """
+        The relations a `drop ... cascade` of `relation` can reach, following the links in the
+        relations cache. Returns None when the schema of `relation` is not cached, since its
+        dependents are then unknown and the drop has to be serialized with every other one.
+        """
+        if (relation.database, relation.schema) not in self.cache:
+            return None
+        with self.cache.lock:
+            cached = self.cache.relations.get(_make_ref_key(relation))
+            consequences = cached.collect_consequences() if cached else {_make_ref_key(relation)}
+        return {".".join(part or "" for part in key) for key in consequences}
+
     @classmethod
     def convert_text_type(cls, agate_table: "agate.Table", col_idx):
         column = agate_table.columns[col_idx]
@@ -126,6 +506,477 @@ class RedshiftAdapter(SQLAdapter):
             msg = f"Cross-db references allowed only in {self.type()} RA3.* node. Got {exc.msg}"
             raise dbt_common.exceptions.CompilationError(msg)
 
+    def get_catalog(
+        self,
+        relation_configs: Iterable[Any],
+        used_schemas: FrozenSet[Tuple[str, str]],
+    ) -> Tuple["agate.Table", List[Exception]]:
+        """
+        Build the catalog in shards of schemas, see _get_catalog_in_shards. A project overriding
+        `get_catalog`, or the `redshift__get_catalog` it dispatches to, keeps its macro.
+        """
+        if self._macro_overridden(GET_CATALOG_MACRO_NAME):
+            return super().get_catalog(relation_configs, used_schemas)
+        relation_configs = list(relation_configs)
+        schema_map = self._get_catalog_schemas(relation_configs)
+        if self.config.credentials.previous_catalog_path:
+            relations: Set[BaseRelation] = {
+                self.Relation.create_from(self.config, node) for node in relation_configs
+            }
+            return self._get_incremental_catalog(used_schemas, relations)
+
+        shards = [
+            (information_schema, {"schemas": shard})
+            for information_schema, schemas in schema_map.items()
+            for shard in self._catalog_shards(sorted(schemas))
+        ]
+        return self._get_catalog_in_shards(shards, CATALOG_BY_SCHEMA_MACRO_NAMES, used_schemas)
+
+    def get_catalog_by_relations(
+        self, used_schemas: FrozenSet[Tuple[str, str]], relations: Set[BaseRelation]
+    ) -> Tuple["agate.Table", List[Exception]]:
+        """
+        Build the catalog in shards of relations, see _get_catalog_in_shards. A project
+        overriding `get_catalog_relations` keeps its macro.
+        """
+        if self._macro_overridden(GET_CATALOG_RELATIONS_MACRO_NAME):
+            return super().get_catalog_by_relations(used_schemas, relations)
+        if self.config.credentials.previous_catalog_path:
+            return self._get_incremental_catalog(used_schemas, relations)
+        return self._get_catalog_of_relations(used_schemas, relations)
+
+    def _get_catalog_of_relations(
+        self,
+        used_schemas: FrozenSet[Tuple[str, str]],
+        relations: Set[BaseRelation],
+        entries: Iterable[Dict[str, Any]] = (),
+    ) -> Tuple["agate.Table", List[Exception]]:
+        relations_by_info_schema = self._get_catalog_relations_by_info_schema(relations)
+        # a shard holding too many relations for one filter is split further
+        shards = [
+            (information_schema, {"relations": chunk})
+            for information_schema, info_relations in relations_by_info_schema.items()
+            for shard in self._catalog_shards(sorted(info_relations, key=str))
+            for chunk in chunk_relations(shard)
+        ]
+        return self._get_catalog_in_shards(
+            shards, CATALOG_BY_RELATION_MACRO_NAMES, used_schemas, entries
+        )
+
+    def _get_incremental_catalog(
+        self, used_schemas: FrozenSet[Tuple[str, str]], relations: Set[BaseRelation]
+    ) -> Tuple["agate.Table", List[Exception]]:
+        """
+        Build the catalog of `relations`, copying the tables of the previous catalog.json whose
+        markers are unchanged since it was written and querying only the others. The current
+        markers are then stored next to the catalog, for the next invocation.
+
+        Late binding views are always queried, their columns follow the relations they select
+        from. So are relations outside of the target database, which have no markers.
+        """
+        catalog_path = self.config.credentials.previous_catalog_path
+        markers_path = f"{catalog_path}.markers.json"
+        database = self.config.credentials.database
+        # tables of a catalog built at another tier are not reused
+        key = f"{self._relation_cache_snapshot_key()}/{self.config.credentials.catalog_tier}"
+
+        in_database = {
+            relation
+            for relation in relations
+            if (relation.database or database).lower() == database.lower()
+        }
+        schemas = sorted({relation.schema.lower() for relation in in_database if relation.schema})
+        markers = {}
+        if schemas:
+            kwargs = {"schemas": schemas}
+            stats_rows: Iterable = ()
+            if (
+                self.config.credentials.catalog_tier == RedshiftCatalogTier.FULL
+                and self.can_select_svv_table_info()
+            ):
+                _, stats_rows = self._fetch_rendered_rows(
+                    GET_CATALOG_STATS_MARKERS_SQL_MACRO_NAME, kwargs
+                )
+            # one row per column, fetched without building an agate table
+            _, rows = self._fetch_rendered_rows(GET_CATALOG_MARKERS_SQL_MACRO_NAME, kwargs)
+            markers = catalog_markers(rows, stats_rows)
+        previous = CatalogMarkers.load(markers_path, key, catalog_path)
+        entries = load_catalog_entries(catalog_path, database) if previous else {}
+
+        reused = []
+        changed = set()
+        for relation in relations:
+            name = f"{relation.schema}.{relation.identifier}".lower()
+            entry = entries.get(name)
+            if (
+                previous is not None
+                and entry is not None
+                and relation in in_database
+                and entry["metadata"]["type"] != "LATE BINDING VIEW"
+                and name in markers
+                and previous.markers.get(name) == markers[name]
+            ):
+                reused.append(entry)
+            else:
+                changed.add(relation)
+        logger.debug(
+            f"Reusing {len(reused)} table(s) of the previous catalog, querying {len(changed)}"
+        )
+
+        catalog, exceptions = self._get_catalog_of_relations(used_schemas, changed, reused)
+        if not exceptions:
+            CatalogMarkers(key=key, markers=markers).save(markers_path)
+        return catalog, exceptions
+
+    def _catalog_shards(self, items: List[Any]) -> List[List[Any]]:
+        """Split the schemas or relations of one database into one shard per thread."""
+        shard_count = min(self.config.threads, len(items))
+        return [items[index::shard_count] for index in range(shard_count)]
+
+    def _get_catalog_in_shards(
+        self,
+        shards: List[Tuple[InformationSchema, Dict[str, Any]]],
+        macro_names: Tuple[str, str],
+        used_schemas: FrozenSet[Tuple[str, str]],
+        entries: Iterable[Dict[str, Any]] = (),
+    ) -> Tuple["agate.Table", List[Exception]]:
+        """
+        Run the base and the extended catalog query of every shard concurrently, each on its own
+        connection, then join the rows of each shard and assemble them into the catalog, along
+        with the `entries` reused from a previous catalog.json.
+
+        The two queries cannot be joined in SQL: the base query reads leader-only catalog tables,
+        the extended query reads svv_table_info which runs on the compute nodes. Below the full
+        catalog tier, the extended query is skipped altogether.
+
+        The late binding views of the target database are not part of the base queries, their
+        columns are fetched once for all the shards, see LateBindingViewColumns.
+        """
+        base_macro_name, extended_macro_name = macro_names
+        select_extended = (
+            self.config.credentials.catalog_tier == RedshiftCatalogTier.FULL
+            and self.can_select_svv_table_info()
+        )
+        database = self.config.credentials.database
+        cached_shards = [
+            (information_schema.database or database).lower() == database.lower()
+            for information_schema, _ in shards
+        ]
+        late_binding_schemas = {
+            schema
+            for (_, kwargs), cached in zip(shards, cached_shards)
+            if cached
+            for schema in self._catalog_shard_schemas(kwargs)
+        }
+
+        with executor(self.config) as tpe:
+            late_binding = None
+            if late_binding_schemas:
+                late_binding = tpe.submit_connected(
+                    self,
+                    f"{database}.information_schema.late_binding",
+                    self._fetch_late_binding_columns,
+                    late_binding_schemas,
+                )
+            futures = []
+            for index, (information_schema, kwargs) in enumerate(shards):
+                name = f"{information_schema.database}.information_schema.{index}"
+                base = tpe.submit_connected(
+                    self,
+                    f"{name}.base",
+                    self._get_base_catalog_rows,
+                    base_macro_name,
+                    information_schema.database,
+                    kwargs,
+                    not cached_shards[index],
+                )
+                extended = None
+                if select_extended:
+                    extended = tpe.submit_connected(
+                        self,
+                        f"{name}.extended",
+                        self._get_catalog_rows,
+                        extended_macro_name,
+                        kwargs,
+                    )
+                futures.append((base, extended))
+
+            catalog = CatalogAssembler(used_schemas)
+            exceptions: List[Exception] = []
+            late_binding_cached = False
+            if late_binding is not None:
+                try:
+                    late_binding.result()
+                    late_binding_cached = True
+                except Exception as exc:
+                    warn_or_error(CatalogGenerationError(exc=str(exc)))
+                    exceptions.append(exc)
+            for (information_schema, kwargs), cached, (base, extended) in zip(
+                shards, cached_shards, futures
+            ):
+                try:
+                    base_rows = base.result()
+                    if cached and late_binding_cached:
+                        base_rows.rows.extend(
+                            self._late_binding_catalog_rows(
+                                information_schema.database or database,
+                                base_rows.column_names,
+                                kwargs,
+                            )
+                        )
+                    catalog.add(base_rows, extended.result() if extended else None)
+                except Exception as exc:
+                    warn_or_error(CatalogGenerationError(exc=str(exc)))
+                    exceptions.append(exc)
+
+        catalog.add_entries(entries)
+        return catalog.to_table(), exceptions
+
+    def _get_base_catalog_rows(
+        self, macro_name: str, database: str, kwargs: Dict[str, Any], late_binding: bool = True
+    ) -> CatalogRows:
+        self.verify_database(database)
+        tier = str(self.config.credentials.catalog_tier)
+        # svv_mv_info cannot be joined with the leader-only base query, see catalog.sql
+        _, materialized_views = self._fetch_rendered_rows(
+            GET_MATERIALIZED_VIEWS_SQL_MACRO_NAME,
+            {"database": database, "schemas": sorted(self._catalog_shard_schemas(kwargs))},
+        )
+        return self._get_catalog_rows(
+            macro_name,
+            {
+                "database": database,
+                "tier": tier,
+                "late_binding": late_binding,
+                "materialized_views": materialized_views,
+                **kwargs,
+            },
+        )
+
+    @staticmethod
+    def _catalog_shard_schemas(kwargs: Dict[str, Any]) -> Set[str]:
+        if "relations" in kwargs:
+            return {relation.schema for relation in kwargs["relations"] if relation.schema}
+        return set(kwargs["schemas"])
+
+    def _late_binding_catalog_rows(
+        self, database: str, column_names: List[str], kwargs: Dict[str, Any]
+    ) -> List[Tuple[Any, ...]]:
+        """The base catalog rows of the cached late binding views of a shard."""
+        with_owners = self.config.credentials.catalog_tier != RedshiftCatalogTier.COLUMNS
+        views = self._late_binding_columns.views(
+            schemas=kwargs.get("schemas"), relations=kwargs.get("relations")
+        )
+        rows = []
+        for view in views:
+            for column in view.columns:
+                values = {
+                    "table_database": database,
+                    "table_schema": view.schema,
+                    "table_name": view.name,
+                    "table_type": "LATE BINDING VIEW",
+                    "column_name": column.column_name,
+                    "column_index": column.column_index,
+                    "column_type": column.column_type,
+                    "table_owner": column.view_owner if with_owners else None,
+                }
+                rows.append(tuple(values.get(name) for name in column_names))
+        return rows
+
+    def _get_catalog_rows(self, macro_name: str, kwargs: Dict[str, Any]) -> CatalogRows:
+        return CatalogRows(*self._fetch_rendered_rows(macro_name, kwargs))
+
+    def _fetch_rendered_rows(
+        self, macro_name: str, kwargs: Dict[str, Any]
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Render the sql of `macro_name` and fetch its raw rows, see fetch_rows."""
+        sql = self.execute_macro(macro_name, kwargs=kwargs)
+        return self.connections.fetch_rows(str(sql))
+
+    @available
+    def can_select_svv_table_info(self) -> bool:
+        """
+        Whether the current user can read the extended catalog stats from svv_table_info. This
+        is only checked once per invocation, and warned about once if not.
+        """
+        if self._svv_table_info_selectable is None:
+            self._svv_table_info_selectable = bool(
+                self.execute_macro(
+                    CAN_SELECT_FROM_MACRO_NAME, kwargs={"table_name": "svv_table_info"}
+                )
+            )
+            if not self._svv_table_info_selectable:
+                self.execute_macro(NO_SVV_TABLE_INFO_WARNING_MACRO_NAME)
+        return self._svv_table_info_selectable
+
+    @available
+    def get_last_modified_options(self) -> Dict[str, Any]:
+        """The metadata source and lookback window of `redshift__get_relation_last_modified`."""
+        credentials = self.config.credentials
+        return {
+            "source": credentials.last_modified_source,
+            "lookback_days": credentials.last_modified_lookback_days,
+        }
+
+    def calculate_freshness_from_metadata_batch(
+        self,
+        sources: List[BaseRelation],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> Tuple[List[Optional[AdapterResponse]], Dict[BaseRelation, FreshnessResponse]]:
+        """
+        Query the last modified times of the sources from the configured metadata source, one
+        query per database and chunk of sources that fits the filter budget. Sources without a
+        write in the lookback window, if any, are reported as infinitely stale.
+
+        The duration of each query is logged, along with the metadata source it read.
+        """
+        credentials = self.config.credentials
+        sources_by_name = {
+            (
+                source.path.get_lowered_part(ComponentName.Schema),
+                source.path.get_lowered_part(ComponentName.Identifier),
+            ): source
+            for source in sources
+        }
+
+        adapter_responses: List[Optional[AdapterResponse]] = []
+        freshness_responses: Dict[BaseRelation, FreshnessResponse] = {}
+        sources_by_info_schema = self._get_catalog_relations_by_info_schema(sources)
+        for information_schema, info_sources in sources_by_info_schema.items():
+            for chunk in chunk_relations(info_sources):
+                start = time.perf_counter()
+                result = self.execute_macro(
+                    GET_RELATION_LAST_MODIFIED_MACRO_NAME,
+                    kwargs={
+                        "information_schema": information_schema,
+                        "relations": chunk,
+                    },
+                    macro_resolver=macro_resolver,
+                    needs_conn=True,
+                )
+                elapsed = time.perf_counter() - start
+                adapter_response = result.response  # type: ignore[attr-defined]
+                table = result.table  # type: ignore[attr-defined]
+                adapter_responses.append(adapter_response)
+                logger.debug(
+                    f"Read the last modified times of {len(chunk)} source(s) from "
+                    f"{credentials.last_modified_source} in {elapsed:.3f}s, "
+                    f"{len(table.rows)} row(s)"
+                )
+                for row in table:
+                    name, freshness_response = self._parse_freshness_row(row, table)
+                    freshness_responses[sources_by_name[name]] = freshness_response
+        return adapter_responses, freshness_responses
+
+    def calculate_freshness(
+        self,
+        source: BaseRelation,
+        loaded_at_field: str,
+        filter: Optional[str],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> Tuple[Optional[AdapterResponse], FreshnessResponse]:
+        """
+        With freshness_batch_window set, the checks dbt runs concurrently on its threads are
+        computed together, see FreshnessBatcher. A check whose batch failed runs on its own, as
+        do all checks when the project overrides `collect_freshness`.
+        """
+        batcher = self._get_freshness_batcher()
+        if batcher is not None and not self._macro_overridden(
+            COLLECT_FRESHNESS_MACRO_NAME, macro_resolver
+        ):
+            request = batcher.submit(
+                FreshnessRequest(source, loaded_at_field, filter),
+                lambda batch: self._run_freshness_batch(batch, macro_resolver),
+            )
+            if request.result is not None:
+                return request.result
+            logger.debug(f"Checking the freshness of {source} on its own: {request.error}")
+        return super().calculate_freshness(source, loaded_at_field, filter, macro_resolver)
+
+    def _macro_overridden(
+        self, macro_name: str, macro_resolver: Optional[MacroResolverProtocol] = None
+    ) -> bool:
+        """
+        Whether `macro_name`, or an implementation it dispatches to, resolves to a macro outside
+        of the adapter packages.
+        """
+        resolver = macro_resolver or self._macro_resolver
+        if resolver is None:
+            return False
+        internal_packages = set(get_adapter_package_names(self.type()))
+        macro_names = [macro_name] + [
+            f"{prefix}__{macro_name}"
+            for prefix in [*get_adapter_type_names(self.type()), "default"]
+        ]
+        for name in macro_names:
+            macro = resolver.find_macro_by_name(name, self.config.project_name, None)
+            if macro is not None and getattr(macro, "package_name", None) not in internal_packages:
+                return True
+        return False
+
+    def _get_freshness_batcher(self) -> Optional[FreshnessBatcher]:
+        window = self.config.credentials.freshness_batch_window
+        if window <= 0 or self.config.threads <= 1:
+            return None
+        with self._freshness_batcher_lock:
+            if self._freshness_batcher is None:
+                max_size = min(self.config.threads, FRESHNESS_BATCH_MAX_SOURCES)
+                self._freshness_batcher = FreshnessBatcher(window, max_size)
+            return self._freshness_batcher
+
+    def _run_freshness_batch(
+        self,
+        batch: List[FreshnessRequest],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> None:
+        results = self.calculate_freshness_batch(
+            [(request.source, request.loaded_at_field, request.filter) for request in batch],
+            macro_resolver,
+        )
+        for request, result in zip(batch, results):
+            request.result = result
+
+    def calculate_freshness_batch(
+        self,
+        checks: List[Tuple[BaseRelation, str, Optional[str]]],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> List[Tuple[Optional[AdapterResponse], FreshnessResponse]]:
+        """
+        Compute the loaded_at_field freshness of many (source, loaded_at_field, filter) checks
+        with one UNION ALL query per FRESHNESS_BATCH_MAX_SOURCES of them, returning the results
+        in the same order.
+
+        The filter of each source stays in the WHERE clause of its own branch, so the zone maps
+        of a sort key it filters on still skip blocks as they would for a single check.
+        """
+        results: List[Tuple[Optional[AdapterResponse], FreshnessResponse]] = []
+        for start in range(0, len(checks), FRESHNESS_BATCH_MAX_SOURCES):
+            chunk = checks[start : start + FRESHNESS_BATCH_MAX_SOURCES]
+            kwargs = {
+                "checks": [
+                    {"source": source, "loaded_at_field": loaded_at_field, "filter": filter}
+                    for source, loaded_at_field, filter in chunk
+                ]
+            }
+            result = self.execute_macro(
+                COLLECT_FRESHNESS_BATCH_MACRO_NAME, kwargs=kwargs, macro_resolver=macro_resolver
+            )
+            adapter_response = result.response  # type: ignore[attr-defined]
+            table = result.table  # type: ignore[attr-defined]
+            by_index = {
+                int(index): (max_loaded_at, snapshotted_at)
+                for index, max_loaded_at, snapshotted_at in table
+            }
+            if sorted(by_index) != list(range(len(chunk))):
+                raise dbt_common.exceptions.MacroResultError(
+                    COLLECT_FRESHNESS_BATCH_MACRO_NAME, table
+                )
+            for index in range(len(chunk)):
+                results.append(
+                    (adapter_response, self._create_freshness_response(*by_index[index]))
+                )
+        return results
+
     def valid_incremental_strategies(self):
         """The set of standard builtin strategies which this adapter supports out-of-the-box.
         Not used to validate custom strategies defined by end users.
@@ -135,41 +986,764 @@ class RedshiftAdapter(SQLAdapter):
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         return f"{add_to} + interval '{number} {interval}'"
 
-    def _link_cached_database_relations(self, schemas: Set[str]):
+    def _get_relation_links(self, schemas: Optional[Iterable[str]] = None) -> List[RelationLink]:
+        """
+        :param schemas: If provided, only return links whose dependent or referenced
+            relation lives in one of these (lowercase) schemas.
+        """
+        kwargs = {"schemas": sorted(schemas)} if schemas is not None else {}
+        return [
+            (dep_schema, dep_identifier, ref_schema, ref_identifier)
+            for dep_schema, dep_identifier, ref_schema, ref_identifier in self.execute_macro(
+                GET_RELATIONS_MACRO_NAME, kwargs=kwargs
+            )
+        ]
+
+    def _link_cached_database_relations(
+        self, schemas: Set[str], links: Optional[List[RelationLink]] = None
+    ):
         """
         :param schemas: The set of schemas that should have links added.
+        :param links: The links to add, queried from the database if not provided.
         """
         database = self.config.credentials.database
+        if links is None:
+            links = self._get_relation_links()
         _Relation = namedtuple("_Relation", "database schema identifier")
-        links = [
+        relation_links = [
             (
                 _Relation(database, dep_schema, dep_identifier),
                 _Relation(database, ref_schema, ref_identifier),
             )
-            for dep_schema, dep_identifier, ref_schema, ref_identifier in self.execute_macro(
-                GET_RELATIONS_MACRO_NAME
-            )
+            for dep_schema, dep_identifier, ref_schema, ref_identifier in links
             # don't record in cache if this relation isn't in a relevant schema
             if ref_schema in schemas
         ]
 
-        for dependent, referenced in links:
+        for dependent, referenced in relation_links:
             self.cache.add_link(
                 referenced=self.Relation.create(**referenced._asdict()),
                 dependent=self.Relation.create(**dependent._asdict()),
             )
 
-    def _link_cached_relations(self, manifest):
+    def _link_cached_relations(self, manifest, links=None):
         schemas = set(
             relation.schema.lower()
             for relation in self._get_cache_schemas(manifest)
             if self.verify_database(relation.database) == ""
         )
-        self._link_cached_database_relations(schemas)
+        self._link_cached_database_relations(schemas, links)
 
     def _relations_cache_for_schemas(self, manifest, cache_schemas=None):
-        super()._relations_cache_for_schemas(manifest, cache_schemas)
-        self._link_cached_relations(manifest)
+        self._relation_lookups.clear()
+        self._late_binding_columns.clear()
+        self._relation_columns.clear()
+        self._materialized_views.clear()
+        self._external_schemas = None
+        # dbt only passes the schemas to cache for narrow runs, with --cache-selected-only
+        selective = bool(cache_schemas)
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(manifest)
+        snapshot_path = self.config.credentials.relation_cache_snapshot_path
+        if snapshot_path:
+            self._relations_cache_from_snapshot(manifest, snapshot_path, cache_schemas)
+        else:
+            self._cache_relations_in_schemas(cache_schemas)
+            self._link_cached_relations(manifest)
+        if selective:
+            self._look_up_parent_relations(manifest, cache_schemas)
+        if self.config.credentials.prefetch_columns:
+            self._prefetch_columns(manifest)
+
+    def _prefetch_columns(self, manifest) -> None:
+        """
+        Describe the existing relations of the incremental models and snapshots, which compare
+        their columns on every run, in bulk rather than one query each.
+        """
+        relations = []
+        for relation_config in manifest:
+            config = getattr(relation_config, "config", None)
+            if getattr(config, "materialized", None) not in ("incremental", "snapshot"):
+                continue
+            relation = self.Relation.create_from(
+                quoting=self.config, relation_config=relation_config
+            )
+            if relation.schema and self._schema_is_cached(relation.database, relation.schema):
+                relation = super().get_relation(
+                    relation.database, relation.schema, relation.identifier
+                )
+                if relation is not None:
+                    relations.append(relation)
+        if relations:
+            self.get_columns_in_relations(relations)
+            logger.debug(f"Prefetched the columns of {len(relations)} relation(s)")
+
+    def _look_up_parent_relations(self, manifest, cache_schemas) -> None:
+        """
+        Resolve the direct parents of the nodes in `cache_schemas` that live in other schemas
+        with one targeted query, rather than listing each of those schemas on first use.
+        """
+        cached = {(cache_schema.database, cache_schema.schema) for cache_schema in cache_schemas}
+        relation_configs = {
+            getattr(relation_config, "unique_id", None): relation_config
+            for relation_config in manifest
+        }
+
+        parents = set()
+        for relation_config in relation_configs.values():
+            relation = self.Relation.create_from(
+                quoting=self.config, relation_config=relation_config
+            )
+            if (relation.database, relation.schema) not in cached:
+                continue
+            depends_on = getattr(relation_config, "depends_on", None)
+            for parent_id in getattr(depends_on, "nodes", []):
+                # sources and ephemeral models are not relation configs, they are looked up
+                # on demand like any other relation
+                parent_config = relation_configs.get(parent_id)
+                if parent_config is None:
+                    continue
+                parent = self.Relation.create_from(
+                    quoting=self.config, relation_config=parent_config
+                )
+                if (parent.database, parent.schema) not in cached:
+                    parents.add(parent)
+
+        if parents:
+            self._look_up_relations(parents)
+
+    def _look_up_relations(self, relations: Iterable[BaseRelation]) -> None:
+        """Query the given relations by name, one query per database, and remember the results."""
+        names_by_database: Dict[str, Set[Tuple[Optional[str], Optional[str]]]] = {}
+        for relation in relations:
+            database = relation.database or self.config.credentials.database
+            names_by_database.setdefault(database, set()).add(
+                (relation.schema, relation.identifier)
+            )
+
+        for database, names in names_by_database.items():
+            self._relation_lookups.update(self.get_relations_by_name(database, names))
+        logger.debug(
+            f"Looked up {sum(len(names) for names in names_by_database.values())} relation(s) "
+            "by name"
+        )
+
+    @available.parse_none
+    def get_relation(self, database: str, schema: str, identifier: str) -> Optional[BaseRelation]:
+        """
+        Relations in cached schemas are read from the cache. Anything else is looked up on its
+        own with a point query on the catalog, instead of listing its whole schema, and matched
+        like the relations of a listed schema would be.
+        """
+        if self._schema_is_cached(database, schema):
+            return super().get_relation(database, schema, identifier)
+
+        lookup_database = database or self.config.credentials.database
+        if (lookup_database, schema, identifier) not in self._relation_lookups:
+            self._look_up_relations(
+                [
+                    self.Relation.create(
+                        database=lookup_database, schema=schema, identifier=identifier
+                    )
+                ]
+            )
+        matches = self._make_match(
+            self._relation_lookups.get(lookup_database, schema, identifier),
+            database,
+            schema,
+            identifier,
+        )
+        if len(matches) > 1:
+            kwargs = {"identifier": identifier, "schema": schema, "database": database}
+            raise RelationReturnedMultipleResultsError(kwargs, matches)
+        return matches[0] if matches else None
+
+    def list_relations(self, database: Optional[str], schema: str) -> List[BaseRelation]:
+        if (database, schema) not in self.cache:
+            count = self._relation_lookups.record_schema_listing()
+            logger.debug(
+                f"Listing every relation in {database}.{schema}, which is not in the relations "
+                f"cache ({count} full schema listing(s) so far)"
+            )
+        return super().list_relations(database, schema)
+
+    def clear_transaction(self) -> None:
+        # dbt calls this right before the on-run-end hooks, once every node has run, so the
+        # deferred drops are done before the hooks, on their own connections
+        self._drop_deferred_relations()
+        super().clear_transaction()
+
+    def cleanup_connections(self) -> None:
+        # tasks that run no hooks only drop what they deferred once they clean up
+        self._drop_deferred_relations()
+        with self._metadata_lock:
+            metadata_executor, self._metadata_executor = self._metadata_executor, None
+        if metadata_executor is not None:
+            metadata_executor.shutdown(wait=True)
+        lookups = self._relation_lookups
+        if lookups.queries or lookups.schema_listings:
+            logger.debug(
+                f"Relation cache misses: {lookups.queries} targeted lookup(s), "
+                f"{lookups.schema_listings} full schema listing(s)"
+            )
+        drop_lock = self.connections.drop_lock
+        if drop_lock.waits:
+            logger.debug(
+                f"Waited {drop_lock.wait_time:.3f}s in total for the drop lock "
+                f"over {drop_lock.waits} drop(s)"
+            )
+        super().cleanup_connections()
+
+    @available
+    def cache_added(self, relation: Optional[BaseRelation]) -> str:
+        self._relation_lookups.discard(relation)
+        self._late_binding_columns.discard(relation)
+        self._relation_columns.discard(relation)
+        self._materialized_views.discard(relation)
+        return super().cache_added(relation)
+
+    @available
+    def cache_dropped(self, relation: Optional[BaseRelation]) -> str:
+        self._relation_lookups.discard(relation)
+        self._late_binding_columns.discard(relation)
+        self._relation_columns.discard(relation)
+        self._materialized_views.discard(relation)
+        return super().cache_dropped(relation)
+
+    @available
+    def cache_renamed(
+        self, from_relation: Optional[BaseRelation], to_relation: Optional[BaseRelation]
+    ) -> str:
+        self._relation_lookups.discard(from_relation)
+        self._relation_lookups.discard(to_relation)
+        self._late_binding_columns.discard(from_relation)
+        self._late_binding_columns.discard(to_relation)
+        self._relation_columns.discard(from_relation)
+        self._relation_columns.discard(to_relation)
+        self._materialized_views.discard(from_relation)
+        self._materialized_views.discard(to_relation)
+        return super().cache_renamed(from_relation, to_relation)
+
+    @available.parse_list
+    def get_columns_in_relation(self, relation: BaseRelation) -> List[Column]:
+        """
+        Relations described in bulk are served from `get_columns_in_relations` until they change.
+
+        Late binding views of the target database are described from the columns cached for
+        their schema, see LateBindingViewColumns. Any other relation is described with
+        `redshift__get_columns_in_relation`, which then leaves pg_get_late_binding_view_cols()
+        out of its query.
+        """
+        prefetched = self._relation_columns.get(relation)
+        if prefetched is not None:
+            return prefetched
+        if (
+            self._in_target_database(relation)
+            and relation.schema
+            and relation.identifier
+            and self._known_relation_type(relation) in (None, RelationType.View)
+        ):
+            if not self._late_binding_columns.is_known(relation.schema, relation.identifier):
+                # every schema of the run is fetched along, it costs the same
+                self._fetch_late_binding_columns({relation.schema} | self._run_schemas())
+            view = self._late_binding_columns.get(relation.schema, relation.identifier)
+            if view is not None:
+                return [late_binding_column(self.Column, column) for column in view.columns]
+        return super().get_columns_in_relation(relation)
+
+    @available
+    def get_columns_in_relations(
+        self, relations: Iterable[BaseRelation]
+    ) -> Dict[BaseRelation, List[Column]]:
+        """
+        Describe the `relations` of the target database with one query per chunk of relations
+        that fits the filter budget, and keep their columns for `get_columns_in_relation`.
+
+        Late binding views come from their cached schemas. Relations that were not found, or
+        live in another database, are described one at a time.
+        """
+        relations = list(relations)
+        bulk = {
+            (relation.schema.lower(), relation.identifier.lower()): relation
+            for relation in relations
+            if self._in_target_database(relation) and relation.schema and relation.identifier
+        }
+        columns: Dict[BaseRelation, List[Column]] = {}
+        if bulk:
+            self._fetch_late_binding_columns({schema for schema, _ in bulk})
+        to_query: Dict[BaseRelation, Tuple[str, str]] = {}
+        for (schema, identifier), relation in bulk.items():
+            view = self._late_binding_columns.get(schema, identifier)
+            if view is not None:
+                columns[relation] = [late_binding_column(self.Column, c) for c in view.columns]
+            else:
+                to_query[relation] = (schema, identifier)
+
+        described: Dict[BaseRelation, List[Column]] = {}
+        for chunk in chunk_relations(sorted(to_query, key=str)):
+            by_name: Dict[Tuple[str, str], List[Column]] = {}
+            rows = self.execute_macro(
+                GET_COLUMNS_IN_RELATIONS_MACRO_NAME, kwargs={"relations": chunk}
+            )
+            for schema, name, *column in rows:
+                by_name.setdefault((schema.lower(), name.lower()), []).append(self.Column(*column))
+            for relation in chunk:
+                found = by_name.get(to_query[relation])
+                if found:
+                    described[relation] = found
+        self._relation_columns.update(described)
+        columns.update(described)
+
+        for relation in relations:
+            if relation not in columns:
+                columns[relation] = self.get_columns_in_relation(relation)
+        return columns
+
+    @available
+    def alter_column_type_in_place(
+        self, relation: BaseRelation, column_name: str, new_column_type: str
+    ) -> bool:
+        """
+        Widen the varchar column `column_name` of `relation` to `new_column_type` with a single
+        `alter table ... alter column ... type`, and return whether it did.
+
+        Redshift only changes the type of a column in place from a varchar to a longer varchar,
+        outside of a transaction block, and not for every compression encoding. A transaction
+        that was open before, such as the one of an incremental model, is never committed early:
+        the column is then copied. Only the transaction that describing the column began is
+        committed. Other changes are left to `default__alter_column_type`, which copies the
+        column into a new one.
+        """
+        reason = None
+        transaction_was_open = self.has_open_transaction()
+        current = next(
+            (
+                column
+                for column in self.get_columns_in_relation(relation)
+                if column.name.lower() == column_name.lower()
+            ),
+            None,
+        )
+        try:
+            new = self.Column.from_description(
+                column_name, _with_varchar_max_size(new_column_type)
+            )
+        except dbt_common.exceptions.DbtRuntimeError:
+            new = None
+        if current is None or new is None:
+            reason = "its current or new type is unknown"
+        elif not (_is_varchar(current) and _is_varchar(new)):
+            reason = f"only varchar columns can change type, not {current.data_type}"
+        elif new.string_size() <= current.string_size():
+            reason = f"{new_column_type} is not wider than {current.data_type}"
+        elif not self.config.credentials.autocommit:
+            reason = "autocommit is off"
+        elif transaction_was_open:
+            reason = "a transaction is open"
+        elif self.has_open_transaction():
+            self.connections.commit()
+
+        if reason is None:
+            sql = (
+                f"alter table {relation} alter column {self.quote(column_name)} "
+                f"type {new_column_type}"
+            )
+            try:
+                self.execute(sql, auto_begin=False)
+            except dbt_common.exceptions.DbtDatabaseError as exc:
+                reason = str(exc)
+
+        if reason is not None:
+            logger.debug(
+                f"Changing the type of {relation}.{column_name} to {new_column_type} by copying "
+                f"the column, as it cannot change in place: {reason}"
+            )
+            return False
+        logger.debug(f"Widened {relation}.{column_name} to {new_column_type} in place")
+        return True
+
+    @available
+    def forget_columns_in_relation(self, relation: BaseRelation) -> str:
+        """Stop serving the prefetched columns of `relation`, whose columns are changing."""
+        self._relation_columns.discard(relation)
+        return ""
+
+    @available
+    def get_column_sources(self, relation: BaseRelation) -> List[str]:
+        """
+        The metadata `redshift__get_columns_in_relation` has to read to describe `relation`:
+        "bound" for information_schema.columns, "late_binding" for
+        pg_get_late_binding_view_cols() and "external" for svv_external_columns.
+
+        Relations in external schemas are external tables. Otherwise, the type of the relation
+        tells whether it may be a late binding view, and any known type rules out external
+        tables. Unknown relations of unknown schemas read all three.
+        """
+        in_target_database = self._in_target_database(relation) and bool(relation.schema)
+        if in_target_database and str(relation.schema).lower() in self._get_external_schemas():
+            return ["external"]
+        relation_type = self._known_relation_type(relation)
+        if relation_type == RelationType.External:
+            return ["external"]
+
+        sources = ["bound"]
+        if relation_type in (None, RelationType.View) and not self.late_binding_columns_cached(
+            relation
+        ):
+            sources.append("late_binding")
+        if relation_type is None and not in_target_database:
+            sources.append("external")
+        return sources
+
+    def _known_relation_type(self, relation: BaseRelation) -> Optional[str]:
+        """The type of `relation` in the relations cache, or the type it was created with."""
+        database, schema = relation.database, relation.schema
+        if schema and self._schema_is_cached(database, schema):
+            cached = super().get_relation(database, schema, relation.identifier)
+            if cached is not None:
+                return cached.type
+        else:
+            looked_up = self._relation_lookups.get(database, schema, relation.identifier)
+            if len(looked_up) == 1:
+                return looked_up[0].type
+        return relation.type
+
+    def _get_external_schemas(self) -> Set[str]:
+        """The lowercase external schemas of the target database, listed once per run."""
+        if self._external_schemas is None:
+            self._external_schemas = {
+                str(schema).lower()
+                for schema, in self.execute_macro(GET_EXTERNAL_SCHEMAS_MACRO_NAME)
+            }
+        return self._external_schemas
+
+    @available
+    def late_binding_columns_cached(self, relation: BaseRelation) -> bool:
+        """Whether the cache can tell if `relation` is a late binding view, without a query."""
+        schema, identifier = relation.schema, relation.identifier
+        return bool(
+            self._in_target_database(relation)
+            and schema
+            and identifier
+            and self._late_binding_columns.is_known(schema, identifier)
+        )
+
+    def _run_schemas(self) -> Set[str]:
+        """The schemas of the target database in the relations cache."""
+        database = self.config.credentials.database.lower()
+        return {
+            schema
+            for cached_database, schema in self.cache.schemas
+            if schema and (cached_database or "").lower() == database
+        }
+
+    def _in_target_database(self, relation: BaseRelation) -> bool:
+        database = self.config.credentials.database
+        return (relation.database or database).lower() == database.lower()
+
+    def _fetch_late_binding_columns(self, schemas: Iterable[str]) -> None:
+        """
+        Cache the late binding view columns of the `schemas` of the target database that were
+        never fetched with one query, and those of their stale views with one query per chunk.
+        """
+        with self._late_binding_columns_lock:
+            cache = self._late_binding_columns
+            missing = cache.missing_schemas(schemas)
+            if missing:
+                kwargs: Dict[str, Any] = {"schemas": sorted(missing)}
+                rows = self.execute_macro(GET_LATE_BINDING_VIEW_COLUMNS_MACRO_NAME, kwargs=kwargs)
+                cache.update(rows, schemas=missing)
+            stale = [
+                self.Relation.create(
+                    database=self.config.credentials.database, schema=schema, identifier=name
+                )
+                for schema, name in sorted(cache.stale_views(schemas))
+            ]
+            for chunk in chunk_relations(stale):
+                kwargs = {"relations": chunk}
+                rows = self.execute_macro(GET_LATE_BINDING_VIEW_COLUMNS_MACRO_NAME, kwargs=kwargs)
+                cache.update(rows, relations=chunk)
+
+    @available
+    def describe_materialized_view(self, relation: BaseRelation) -> Optional[RelationResults]:
+        """
+        The description of the materialized view `relation`, in the layout of
+        `redshift__describe_materialized_view`, or None if it has to be described on its own.
+
+        The first lookup in a schema of the target database describes every materialized view of
+        that schema and of the other schemas of the run, with one query per metadata source, see
+        MaterializedViewDescriptions.
+        """
+        if not (self._in_target_database(relation) and relation.schema and relation.identifier):
+            return None
+        with self._materialized_views_lock:
+            missing = self._materialized_views.missing_schemas(
+                {relation.schema} | self._run_schemas()
+            )
+            if relation.schema.lower() in missing:
+                results = self.execute_macro(
+                    DESCRIBE_MATERIALIZED_VIEWS_MACRO_NAME, kwargs={"schemas": sorted(missing)}
+                )
+                descriptions = materialized_view_descriptions(results)
+                self._materialized_views.update(missing, descriptions)
+                logger.debug(
+                    f"Described {len(descriptions)} materialized view(s) in "
+                    f"{len(missing)} schema(s)"
+                )
+        return self._materialized_views.pop(relation.schema, relation.identifier)
+
+    @available
+    def get_materialized_view_refresh_state(
+        self, relation: BaseRelation
+    ) -> Optional[MaterializedViewRefreshState]:
+        """
+        Whether the materialized view `relation` is stale and how it would refresh, read from
+        svv_mv_info right before the refresh, as its base tables may have been written since it
+        was described. None if svv_mv_info does not list it.
+        """
+        table = self.execute_macro(
+            GET_MATERIALIZED_VIEW_REFRESH_STATE_MACRO_NAME, kwargs={"relation": relation}
+        )
+        for row in table:
+            return materialized_view_refresh_state(row)
+        return None
+
+    @available
+    def refresh_materialized_views(
+        self, schemas: Optional[List[str]] = None, max_concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Refresh the materialized views of `schemas` of the target database, the target schema by
+        default, each one after the materialized views it reads from and the others in parallel.
+
+        The dependencies are the links of `redshift__get_relations`. Refreshes run on up to
+        `max_concurrency` connections, the number of threads by default, and no more than the
+        slots of the largest manual WLM queue.
+
+        Returns the refreshed, failed and skipped materialized views, with the wall time the
+        refreshes took and the time they would have taken one after another.
+        """
+        database = self.config.credentials.database
+        schemas = sorted(
+            {schema.lower() for schema in schemas or [self.config.credentials.schema]}
+        )
+        materialized_views = {
+            (str(relation.schema).lower(), str(relation.identifier).lower()): relation
+            for relation in self.list_relations_in_schemas(database, set(schemas))
+            if relation.type == RelationType.MaterializedView
+        }
+        dependencies: Dict[Hashable, Set[Hashable]] = {
+            relation: set() for relation in materialized_views.values()
+        }
+        for dep_schema, dep_name, ref_schema, ref_name in self._get_relation_links(schemas):
+            # materialized views may also be linked through the tables that store them
+            dependent = materialized_views.get(
+                (dep_schema.lower(), materialized_view_name(dep_name).lower())
+            )
+            referenced = materialized_views.get(
+                (ref_schema.lower(), materialized_view_name(ref_name).lower())
+            )
+            if dependent is not None and referenced is not None and dependent != referenced:
+                dependencies[dependent].add(referenced)
+
+        max_workers = max_concurrency or self.config.threads
+        wlm_concurrency = self._get_wlm_concurrency()
+        if wlm_concurrency:
+            max_workers = min(max_workers, wlm_concurrency)
+
+        def refresh(relation: Any) -> None:
+            self._run_metadata_step(
+                f"refresh_{relation.identifier}",
+                lambda: self.execute(f"refresh materialized view {relation}"),
+            )
+
+        report = refresh_in_dependency_order(dependencies, refresh, max_workers)
+        logger.debug(
+            f"Refreshed {len(report.durations)} materialized view(s) in {report.wall_time:.1f}s "
+            f"on up to {max_workers} connection(s), {report.time_saved:.1f}s less than serially"
+        )
+        return {**report.to_dict(), "max_concurrency": max_workers}
+
+    def _get_wlm_concurrency(self) -> Optional[int]:
+        """The slots of the largest manual WLM queue, None with automatic WLM or on Serverless."""
+        try:
+            rows = self.execute_macro(GET_WLM_CONCURRENCY_MACRO_NAME)
+        except dbt_common.exceptions.DbtRuntimeError as exc:
+            logger.debug(f"Could not read the WLM configuration: {exc}")
+            return None
+        for (slots,) in rows:
+            return int(slots) if slots else None
+        return None
+
+    def list_relations_in_schemas(self, database: str, schemas: Set[str]) -> List[BaseRelation]:
+        """List the relations in several schemas of a single database with one query."""
+        kwargs = {"database": database, "schemas": sorted(schemas)}
+        return self._relations_from_rows(
+            self.execute_macro(LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME, kwargs=kwargs)
+        )
+
+    def get_relations_by_name(
+        self, database: str, names: Iterable[Tuple[Optional[str], Optional[str]]]
+    ) -> List[BaseRelation]:
+        """
+        Look up (schema, identifier) pairs of a single database, with one query per chunk of
+        relations that fits the filter budget.
+        """
+        relations = [
+            self.Relation.create(database=database, schema=schema, identifier=identifier)
+            for schema, identifier in sorted(names)
+        ]
+        found: List[BaseRelation] = []
+        for chunk in chunk_relations(relations):
+            kwargs = {"database": database, "relations": chunk}
+            found.extend(
+                self._relations_from_rows(
+                    self.execute_macro(GET_RELATIONS_BY_NAME_MACRO_NAME, kwargs=kwargs)
+                )
+            )
+        return found
+
+    def _relations_from_rows(self, results) -> List[BaseRelation]:
+        relations: List[BaseRelation] = []
+        quote_policy = {"database": True, "schema": True, "identifier": True}
+        for _database, name, _schema, _type in results:
+            try:
+                _type = self.Relation.get_relation_type(_type)
+            except ValueError:
+                _type = self.Relation.External
+            relations.append(
+                self.Relation.create(
+                    database=_database,
+                    schema=_schema,
+                    identifier=name,
+                    quote_policy=quote_policy,
+                    type=_type,
+                )
+            )
+        return relations
+
+    def _cache_relations_in_schemas(self, cache_schemas: Iterable[BaseRelation]) -> None:
+        """
+        Populate the cache with one listing query per database instead of one per schema.
+        Databases other than the target database (RA3 only) are listed concurrently.
+        """
+        schemas_by_database: Dict[str, Set[str]] = {}
+        for cache_schema in cache_schemas:
+            if cache_schema.schema:
+                database = cache_schema.database or self.config.credentials.database
+                schemas_by_database.setdefault(database, set()).add(cache_schema.schema)
+
+        with executor(self.config) as tpe:
+            futures = [
+                tpe.submit_connected(
+                    self,
+                    f"list_{database}",
+                    self.list_relations_in_schemas,
+                    database,
+                    schemas,
+                )
+                for database, schemas in schemas_by_database.items()
+            ]
+            for future in as_completed(futures):
+                # if we can't read the relations we need to just raise anyway,
+                # so just call future.result() and let that raise on failure
+                for relation in future.result():
+                    self.cache.add(relation)
+
+        # it's possible that there were no relations in some schemas, they still count as cached
+        self.cache.update_schemas(
+            (database, schema)
+            for database, schemas in schemas_by_database.items()
+            for schema in schemas
+        )
+
+    def _relation_cache_snapshot_key(self) -> str:
+        credentials = self.config.credentials
+        return f"{credentials.host}/{credentials.database}/{credentials.user}".lower()
+
+    def _relations_cache_from_snapshot(self, manifest, snapshot_path: str, cache_schemas):
+        """
+        Fill the cache from an on-disk snapshot for every schema whose catalog marker is unchanged
+        since the snapshot was taken, and list the remaining schemas as usual. The snapshot is then
+        rewritten with the current state of the cache.
+
+        Markers are queried before anything is listed, so a change that lands in between only
+        makes the next invocation list that schema again.
+        """
+        database = self.config.credentials.database
+        key = self._relation_cache_snapshot_key()
+        markers = relation_cache_markers(self.execute_macro(GET_RELATION_CACHE_MARKERS_MACRO_NAME))
+        snapshot = RelationCacheSnapshot.load(snapshot_path, key)
+        unchanged = snapshot.unchanged_schemas(markers) if snapshot else set()
+        stored = snapshot.relations if snapshot else {}
+
+        restored_schemas = set()
+        listed_schemas = set()
+        for cache_schema in cache_schemas:
+            schema = cache_schema.schema.lower() if cache_schema.schema else None
+            if (
+                schema in unchanged
+                and schema in stored
+                and (cache_schema.database or database).lower() == database.lower()
+            ):
+                restored_schemas.add(cache_schema)
+            else:
+                listed_schemas.add(cache_schema)
+
+        quote_policy = {"database": True, "schema": True, "identifier": True}
+        for cache_schema in restored_schemas:
+            for relation in stored[cache_schema.schema.lower()]:
+                self.cache.add(
+                    self.Relation.create(
+                        database=database,
+                        schema=relation["schema"],
+                        identifier=relation["identifier"],
+                        quote_policy=quote_policy,
+                        type=self.Relation.get_relation_type(relation["type"]),
+                    )
+                )
+        self.cache.update_schemas(
+            (cache_schema.database, cache_schema.schema) for cache_schema in restored_schemas
+        )
+        logger.debug(
+            f"Restored {len(restored_schemas)} schema(s) from the relation cache snapshot, "
+            f"listing {len(listed_schemas)} schema(s)"
+        )
+
+        if listed_schemas:
+            self._cache_relations_in_schemas(listed_schemas)
+
+        # links between two unchanged schemas are still valid, anything touching a changed
+        # schema has to be fetched again
+        if snapshot is not None:
+            changed = snapshot.changed_schemas(markers)
+            links = snapshot.get_links(unchanged)
+            if changed:
+                links += self._get_relation_links(changed)
+        else:
+            links = self._get_relation_links()
+        self._link_cached_relations(manifest, links)
+
+        relations = {schema: stored[schema] for schema in stored if schema in unchanged}
+        for cache_schema in cache_schemas:
+            if (cache_schema.database or database).lower() != database.lower():
+                continue
+            relations[cache_schema.schema.lower()] = [
+                {
+                    "schema": relation.schema,
+                    "identifier": relation.identifier,
+                    "type": str(relation.type),
+                }
+                for relation in self.cache.get_relations(
+                    cache_schema.database, cache_schema.schema
+                )
+            ]
+        RelationCacheSnapshot(
+            key=key,
+            markers=markers,
+            relations=relations,
+            links=[list(link) for link in links],
+        ).save(snapshot_path)
 
     # avoid non-implemented abstract methods warning
     # make it clear what needs to be implemented while still raising the error in super()
@@ -0,0 +1,162 @@
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from dbt.adapters.base import BaseRelation, Column
+
+
+class LateBindingColumn(NamedTuple):
+    """A column of a late binding view, as returned by pg_get_late_binding_view_cols()."""
+
+    column_name: str
+    column_type: str
+    column_index: int
+    view_owner: Optional[str]
+
+
+class LateBindingView(NamedTuple):
+    schema: str
+    name: str
+    columns: List[LateBindingColumn]
+
+
+def _view_key(schema: str, name: str) -> Tuple[str, str]:
+    return schema.lower(), name.lower()
+
+
+def _view_keys(relations: Iterable[BaseRelation]) -> Set[Tuple[str, str]]:
+    return {
+        _view_key(relation.schema, relation.identifier)
+        for relation in relations
+        if relation.schema and relation.identifier
+    }
+
+
+class LateBindingViewColumns:
+    """
+    The columns of the late binding views of the target database, fetched a whole schema at a
+    time and kept for the rest of the invocation.
+
+    pg_get_late_binding_view_cols() resolves every late binding view of the database before any
+    filter applies, so a lookup costs the same whether it asks for one view or for many schemas.
+    Once a schema is fetched, any relation of that schema that is not listed here is known not to
+    be a late binding view. Views that dbt creates, drops or renames are marked stale, and fetched
+    again on their own the next time they are looked up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._schemas: Set[str] = set()
+        self._views: Dict[Tuple[str, str], LateBindingView] = {}
+        self._stale: Set[Tuple[str, str]] = set()
+        self.fetches = 0
+
+    def missing_schemas(self, schemas: Iterable[str]) -> Set[str]:
+        """The `schemas` that were never fetched, lowercased."""
+        with self._lock:
+            return {schema.lower() for schema in schemas} - self._schemas
+
+    def stale_views(self, schemas: Iterable[str]) -> Set[Tuple[str, str]]:
+        """The stale views of the fetched `schemas`, as lowercase (schema, name) pairs."""
+        lowered = {schema.lower() for schema in schemas}
+        with self._lock:
+            return {key for key in self._stale if key[0] in lowered}
+
+    def is_known(self, schema: str, name: str) -> bool:
+        """Whether `get` can tell if schema.name is a late binding view without a query."""
+        with self._lock:
+            return schema.lower() in self._schemas and _view_key(schema, name) not in self._stale
+
+    def get(self, schema: str, name: str) -> Optional[LateBindingView]:
+        with self._lock:
+            return self._views.get(_view_key(schema, name))
+
+    def views(
+        self,
+        schemas: Optional[Iterable[str]] = None,
+        relations: Optional[Iterable[BaseRelation]] = None,
+    ) -> List[LateBindingView]:
+        """The cached views in `schemas`, or among `relations`."""
+        with self._lock:
+            if relations is not None:
+                keys = _view_keys(relations)
+                return [self._views[key] for key in sorted(keys) if key in self._views]
+            lowered = {schema.lower() for schema in schemas or ()}
+            return [view for key, view in sorted(self._views.items()) if key[0] in lowered]
+
+    def update(
+        self,
+        rows: Iterable,
+        schemas: Iterable[str] = (),
+        relations: Iterable[BaseRelation] = (),
+    ) -> None:
+        """
+        Replace what is known of the fetched `schemas` and `relations` with the rows of
+        `redshift__get_late_binding_view_columns`.
+        """
+        fetched_schemas = {schema.lower() for schema in schemas}
+        fetched_views = _view_keys(relations)
+        columns: Dict[Tuple[str, str], LateBindingView] = {}
+        for schema, name, column_name, column_type, column_index, owner in rows:
+            key = _view_key(schema, name)
+            view = columns.setdefault(key, LateBindingView(schema, name, []))
+            view.columns.append(
+                LateBindingColumn(column_name, column_type, int(column_index), owner)
+            )
+
+        with self._lock:
+            self.fetches += 1
+            self._schemas |= fetched_schemas
+            for key in list(self._views):
+                if key[0] in fetched_schemas or key in fetched_views:
+                    del self._views[key]
+            self._stale = {
+                key
+                for key in self._stale
+                if key[0] not in fetched_schemas and key not in fetched_views
+            }
+            for key, view in columns.items():
+                view.columns.sort(key=lambda column: column.column_index)
+                self._views[key] = view
+
+    def discard(self, relation: Optional[BaseRelation]) -> None:
+        if relation is None or not relation.schema or not relation.identifier:
+            return
+        key = _view_key(relation.schema, relation.identifier)
+        with self._lock:
+            self._views.pop(key, None)
+            if key[0] in self._schemas:
+                self._stale.add(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._views.clear()
+            self._stale.clear()
+
+
+def late_binding_column(column_cls, column: LateBindingColumn) -> Column:
+    """
+    Describe a column of a late binding view like `redshift__get_columns_in_relation` would, from
+    the type string pg_get_late_binding_view_cols() returns for it.
+    """
+    column_type = column.column_type
+    lowered = column_type.lower()
+    if lowered.startswith("character varying"):
+        data_type = "character varying"
+    elif lowered.startswith("numeric"):
+        data_type = "numeric"
+    else:
+        data_type = column_type
+
+    char_size = numeric_precision = numeric_scale = None
+    if column_type.startswith("character"):
+        digits = re.search(r"[0-9]+", column_type)
+        char_size = int(digits.group()) if digits else None
+    elif column_type.startswith("numeric"):
+        digits = re.search(r"[0-9,]+", column_type)
+        parts = digits.group().split(",") if digits else []
+        numeric_precision = int(parts[0]) if len(parts) > 0 and parts[0] else None
+        numeric_scale = int(parts[1]) if len(parts) > 1 and parts[1] else None
+
+    return column_cls(column.column_name, data_type, char_size, numeric_precision, numeric_scale)
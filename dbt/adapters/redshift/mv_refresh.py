@@ -0,0 +1,104 @@
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Set
+
+
+@dataclass
+class MaterializedViewRefreshReport:
+    """
+    The outcome of `refresh_in_dependency_order`, with the seconds each refresh took, whether it
+    succeeded or failed.
+    """
+
+    durations: Dict[Hashable, float] = field(default_factory=dict)
+    failures: Dict[Hashable, str] = field(default_factory=dict)
+    # not refreshed, as an upstream materialized view failed or they depend on each other
+    skipped: List[Hashable] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def serial_time(self) -> float:
+        """How long the same refreshes would have taken one after another."""
+        return sum(self.durations.values())
+
+    @property
+    def time_saved(self) -> float:
+        return max(self.serial_time - self.wall_time, 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "refreshed": [str(key) for key in self.durations if key not in self.failures],
+            "failed": {str(key): error for key, error in self.failures.items()},
+            "skipped": [str(key) for key in self.skipped],
+            "wall_time": self.wall_time,
+            "serial_time": self.serial_time,
+            "time_saved": self.time_saved,
+        }
+
+
+def refresh_in_dependency_order(
+    dependencies: Dict[Hashable, Set[Hashable]],
+    refresh: Callable[[Hashable], Any],
+    max_workers: int,
+) -> MaterializedViewRefreshReport:
+    """
+    Refresh every materialized view of `dependencies`, which maps each of them to the ones it
+    reads from, on up to `max_workers` threads.
+
+    A materialized view is refreshed as soon as all of its upstream materialized views were, not
+    once a whole level of the graph is done, so a slow refresh only holds back its own dependents.
+    The dependents of a failed refresh are skipped, as are materialized views in a cycle.
+    """
+    report = MaterializedViewRefreshReport()
+    waiting = {key: set(upstream) & set(dependencies) for key, upstream in dependencies.items()}
+    dependents: Dict[Hashable, Set[Hashable]] = {key: set() for key in dependencies}
+    for key, upstream in waiting.items():
+        for upstream_key in upstream:
+            dependents[upstream_key].add(key)
+
+    def timed_refresh(key: Hashable) -> float:
+        start = time.monotonic()
+        try:
+            refresh(key)
+        finally:
+            report.durations[key] = time.monotonic() - start
+        return report.durations[key]
+
+    def skip_dependents(key: Hashable) -> None:
+        for dependent in sorted(dependents[key], key=str):
+            if dependent in waiting:
+                del waiting[dependent]
+                report.skipped.append(dependent)
+                skip_dependents(dependent)
+
+    start = time.monotonic()
+    running: Dict[Future, Hashable] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(max_workers, 1), thread_name_prefix="mv_refresh"
+    ) as executor:
+        while True:
+            ready = sorted((key for key, upstream in waiting.items() if not upstream), key=str)
+            for key in ready:
+                del waiting[key]
+                # the invocation context has to follow the work onto the pool's threads
+                future = executor.submit(contextvars.copy_context().run, timed_refresh, key)
+                running[future] = key
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    report.failures[key] = str(error)
+                    skip_dependents(key)
+                    continue
+                for dependent in dependents[key]:
+                    if dependent in waiting:
+                        waiting[dependent].discard(key)
+
+    report.skipped.extend(sorted(waiting, key=str))
+    report.wall_time = time.monotonic() - start
+    return report
@@ -17,6 +17,11 @@ from dbt.adapters.redshift.relation_configs import (
     RedshiftAutoRefreshConfigChange,
     RedshiftDistConfigChange,
     RedshiftSortConfigChange,
+    RedshiftSortStyle,
+    RedshiftTableConfig,
+    RedshiftTableConfigChangeset,
+    RedshiftTableDistConfigChange,
+    RedshiftTableSortConfigChange,
     RedshiftIncludePolicy,
     RedshiftQuotePolicy,
     MAX_CHARACTERS_IN_IDENTIFIER,
@@ -108,3 +113,45 @@ class RedshiftRelation(BaseRelation):
         if config_change_collection.has_changes:
             return config_change_collection
         return None
+
+    @classmethod
+    def table_config_changeset(
+        cls, relation_results: RelationResults, relation_config: RelationConfig
+    ) -> Optional[RedshiftTableConfigChangeset]:
+        """
+        The dist and sort changes from the existing table to the model's config, for incremental
+        models, or None if the model's dist and sort are already those of the table.
+
+        Redshift alters the dist and sort of a table in place, except that a table with an
+        interleaved sort key cannot change its dist, and a sort key cannot become or stop being
+        interleaved. Those changes require a full refresh.
+        """
+        config_change_collection = RedshiftTableConfigChangeset()
+
+        existing_table = RedshiftTableConfig.from_relation_results(relation_results)
+        new_table = RedshiftTableConfig.from_relation_config(relation_config)
+        existing_interleaved = (
+            existing_table.sort is not None
+            and existing_table.sort.sortstyle == RedshiftSortStyle.interleaved
+        )
+
+        if new_table.dist is not None and new_table.dist_key != existing_table.dist_key:
+            config_change_collection.dist = RedshiftTableDistConfigChange(
+                action=RelationConfigChangeAction.alter,
+                context=new_table.dist,
+                in_place=not existing_interleaved,
+            )
+
+        if new_table.sort is not None and new_table.sort_key != existing_table.sort_key:
+            config_change_collection.sort = RedshiftTableSortConfigChange(
+                action=RelationConfigChangeAction.alter,
+                context=new_table.sort,
+                in_place=(
+                    not existing_interleaved
+                    and new_table.sort.sortstyle != RedshiftSortStyle.interleaved
+                ),
+            )
+
+        if config_change_collection.has_changes:
+            return config_change_collection
+        return None
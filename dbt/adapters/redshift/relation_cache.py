@@ -0,0 +1,348 @@
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, TYPE_CHECKING
+
+from dbt.adapters.base import BaseRelation, Column
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.relation_configs import RelationResults
+from dbt_common.dataclass_schema import dbtClassMixin, ValidationError
+
+if TYPE_CHECKING:
+    import agate
+
+logger = AdapterLogger("Redshift")
+
+# bump this whenever the layout of the snapshot file changes, older files are then ignored
+SNAPSHOT_VERSION = 1
+
+# (dependent_schema, dependent_name, referenced_schema, referenced_name)
+RelationLink = Tuple[str, str, str, str]
+
+# the table behind a materialized view is named after it, e.g. mv_tbl__my_view__0
+MATERIALIZED_VIEW_TABLE_PATTERN = re.compile(r"^mv_tbl__(.+)__[0-9]+$")
+# the svv_mv_info states of a materialized view that refreshes incrementally, or fully
+MATERIALIZED_VIEW_INCREMENTAL_STATE = 1
+MATERIALIZED_VIEW_RECOMPUTE_STATE = 0
+
+
+@dataclass
+class RelationCacheSnapshot(dbtClassMixin):
+    """
+    An on-disk copy of the relations cache and its links, taken while the cache is warmed.
+
+    Each schema is stored alongside a cheap change marker from the catalog, a pair of
+    `[relation_count, max_oid]`. Creating or dropping a relation changes at least one of them,
+    so a schema whose marker still matches the database can be loaded from disk instead of
+    being listed again.
+
+    Note: an in-place rename keeps both the relation count and the oids, so renames issued
+    outside of dbt are not detected until something else changes in that schema.
+    """
+
+    key: str
+    version: int = SNAPSHOT_VERSION
+    markers: Dict[str, List[int]] = field(default_factory=dict)
+    relations: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+    links: List[List[str]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str, key: str) -> Optional["RelationCacheSnapshot"]:
+        """Read a snapshot from `path`, returning None if it is missing, unreadable or stale."""
+        try:
+            with open(path) as fp:
+                raw_snapshot = json.load(fp)
+            cls.validate(raw_snapshot)
+            snapshot = cls.from_dict(raw_snapshot)
+        except FileNotFoundError:
+            logger.debug(f"No relation cache snapshot found at '{path}'")
+            return None
+        except (OSError, ValueError, ValidationError) as exc:
+            logger.debug(f"Ignoring unreadable relation cache snapshot at '{path}': {exc}")
+            return None
+
+        if snapshot.version != SNAPSHOT_VERSION or snapshot.key != key:
+            logger.debug(f"Ignoring relation cache snapshot at '{path}' taken for another target")
+            return None
+
+        return snapshot
+
+    def save(self, path: str) -> None:
+        """Write the snapshot atomically, so a concurrent reader never sees a partial file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as fp:
+                json.dump(self.to_dict(), fp)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug(f"Could not write relation cache snapshot to '{path}': {exc}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def unchanged_schemas(self, markers: Dict[str, List[int]]) -> Set[str]:
+        """The schemas whose stored marker matches the current `markers` from the database."""
+        return {
+            schema
+            for schema, marker in markers.items()
+            if schema in self.markers and self.markers[schema] == marker
+        }
+
+    def changed_schemas(self, markers: Dict[str, List[int]]) -> Set[str]:
+        """The schemas that were created, dropped or modified since the snapshot was taken."""
+        return (set(markers) | set(self.markers)) - self.unchanged_schemas(markers)
+
+    def get_links(self, schemas: Set[str]) -> List[RelationLink]:
+        """The stored links whose dependent and referenced relations are both in `schemas`."""
+        return [
+            (dep_schema, dep_name, ref_schema, ref_name)
+            for dep_schema, dep_name, ref_schema, ref_name in self.links
+            if dep_schema.lower() in schemas and ref_schema.lower() in schemas
+        ]
+
+
+def relation_cache_markers(rows: Iterable) -> Dict[str, List[int]]:
+    """Translate the rows of `redshift__get_relation_cache_markers` into snapshot markers."""
+    return {
+        schema_name.lower(): [int(relation_count or 0), int(max_oid or 0)]
+        for schema_name, relation_count, max_oid in rows
+    }
+
+
+def _lookup_key(database: Optional[str], schema: Optional[str], identifier: Optional[str]):
+    return tuple(part.lower() if part else None for part in (database, schema, identifier))
+
+
+class RelationLookups:
+    """
+    Relations resolved one at a time, for schemas that the relations cache does not hold.
+
+    Adding a relation to the relations cache marks its whole schema as cached, so relations
+    found with a targeted lookup are kept here instead, until dbt creates, drops or renames them.
+    Relations that were not found are not remembered: hooks, `run_query` and operations can
+    create them without dbt knowing, so they are looked up again on the next request.
+
+    Names are kept lowercase, with every relation matching them, so that callers can still tell
+    apart relations whose names only differ by case.
+
+    It also counts the targeted queries issued and the schemas that still had to be listed in
+    full, to tell how often a cache miss costs a whole schema scan.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._relations: Dict[Tuple, List[BaseRelation]] = {}
+        self.queries = 0
+        self.schema_listings = 0
+
+    def __contains__(self, key: Tuple[Optional[str], Optional[str], Optional[str]]) -> bool:
+        with self._lock:
+            return _lookup_key(*key) in self._relations
+
+    def get(
+        self, database: Optional[str], schema: Optional[str], identifier: Optional[str]
+    ) -> List[BaseRelation]:
+        """The relations found under this name, whatever their case, if any."""
+        with self._lock:
+            return list(self._relations.get(_lookup_key(database, schema, identifier), []))
+
+    def update(self, found: Iterable[BaseRelation]) -> None:
+        """Remember the `found` relations of a targeted lookup."""
+        with self._lock:
+            self.queries += 1
+            for relation in found:
+                key = _lookup_key(relation.database, relation.schema, relation.identifier)
+                relations = self._relations.setdefault(key, [])
+                if relation not in relations:
+                    relations.append(relation)
+
+    def discard(self, relation: Optional[BaseRelation]) -> None:
+        if relation is None:
+            return
+        with self._lock:
+            key = _lookup_key(relation.database, relation.schema, relation.identifier)
+            self._relations.pop(key, None)
+
+    def record_schema_listing(self) -> int:
+        with self._lock:
+            self.schema_listings += 1
+            return self.schema_listings
+
+    def clear(self) -> None:
+        with self._lock:
+            self._relations.clear()
+
+
+class RelationColumns:
+    """
+    The columns of relations described in bulk, see `RedshiftAdapter.get_columns_in_relations`.
+
+    They are served to `get_columns_in_relation` until dbt creates, drops, renames or alters the
+    relation. Relations that were not found are not remembered, so a relation created later in
+    the run, like an incremental model's temp relation, is described on its own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._columns: Dict[Tuple, List[Column]] = {}
+        self.served = 0
+
+    def get(self, relation: BaseRelation) -> Optional[List[Column]]:
+        key = _lookup_key(relation.database, relation.schema, relation.identifier)
+        with self._lock:
+            columns = self._columns.get(key)
+            if columns is None:
+                return None
+            self.served += 1
+            return list(columns)
+
+    def update(self, columns: Dict[BaseRelation, List[Column]]) -> None:
+        with self._lock:
+            for relation, relation_columns in columns.items():
+                key = _lookup_key(relation.database, relation.schema, relation.identifier)
+                self._columns[key] = list(relation_columns)
+
+    def discard(self, relation: Optional[BaseRelation]) -> None:
+        if relation is None:
+            return
+        with self._lock:
+            key = _lookup_key(relation.database, relation.schema, relation.identifier)
+            self._columns.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._columns.clear()
+
+
+def _split_table(
+    table: "agate.Table", key_columns: Tuple[str, str]
+) -> Dict[Tuple[str, str], "agate.Table"]:
+    """Split `table` into one table per lowercase value of its `key_columns`."""
+    import agate
+
+    rows: Dict[Tuple[str, str], List[Any]] = {}
+    for row in table.rows:
+        key = tuple(str(row[column]).lower() for column in key_columns)
+        rows.setdefault(key, []).append(row)  # type: ignore[arg-type]
+    return {
+        key: agate.Table(key_rows, table.column_names, table.column_types)
+        for key, key_rows in rows.items()
+    }
+
+
+def materialized_view_descriptions(
+    results: Dict[str, "agate.Table"]
+) -> Dict[Tuple[str, str], RelationResults]:
+    """
+    Split the results of `redshift__describe_materialized_views` into the description
+    `redshift__describe_materialized_view` returns for each materialized view, by lowercase
+    (schema, name).
+    """
+    import agate
+
+    materialized_views = results["materialized_views"]
+    queries = _split_table(results["queries"], ("schema", "name"))
+
+    columns = results["columns"]
+    column_rows: Dict[Tuple[str, str], List[Any]] = {}
+    for row in columns.rows:
+        match = MATERIALIZED_VIEW_TABLE_PATTERN.match(row["internal_table"])
+        if match:
+            key = (str(row["schema"]).lower(), match.group(1).lower())
+            column_rows.setdefault(key, []).append(row)
+
+    descriptions: Dict[Tuple[str, str], RelationResults] = {}
+    for key, materialized_view in _split_table(materialized_views, ("schema", "table")).items():
+        if key not in queries:
+            continue
+        descriptions[key] = {
+            "materialized_view": materialized_view,
+            "query": queries[key],
+            "columns": agate.Table(
+                column_rows.get(key, []), columns.column_names, columns.column_types
+            ),
+        }
+    return descriptions
+
+
+def materialized_view_name(name: str) -> str:
+    """The name of the materialized view behind the table `name`, or `name` itself."""
+    match = MATERIALIZED_VIEW_TABLE_PATTERN.match(name)
+    return match.group(1) if match else name
+
+
+class MaterializedViewRefreshState(NamedTuple):
+    """
+    Whether a materialized view is stale, and how it refreshes, as svv_mv_info tells it.
+
+    States other than incremental and full recompute mean the refresh will fail, because a base
+    table or one of its columns was dropped, renamed or changed type.
+    """
+
+    is_stale: bool
+    state: Optional[int]
+
+    @property
+    def refresh_kind(self) -> str:
+        if self.state == MATERIALIZED_VIEW_INCREMENTAL_STATE:
+            return "incremental"
+        if self.state == MATERIALIZED_VIEW_RECOMPUTE_STATE:
+            return "full recompute"
+        return "unrefreshable"
+
+
+def materialized_view_refresh_state(row: Any) -> MaterializedViewRefreshState:
+    """Read the `is_stale` and `state` columns of svv_mv_info from `row`."""
+    is_stale = row["is_stale"]
+    state = row["state"]
+    return MaterializedViewRefreshState(
+        is_stale=is_stale if isinstance(is_stale, bool) else str(is_stale).lower() == "t",
+        state=None if state is None else int(state),
+    )
+
+
+class MaterializedViewDescriptions:
+    """
+    The materialized views of the target database, described a whole schema at a time, see
+    `RedshiftAdapter.describe_materialized_view`.
+
+    Each description is served once: the materialized view is usually altered or refreshed right
+    after it was compared to its model. Materialized views that were not found, or that dbt
+    creates, drops or renames, are described on their own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._schemas: Set[str] = set()
+        self._descriptions: Dict[Tuple[str, str], RelationResults] = {}
+        self.fetches = 0
+
+    def missing_schemas(self, schemas: Iterable[str]) -> Set[str]:
+        """The `schemas` that were never described, lowercased."""
+        with self._lock:
+            return {schema.lower() for schema in schemas} - self._schemas
+
+    def update(
+        self, schemas: Iterable[str], descriptions: Dict[Tuple[str, str], RelationResults]
+    ) -> None:
+        with self._lock:
+            self.fetches += 1
+            self._schemas |= {schema.lower() for schema in schemas}
+            self._descriptions.update(descriptions)
+
+    def pop(self, schema: str, name: str) -> Optional[RelationResults]:
+        with self._lock:
+            return self._descriptions.pop((schema.lower(), name.lower()), None)
+
+    def discard(self, relation: Optional[BaseRelation]) -> None:
+        if relation is None or not relation.schema or not relation.identifier:
+            return
+        self.pop(relation.schema, relation.identifier)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._descriptions.clear()
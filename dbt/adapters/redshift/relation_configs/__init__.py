@@ -1,6 +1,7 @@
 from dbt.adapters.redshift.relation_configs.sort import (
     RedshiftSortConfig,
     RedshiftSortConfigChange,
+    RedshiftSortStyle,
 )
 from dbt.adapters.redshift.relation_configs.dist import (
     RedshiftDistConfig,
@@ -11,6 +12,12 @@ from dbt.adapters.redshift.relation_configs.materialized_view import (
     RedshiftAutoRefreshConfigChange,
     RedshiftMaterializedViewConfigChangeset,
 )
+from dbt.adapters.redshift.relation_configs.table import (
+    RedshiftTableConfig,
+    RedshiftTableConfigChangeset,
+    RedshiftTableDistConfigChange,
+    RedshiftTableSortConfigChange,
+)
 from dbt.adapters.redshift.relation_configs.policies import (
     RedshiftIncludePolicy,
     RedshiftQuotePolicy,
@@ -103,7 +103,8 @@ class RedshiftSortConfig(RedshiftRelationConfigBase, RelationConfigValidationMix
     def from_dict(cls, config_dict) -> Self:
         kwargs_dict = {
             "sortstyle": config_dict.get("sortstyle"),
-            "sortkey": tuple(column for column in config_dict.get("sortkey", {})),
+            # a sort config without columns, e.g. `auto`, has no sortkey rather than an empty one
+            "sortkey": tuple(config_dict["sortkey"]) if config_dict.get("sortkey") else None,
         }
         sort: Self = super().from_dict(kwargs_dict)  # type: ignore
         return sort  # type: ignore
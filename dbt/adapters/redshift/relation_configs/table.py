@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+from typing import Optional, Set, Dict, Any, Tuple, TYPE_CHECKING
+
+from dbt.adapters.contracts.relation import RelationConfig
+from dbt.adapters.relation_configs import (
+    RelationConfigChange,
+    RelationConfigChangeAction,
+    RelationConfigValidationMixin,
+    RelationConfigValidationRule,
+    RelationResults,
+)
+from dbt_common.exceptions import DbtRuntimeError
+from typing_extensions import Self
+
+from dbt.adapters.redshift.relation_configs.base import RedshiftRelationConfigBase
+from dbt.adapters.redshift.relation_configs.dist import RedshiftDistConfig, RedshiftDistStyle
+from dbt.adapters.redshift.relation_configs.sort import RedshiftSortConfig, RedshiftSortStyle
+
+if TYPE_CHECKING:
+    import agate
+
+
+# pg_class.reldiststyle, the automatic styles are reported as `auto` like in svv_table_info
+PG_CLASS_DIST_STYLES = {
+    0: RedshiftDistStyle.even,
+    1: RedshiftDistStyle.key,
+    8: RedshiftDistStyle.all,
+    10: RedshiftDistStyle.auto,
+    11: RedshiftDistStyle.auto,
+    12: RedshiftDistStyle.auto,
+}
+
+
+def _column_key(name: str) -> str:
+    # Redshift folds identifiers to lowercase, quoted or not
+    return name.strip().strip('"').lower()
+
+
+@dataclass(frozen=True, eq=True, unsafe_hash=True)
+class RedshiftTableConfig(RedshiftRelationConfigBase):
+    """
+    The distribution and sort configuration of a table, which incremental models compare to the
+    table they insert into.
+
+    The following parameters are compared:
+    - dist: the `diststyle` and optional `distkey` of the table
+    - sort: the `sortstyle` and `sortkey` of the table
+
+    A model only has a dist config if it sets `dist`, and a sort config if it sets `sort`, so
+    unset parameters are left alone. A table without a sort key has no sort config. Column names
+    are compared regardless of case and quotes, see `dist_key` and `sort_key`.
+    """
+
+    dist: Optional[RedshiftDistConfig] = None
+    sort: Optional[RedshiftSortConfig] = None
+
+    @property
+    def dist_key(self) -> Optional[Tuple[Any, Optional[str]]]:
+        if self.dist is None:
+            return None
+        distkey = _column_key(self.dist.distkey) if self.dist.distkey else None
+        return self.dist.diststyle, distkey
+
+    @property
+    def sort_key(self) -> Optional[Tuple[Any, Tuple[str, ...]]]:
+        if self.sort is None:
+            return None
+        return self.sort.sortstyle, tuple(_column_key(key) for key in self.sort.sortkey or ())
+
+    @classmethod
+    def from_dict(cls, config_dict) -> Self:
+        kwargs_dict: Dict[str, Any] = {}
+        if dist := config_dict.get("dist"):
+            kwargs_dict.update({"dist": RedshiftDistConfig.from_dict(dist)})
+        if sort := config_dict.get("sort"):
+            kwargs_dict.update({"sort": RedshiftSortConfig.from_dict(sort)})
+        table: Self = super().from_dict(kwargs_dict)  # type: ignore
+        return table
+
+    @classmethod
+    def parse_relation_config(cls, config: RelationConfig) -> Dict[str, Any]:
+        config_dict: Dict[str, Any] = {}
+        if config.config.get("dist"):  # type: ignore
+            config_dict.update({"dist": RedshiftDistConfig.parse_relation_config(config)})
+        # like `create table`, a `sort_type` without `sort` leaves the sort key alone
+        if config.config.get("sort"):  # type: ignore
+            config_dict.update({"sort": RedshiftSortConfig.parse_relation_config(config)})
+        return config_dict
+
+    @classmethod
+    def parse_relation_results(cls, relation_results: RelationResults) -> Dict:
+        """
+        Translate agate objects from the database into a standard dictionary.
+
+        Args:
+            relation_results: the description of the table from the database in this format:
+
+                {
+                    "table": agate.Table(
+                        agate.Row({
+                            "sortkey1": "<column_name>",  # e.g. id | AUTO(SORTKEY)
+                        })
+                    ),
+                    "columns": agate.Table(
+                        agate.Row({
+                            "column": "<column_name>",
+                            "diststyle": <int>,  # pg_class.reldiststyle
+                            "is_dist_key": any(true, false),
+                            "sort_key_position": <int>,  # negative for interleaved sort keys
+                        })
+                    ),
+                }
+
+                `table` is empty for tables without data, which svv_table_info does not list.
+
+        Returns: a standard dictionary describing this `RedshiftTableConfig` instance
+        """
+        columns: "agate.Table" = relation_results["columns"]  # type: ignore
+        table: "agate.Row" = cls._get_first_row(relation_results.get("table"))  # type: ignore
+        config_dict: Dict[str, Any] = {}
+
+        first_column = cls._get_first_row(columns)
+        if (diststyle := PG_CLASS_DIST_STYLES.get(first_column.get("diststyle"))) is not None:
+            dist_config: Dict[str, Any] = {"diststyle": diststyle.value}
+            if diststyle == RedshiftDistStyle.key:
+                dist_config["distkey"] = next(
+                    (row.get("column") for row in columns.rows if row.get("is_dist_key")), None
+                )
+            config_dict["dist"] = dist_config
+
+        sort_columns = sorted(
+            (row for row in columns.rows if row.get("sort_key_position")),
+            key=lambda row: abs(row.get("sort_key_position")),
+        )
+        if str(table.get("sortkey1") or "").upper().startswith("AUTO"):
+            config_dict["sort"] = {"sortstyle": RedshiftSortStyle.auto.value}
+        elif sort_columns:
+            interleaved = any(row.get("sort_key_position") < 0 for row in sort_columns)
+            config_dict["sort"] = {
+                "sortstyle": (
+                    RedshiftSortStyle.interleaved if interleaved else RedshiftSortStyle.compound
+                ).value,
+                "sortkey": [row.get("column") for row in sort_columns],
+            }
+
+        return config_dict
+
+
+@dataclass(frozen=True, eq=True, unsafe_hash=True)
+class RedshiftTableDistConfigChange(RelationConfigChange, RelationConfigValidationMixin):
+    """A dist change, which `alter table ... alter diststyle` applies unless `in_place` is off."""
+
+    context: RedshiftDistConfig
+    in_place: bool = True
+
+    @property
+    def requires_full_refresh(self) -> bool:
+        return not self.in_place
+
+    @property
+    def validation_rules(self) -> Set[RelationConfigValidationRule]:
+        return {
+            RelationConfigValidationRule(
+                validation_check=(self.action == RelationConfigChangeAction.alter),
+                validation_error=DbtRuntimeError(
+                    "Invalid operation, only `alter` changes are supported for `distkey` / "
+                    "`diststyle`."
+                ),
+            ),
+        }
+
+
+@dataclass(frozen=True, eq=True, unsafe_hash=True)
+class RedshiftTableSortConfigChange(RelationConfigChange, RelationConfigValidationMixin):
+    """A sort change, which `alter table ... alter sortkey` applies unless `in_place` is off."""
+
+    context: RedshiftSortConfig
+    in_place: bool = True
+
+    @property
+    def requires_full_refresh(self) -> bool:
+        return not self.in_place
+
+    @property
+    def validation_rules(self) -> Set[RelationConfigValidationRule]:
+        return {
+            RelationConfigValidationRule(
+                validation_check=(self.action == RelationConfigChangeAction.alter),
+                validation_error=DbtRuntimeError(
+                    "Invalid operation, only `alter` changes are supported for `sortkey` / "
+                    "`sortstyle`."
+                ),
+            ),
+        }
+
+
+@dataclass
+class RedshiftTableConfigChangeset:
+    dist: Optional[RedshiftTableDistConfigChange] = None
+    sort: Optional[RedshiftTableSortConfigChange] = None
+
+    @property
+    def requires_full_refresh(self) -> bool:
+        return any(
+            {
+                self.dist.requires_full_refresh if self.dist else False,
+                self.sort.requires_full_refresh if self.sort else False,
+            }
+        )
+
+    @property
+    def has_changes(self) -> bool:
+        return any(
+            {
+                self.dist if self.dist else False,
+                self.sort if self.sort else False,
+            }
+        )
@@ -1,4 +1,6 @@
-from typing import Union
+from typing import Iterable, List, Optional, Union
+
+from dbt.adapters.base import BaseRelation
 
 
 def evaluate_bool_str(value: str) -> bool:
@@ -23,3 +25,32 @@ def evaluate_bool(value: Union[str, bool]) -> bool:
             f"Invalid type for boolean evaluation, "
             f"expecting boolean or str, recieved: {type(value)}"
         )
+
+
+# the most bytes a single relation filter may add to a query, a few thousand relations at most.
+# Redshift rejects statements over 16MB, and plans huge filters slowly well before that.
+RELATION_FILTER_MAX_BYTES = 64 * 1024
+
+
+def chunk_relations(
+    relations: Iterable[BaseRelation], max_bytes: Optional[int] = None
+) -> List[List[BaseRelation]]:
+    """
+    Split `relations` into chunks whose rendered `(schema, identifier) in (...)` filter stays
+    within `max_bytes`, RELATION_FILTER_MAX_BYTES by default. See the
+    `redshift__relation_filter_sql` macro.
+    """
+    max_bytes = max_bytes or RELATION_FILTER_MAX_BYTES
+    chunks: List[List[BaseRelation]] = []
+    chunk: List[BaseRelation] = []
+    chunk_bytes = 0
+    for relation in relations:
+        relation_bytes = len(f"('{relation.schema}', '{relation.identifier}'), ".encode())
+        if chunk and chunk_bytes + relation_bytes > max_bytes:
+            chunks.append(chunk)
+            chunk, chunk_bytes = [], 0
+        chunk.append(relation)
+        chunk_bytes += relation_bytes
+    if chunk:
+        chunks.append(chunk)
+    return chunks
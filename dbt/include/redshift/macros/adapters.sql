@@ -106,8 +106,14 @@
 
 
 {% macro redshift__get_columns_in_relation(relation) -%}
+  {#-- only the metadata that can hold the relation is read, see RedshiftAdapter.get_column_sources.
+    -- Late binding views the adapter knows are described from its cache. #}
+  {%- set sources = adapter.get_column_sources(relation) -%}
+  {%- set source_ctes = {'bound': 'bound_views', 'late_binding': 'unbound_views', 'external': 'external_views'} -%}
   {% call statement('get_columns_in_relation', fetch_result=True) %}
-      with bound_views as (
+    with
+    {% if 'bound' in sources -%}
+    bound_views as (
         select
           ordinal_position,
           table_schema,
@@ -119,8 +125,13 @@
 
         from information_schema."columns"
         where table_name = '{{ relation.identifier }}'
+        {% if relation.schema -%}
+        and table_schema = '{{ relation.schema }}'
+        {%- endif %}
     ),
+    {%- endif %}
 
+    {% if 'late_binding' in sources -%}
     unbound_views as (
       select
         ordinal_position,
@@ -157,7 +168,9 @@
            col_type varchar, ordinal_position int)
       where view_name = '{{ relation.identifier }}'
     ),
+    {%- endif %}
 
+    {% if 'external' in sources -%}
     external_views as (
       select
         columnnum,
@@ -197,13 +210,24 @@
         and tablename = '{{ relation.identifier }}'
 
     ),
+    {%- endif %}
 
-    unioned as (
-      select * from bound_views
-      union all
-      select * from unbound_views
+    {#-- named here, as the first source selected names the columns otherwise #}
+    unioned (
+      ordinal_position,
+      table_schema,
+      column_name,
+      data_type,
+      character_maximum_length,
+      numeric_precision,
+      numeric_scale
+    ) as (
+      {%- for source in sources %}
+      select * from {{ source_ctes[source] }}
+      {%- if not loop.last %}
       union all
-      select * from external_views
+      {%- endif %}
+      {%- endfor %}
     )
 
     select
@@ -223,33 +247,228 @@
   {{ return(sql_convert_columns_in_relation(table)) }}
 {% endmacro %}
 
-{% macro redshift__list_relations_without_caching(schema_relation) %}
+{% macro redshift__get_columns_in_relations(relations) -%}
+  {#-- The columns of many tables, views and external tables at once, for
+    -- RedshiftAdapter.get_columns_in_relations. Late binding views are described by the adapter. #}
+  {% call statement('get_columns_in_relations', fetch_result=True) %}
+    with bound_views as (
+      select
+        table_schema,
+        table_name,
+        ordinal_position,
+        column_name,
+        data_type,
+        character_maximum_length,
+        numeric_precision,
+        numeric_scale
+      from information_schema."columns"
+      where {{ redshift__relation_filter_sql('table_schema', 'table_name', relations) }}
+    ),
+
+    external_views as (
+      select
+        schemaname,
+        tablename,
+        columnnum,
+        columnname,
+        case
+          when external_type ilike 'character varying%' or external_type ilike 'varchar%'
+          then 'character varying'
+          when external_type ilike 'numeric%' then 'numeric'
+          else external_type
+        end as external_type,
+        case
+          when external_type like 'character%' or external_type like 'varchar%'
+          then nullif(
+            REGEXP_SUBSTR(external_type, '[0-9]+'),
+            '')::int
+          else null
+        end as character_maximum_length,
+        case
+          when external_type like 'numeric%'
+          then nullif(
+            SPLIT_PART(REGEXP_SUBSTR(external_type, '[0-9,]+'), ',', 1),
+            '')::int
+          else null
+        end as numeric_precision,
+        case
+          when external_type like 'numeric%'
+          then nullif(
+            SPLIT_PART(REGEXP_SUBSTR(external_type, '[0-9,]+'), ',', 2),
+            '')::int
+          else null
+        end as numeric_scale
+      from pg_catalog.svv_external_columns
+      where {{ redshift__relation_filter_sql('schemaname', 'tablename', relations) }}
+    ),
+
+    unioned as (
+      select * from bound_views
+      union all
+      select * from external_views
+    )
 
-  {% call statement('list_relations_without_caching', fetch_result=True) -%}
     select
-        table_catalog as database,
-        table_name as name,
-        table_schema as schema,
-        'table' as type
-    from information_schema.tables
-    where table_schema ilike '{{ schema_relation.schema }}'
-    and table_type = 'BASE TABLE'
-    union all
+      table_schema,
+      table_name,
+      column_name,
+      data_type,
+      character_maximum_length,
+      numeric_precision,
+      numeric_scale
+    from unioned
+    order by table_schema, table_name, ordinal_position
+  {% endcall %}
+  {{ return(load_result('get_columns_in_relations').table) }}
+{%- endmacro %}
+
+{% macro redshift__get_external_schemas() -%}
+  {% call statement('get_external_schemas', fetch_result=True) %}
+    select schemaname from svv_external_schemas
+  {% endcall %}
+  {{ return(load_result('get_external_schemas').table) }}
+{%- endmacro %}
+
+{% macro redshift__get_late_binding_view_columns(schemas=none, relations=none) -%}
+  {#-- The columns of the late binding views in `schemas`, or among `relations`. The function
+    -- resolves every late binding view of the database whatever the filter, so the adapter asks
+    -- for whole schemas at once and caches them, see LateBindingViewColumns #}
+  {% call statement('get_late_binding_view_columns', fetch_result=True) %}
     select
-      table_catalog as database,
-      table_name as name,
-      table_schema as schema,
-      case
-        when view_definition ilike '%create materialized view%'
-          then 'materialized_view'
-        else 'view'
-      end as type
-    from information_schema.views
-    where table_schema ilike '{{ schema_relation.schema }}'
+      cols.view_schema,
+      cols.view_name,
+      cols.col_name,
+      cols.col_type,
+      cols.ordinal_position,
+      views.viewowner as view_owner
+    from pg_get_late_binding_view_cols()
+      cols(view_schema name, view_name name, col_name name,
+           col_type varchar, ordinal_position int)
+    left join pg_catalog.pg_views views
+      on views.schemaname = cols.view_schema
+      and views.viewname = cols.view_name
+    where
+    {%- if relations is not none %}
+      {{ redshift__relation_filter_sql('cols.view_schema', 'cols.view_name', relations) }}
+    {%- else %}
+      lower(cols.view_schema) in (
+        {%- for schema in schemas -%}
+          '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+      )
+    {%- endif %}
+    order by 1, 2, 5
   {% endcall %}
-  {{ return(load_result('list_relations_without_caching').table) }}
+  {{ return(load_result('get_late_binding_view_columns').table) }}
+{%- endmacro %}
+
+{% macro redshift__list_relations_without_caching(schema_relation) %}
+  {%- set database = schema_relation.database or target.database -%}
+  {{ return(redshift__list_relations_in_schemas(database, [schema_relation.schema])) }}
+{% endmacro %}
+
+{% macro redshift__list_relations_in_schemas(database, schemas) %}
+  {#-- List every relation in several schemas of one database in a single query. #}
+  {{ return(redshift__select_relations(database, schemas=schemas)) }}
+{% endmacro %}
+
+{% macro redshift__get_relations_by_name(database, relations) %}
+  {#-- Look up a handful of relations of one database without listing their schemas. #}
+  {{ return(redshift__select_relations(database, relations=relations)) }}
+{% endmacro %}
+
+{% macro redshift__select_relations(database, schemas=none, relations=none) %}
+  {#-- The current database is read from the leader-node catalog, other databases
+    -- on RA3 nodes are read from svv_redshift_tables. Redshift does not join the leader-node
+    -- catalog with svv_mv_info, so the materialized views are found by a query of their own. #}
+  {%- set is_current_database = database | lower == target.database | lower -%}
+  {%- set schema_column = 'sch.nspname' if is_current_database else 'tbl.schema_name' -%}
+  {%- set name_column = 'tbl.relname' if is_current_database else 'tbl.table_name' -%}
+
+  {% call statement('select_materialized_views', fetch_result=True) -%}
+    select mat_views.schema_name as schema, mat_views.name
+    from svv_mv_info mat_views
+    where lower(mat_views.database_name) = '{{ database | lower }}'
+    {{ _redshift__select_relations_filter('mat_views.schema_name', 'mat_views.name', schemas, relations) }}
+  {%- endcall %}
+  {%- set materialized_views = load_result('select_materialized_views').table -%}
+  {%- set materialized_view_filter -%}
+    {%- if materialized_views | length == 0 -%}
+      false
+    {%- else -%}
+      (lower({{ schema_column }}), lower({{ name_column }})) in (
+        {%- for mv in materialized_views -%}
+          ('{{ mv[0] | lower }}', '{{ mv[1] | lower }}')
+          {%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+      )
+    {%- endif -%}
+  {%- endset -%}
+
+  {% call statement('select_relations', fetch_result=True) -%}
+    {% if is_current_database %}
+    select
+        current_database() as database,
+        tbl.relname as name,
+        sch.nspname as schema,
+        case
+            when tbl.relkind = 'v' and {{ materialized_view_filter }} then 'materialized_view'
+            when tbl.relkind = 'v' then 'view'
+            else 'table'
+        end as type
+    from pg_catalog.pg_class tbl
+    join pg_catalog.pg_namespace sch
+        on sch.oid = tbl.relnamespace
+    where tbl.relkind in ('r', 'v')
+    -- the tables backing materialized views are not relations that dbt manages
+    and tbl.relname not like 'mv\_tbl\_\_%'
+    {% else %}
+    select
+        tbl.database_name as database,
+        tbl.table_name as name,
+        tbl.schema_name as schema,
+        case
+            when tbl.table_type = 'VIEW' and {{ materialized_view_filter }} then 'materialized_view'
+            when tbl.table_type = 'VIEW' then 'view'
+            else 'table'
+        end as type
+    from svv_redshift_tables tbl
+    where tbl.database_name = '{{ database }}'
+    and tbl.table_name not like 'mv\_tbl\_\_%'
+    {% endif %}
+    {{ _redshift__select_relations_filter(schema_column, name_column, schemas, relations) }}
+  {%- endcall %}
+  {{ return(load_result('select_relations').table) }}
 {% endmacro %}
 
+{% macro _redshift__select_relations_filter(schema_column, name_column, schemas, relations) -%}
+    {% if schemas is not none %}
+    and lower({{ schema_column }}) in (
+        {%- for schema in schemas -%}
+            '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+    )
+    {% endif %}
+    {% if relations is not none %}
+    and {{ redshift__relation_filter_sql(schema_column, name_column, relations) }}
+    {% endif %}
+{%- endmacro %}
+
+{% macro redshift__relation_filter_sql(schema_column, name_column, relations) -%}
+  {#-- A single (schema, name) in (...) filter instead of one or-ed term per relation. Long lists
+    -- of relations are split by the adapter beforehand, see chunk_relations. #}
+  {%- if not relations -%}
+    false
+  {%- else -%}
+    (lower({{ schema_column }}), lower({{ name_column }})) in (
+      {%- for relation in relations -%}
+        ('{{ relation.schema | lower }}', '{{ relation.identifier | lower }}')
+        {%- if not loop.last %}, {% endif -%}
+      {%- endfor -%}
+    )
+  {%- endif -%}
+{%- endmacro %}
+
 {% macro redshift__information_schema_name(database) -%}
   {{ return(postgres__information_schema_name(database)) }}
 {%- endmacro %}
@@ -265,14 +484,39 @@
 
 
 {% macro redshift__persist_docs(relation, model, for_relation, for_columns) -%}
+  {% for sql in redshift__get_persist_docs_sql(relation, model, for_relation, for_columns) %}
+    {% do run_query(sql) %}
+  {% endfor %}
+{% endmacro %}
+
+{% macro redshift__get_persist_docs_sql(relation, model, for_relation, for_columns) -%}
+  {% set statements = [] %}
   {% if for_relation and config.persist_relation_docs() and model.description %}
-    {% do run_query(alter_relation_comment(relation, model.description)) %}
+    {% do statements.append(alter_relation_comment(relation, model.description)) %}
   {% endif %}
 
   {# Override: do not set column comments for LBVs #}
   {% set is_lbv = config.get('materialized') == 'view' and config.get('bind') == false %}
   {% if for_columns and config.persist_column_docs() and model.columns and not is_lbv %}
-    {% do run_query(alter_column_comment(relation, model.columns)) %}
+    {% do statements.append(alter_column_comment(relation, model.columns)) %}
+  {% endif %}
+  {{ return(statements) }}
+{% endmacro %}
+
+{% macro redshift__apply_grants_and_docs(relation, grant_config, should_revoke, model) -%}
+  {#-- Inside the model's transaction, unless they run on side connections after commit. #}
+  {% if not adapter.runs_metadata_in_background() %}
+    {% do apply_grants(relation, grant_config, should_revoke=should_revoke) %}
+    {% do persist_docs(relation, model) %}
+  {% endif %}
+{% endmacro %}
+
+{% macro redshift__submit_grants_and_docs(relation, grant_config, should_revoke, model) -%}
+  {#-- Hand grants and docs over to side connections once the relation is committed.
+    -- The docs are rendered here, since they depend on the model's config. #}
+  {% if adapter.runs_metadata_in_background() %}
+    {% set docs_sql = redshift__get_persist_docs_sql(relation, model, true, true) %}
+    {% do adapter.submit_relation_metadata(relation, grant_config, should_revoke, docs_sql) %}
   {% endif %}
 {% endmacro %}
 
@@ -304,26 +548,48 @@
 
 {% macro redshift__alter_relation_add_remove_columns(relation, add_columns, remove_columns) %}
 
-  {% if add_columns %}
-
-    {% for column in add_columns %}
-      {% set sql -%}
-          alter {{ relation.type }} {{ relation }} add column {{ column.name }} {{ column.data_type }}
-      {% endset %}
-      {% do run_query(sql) %}
-    {% endfor %}
-
+  {% do adapter.forget_columns_in_relation(relation) %}
+
+  {#-- Redshift adds or drops one column per alter table, so the statements cannot be folded
+    -- into one. They are still sent one by one, with one round trip each, and each is logged
+    -- with its own status and timing: this only saves commits. Outside of a materialization,
+    -- they run in one transaction with a single commit rather than one per column. Inside of
+    -- one, they already ran in its transaction, which is left to it. #}
+  {% set transaction_was_open = adapter.has_open_transaction() %}
+  {% set statements = [] %}
+
+  {% for column in add_columns or [] %}
+    {% do statements.append("alter " ~ relation.type ~ " " ~ relation ~ " add column " ~ column.name ~ " " ~ column.data_type) %}
+  {% endfor %}
+
+  {% for column in remove_columns or [] %}
+    {% do statements.append("alter " ~ relation.type ~ " " ~ relation ~ " drop column " ~ column.name) %}
+  {% endfor %}
+
+  {% if statements %}
+    {% call statement('alter_relation_add_remove_columns', auto_begin=True) %}
+      {{ statements | join(";\n") }}
+    {% endcall %}
+    {% if not transaction_was_open %}
+      {% do adapter.commit() %}
+    {% endif %}
   {% endif %}
 
-  {% if remove_columns %}
+{% endmacro %}
 
-    {% for column in remove_columns %}
-      {% set sql -%}
-          alter {{ relation.type }} {{ relation }} drop column {{ column.name }}
-      {% endset %}
-      {% do run_query(sql) %}
-    {% endfor %}
 
+{% macro redshift__alter_column_type(relation, column_name, new_column_type) %}
+  {#-- varchar columns are widened in place when Redshift allows it, see
+    -- RedshiftAdapter.alter_column_type_in_place, and copied into a new column otherwise #}
+  {% set altered_in_place = adapter.alter_column_type_in_place(relation, column_name, new_column_type) %}
+  {% do adapter.forget_columns_in_relation(relation) %}
+  {% if not altered_in_place %}
+    {{ return(default__alter_column_type(relation, column_name, new_column_type)) }}
   {% endif %}
+{% endmacro %}
+
 
+{% macro redshift__create_columns(relation, columns) %}
+  {% do adapter.forget_columns_in_relation(relation) %}
+  {{ default__create_columns(relation, columns) }}
 {% endmacro %}
@@ -8,12 +8,9 @@
 
     {% set catalog = _redshift__get_base_catalog_by_relation(database, relations) %}
 
-    {% set select_extended = redshift__can_select_from('svv_table_info') %}
-    {% if select_extended %}
+    {% if adapter.can_select_svv_table_info() %}
         {% set extended_catalog = _redshift__get_extended_catalog_by_relation(relations) %}
         {% set catalog = catalog.join(extended_catalog, ['table_schema', 'table_name']) %}
-    {% else %}
-        {{ redshift__no_svv_table_info_warning() }}
     {% endif %}
 
     {{ return(catalog) }}
@@ -22,61 +19,61 @@
 
 
 {% macro _redshift__get_base_catalog_by_relation(database, relations) -%}
+    {%- set materialized_views = _redshift__get_materialized_views(database, relations | map(attribute='schema') | unique | list) -%}
     {%- call statement('base_catalog', fetch_result=True) -%}
-        with
-            late_binding as ({{ _redshift__get_late_binding_by_relation_sql(relations) }}),
-            early_binding as ({{ _redshift__get_early_binding_by_relation_sql(database, relations) }}),
-            unioned as (select * from early_binding union all select * from late_binding),
-            table_owners as ({{ redshift__get_table_owners_sql() }})
-        select '{{ database }}' as table_database, *
-        from unioned
-        join table_owners using (table_schema, table_name)
-        order by "column_index"
+        {{ _redshift__get_base_catalog_by_relation_sql(database, relations, materialized_views=materialized_views) }}
     {%- endcall -%}
     {{ return(load_result('base_catalog').table) }}
 {%- endmacro %}
 
 
+{% macro _redshift__get_base_catalog_by_relation_sql(database, relations, tier='full', late_binding=true, materialized_views=[]) %}
+    {#-- the 'columns' tier leaves out owners, see RedshiftCatalogTier. Without late_binding, the
+      -- adapter adds the late binding views from its cache, see LateBindingViewColumns #}
+    {%- set with_owners = tier != 'columns' -%}
+    with
+        {% if late_binding -%}
+        late_binding as ({{ _redshift__get_late_binding_by_relation_sql(relations) }}),
+        {% endif -%}
+        early_binding as ({{ _redshift__get_early_binding_by_relation_sql(database, relations, tier, materialized_views) }}),
+        unioned as (
+            select * from early_binding
+            {%- if late_binding %} union all select * from late_binding{% endif %}
+        )
+        {%- if with_owners %},
+        table_owners as ({{ redshift__get_table_owners_sql(relations | map(attribute='schema') | unique | list) }})
+        {%- endif %}
+    select '{{ database }}' as table_database, *
+    {%- if not with_owners %}, null::text as table_owner{% endif %}
+    from unioned
+    {% if with_owners -%}
+    join table_owners using (table_schema, table_name)
+    {% endif -%}
+    order by "column_index"
+{% endmacro %}
+
+
 {% macro _redshift__get_late_binding_by_relation_sql(relations) %}
     {{ redshift__get_late_binding_sql() }}
-    where (
-        {%- for relation in relations -%}
-            (
-                upper(table_schema) = upper('{{ relation.schema }}')
-            and upper(table_name) = upper('{{ relation.identifier }}')
-            )
-            {%- if not loop.last %} or {% endif -%}
-        {%- endfor -%}
-    )
+    where {{ redshift__relation_filter_sql('table_schema', 'table_name', relations) }}
 {% endmacro %}
 
 
-{% macro _redshift__get_early_binding_by_relation_sql(database, relations) %}
-    {{ redshift__get_early_binding_sql(database) }}
-    and (
-        {%- for relation in relations -%}
-            (
-                upper(sch.nspname) = upper('{{ relation.schema }}')
-            and upper(tbl.relname) = upper('{{ relation.identifier }}')
-            )
-            {%- if not loop.last %} or {% endif -%}
-        {%- endfor -%}
-    )
+{% macro _redshift__get_early_binding_by_relation_sql(database, relations, tier='full', materialized_views=[]) %}
+    {{ redshift__get_early_binding_sql(database, tier, materialized_views) }}
+    and {{ redshift__relation_filter_sql('sch.nspname', 'tbl.relname', relations) }}
 {% endmacro %}
 
 
 {% macro _redshift__get_extended_catalog_by_relation(relations) %}
     {%- call statement('extended_catalog', fetch_result=True) -%}
-        {{ redshift__get_extended_catalog_sql() }}
-        where (
-            {%- for relation in relations -%}
-                (
-                    upper("schema") = upper('{{ relation.schema }}')
-                and upper("table") = upper('{{ relation.identifier }}')
-                )
-            {%- if not loop.last %} or {% endif -%}
-            {%- endfor -%}
-        )
+        {{ _redshift__get_extended_catalog_by_relation_sql(relations) }}
     {%- endcall -%}
     {{ return(load_result('extended_catalog').table) }}
 {% endmacro %}
+
+
+{% macro _redshift__get_extended_catalog_by_relation_sql(relations) %}
+    {{ redshift__get_extended_catalog_sql() }}
+    where {{ redshift__relation_filter_sql('"schema"', '"table"', relations) }}
+{% endmacro %}
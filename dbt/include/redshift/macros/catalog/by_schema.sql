@@ -8,12 +8,9 @@
 
     {% set catalog = _redshift__get_base_catalog_by_schema(database, schemas) %}
 
-    {% set select_extended = redshift__can_select_from('svv_table_info') %}
-    {% if select_extended %}
+    {% if adapter.can_select_svv_table_info() %}
         {% set extended_catalog = _redshift__get_extended_catalog_by_schema(schemas) %}
         {% set catalog = catalog.join(extended_catalog, ['table_schema', 'table_name']) %}
-    {% else %}
-        {{ redshift__no_svv_table_info_warning() }}
     {% endif %}
 
     {{ return(catalog) }}
@@ -22,21 +19,40 @@
 
 
 {% macro _redshift__get_base_catalog_by_schema(database, schemas) -%}
+    {%- set materialized_views = _redshift__get_materialized_views(database, schemas) -%}
     {%- call statement('base_catalog', fetch_result=True) -%}
-        with
-            late_binding as ({{ _redshift__get_late_binding_by_schema_sql(schemas) }}),
-            early_binding as ({{ _redshift__get_early_binding_by_schema_sql(database, schemas) }}),
-            unioned as (select * from early_binding union all select * from late_binding),
-            table_owners as ({{ redshift__get_table_owners_sql() }})
-        select '{{ database }}' as table_database, *
-        from unioned
-        join table_owners using (table_schema, table_name)
-        order by "column_index"
+        {{ _redshift__get_base_catalog_by_schema_sql(database, schemas, materialized_views=materialized_views) }}
     {%- endcall -%}
     {{ return(load_result('base_catalog').table) }}
 {%- endmacro %}
 
 
+{% macro _redshift__get_base_catalog_by_schema_sql(database, schemas, tier='full', late_binding=true, materialized_views=[]) %}
+    {#-- the 'columns' tier leaves out owners, see RedshiftCatalogTier. Without late_binding, the
+      -- adapter adds the late binding views from its cache, see LateBindingViewColumns #}
+    {%- set with_owners = tier != 'columns' -%}
+    with
+        {% if late_binding -%}
+        late_binding as ({{ _redshift__get_late_binding_by_schema_sql(schemas) }}),
+        {% endif -%}
+        early_binding as ({{ _redshift__get_early_binding_by_schema_sql(database, schemas, tier, materialized_views) }}),
+        unioned as (
+            select * from early_binding
+            {%- if late_binding %} union all select * from late_binding{% endif %}
+        )
+        {%- if with_owners %},
+        table_owners as ({{ redshift__get_table_owners_sql(schemas) }})
+        {%- endif %}
+    select '{{ database }}' as table_database, *
+    {%- if not with_owners %}, null::text as table_owner{% endif %}
+    from unioned
+    {% if with_owners -%}
+    join table_owners using (table_schema, table_name)
+    {% endif -%}
+    order by "column_index"
+{% endmacro %}
+
+
 {% macro _redshift__get_late_binding_by_schema_sql(schemas) %}
     {{ redshift__get_late_binding_sql() }}
     where (
@@ -47,8 +63,8 @@
 {% endmacro %}
 
 
-{% macro _redshift__get_early_binding_by_schema_sql(database, schemas) %}
-    {{ redshift__get_early_binding_sql(database) }}
+{% macro _redshift__get_early_binding_by_schema_sql(database, schemas, tier='full', materialized_views=[]) %}
+    {{ redshift__get_early_binding_sql(database, tier, materialized_views) }}
     and (
         {%- for schema in schemas -%}
             upper(sch.nspname) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
@@ -59,12 +75,17 @@
 
 {% macro _redshift__get_extended_catalog_by_schema(schemas) %}
     {%- call statement('extended_catalog', fetch_result=True) -%}
-        {{ redshift__get_extended_catalog_sql() }}
-        where (
-            {%- for schema in schemas -%}
-                upper("schema") = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
-            {%- endfor -%}
-        )
+        {{ _redshift__get_extended_catalog_by_schema_sql(schemas) }}
     {%- endcall -%}
     {{ return(load_result('extended_catalog').table) }}
 {% endmacro %}
+
+
+{% macro _redshift__get_extended_catalog_by_schema_sql(schemas) %}
+    {{ redshift__get_extended_catalog_sql() }}
+    where (
+        {%- for schema in schemas -%}
+            upper("schema") = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+        {%- endfor -%}
+    )
+{% endmacro %}
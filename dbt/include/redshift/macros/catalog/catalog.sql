@@ -19,54 +19,101 @@
 {% endmacro %}
 
 
-{% macro redshift__get_early_binding_sql(database) %}
+{% macro redshift__get_materialized_views_sql(database, schemas) %}
+    {#-- svv_mv_info runs on the compute nodes and cannot be joined with the leader-node catalog
+      -- of the early binding query, so the materialized views are selected on their own #}
+    select
+        mat_views.schema_name as table_schema,
+        mat_views.name as table_name
+    from svv_mv_info mat_views
+    where lower(mat_views.database_name) = '{{ database | lower }}'
+    and lower(mat_views.schema_name) in (
+        {%- for schema in schemas -%}
+            '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+    )
+{% endmacro %}
+
+
+{% macro _redshift__get_materialized_views(database, schemas) -%}
+    {%- call statement('materialized_views', fetch_result=True) -%}
+        {{ redshift__get_materialized_views_sql(database, schemas) }}
+    {%- endcall -%}
+    {{ return(load_result('materialized_views').table.rows | map('list') | list) }}
+{%- endmacro %}
+
+
+{% macro redshift__get_early_binding_sql(database, tier='full', materialized_views=[]) %}
+    {#-- the 'columns' tier leaves out comments, see RedshiftCatalogTier. The materialized views
+      -- are the (schema, name) rows of redshift__get_materialized_views_sql #}
+    {%- set with_comments = tier != 'columns' -%}
+    {%- set materialized_view_filter -%}
+        {%- if materialized_views | length == 0 -%}
+            false
+        {%- else -%}
+            (lower(sch.nspname), lower(tbl.relname)) in (
+                {%- for mv in materialized_views -%}
+                    ('{{ mv[0] | lower }}', '{{ mv[1] | lower }}')
+                    {%- if not loop.last %}, {% endif -%}
+                {%- endfor -%}
+            )
+        {%- endif -%}
+    {%- endset -%}
     select
         sch.nspname as table_schema,
         tbl.relname as table_name,
         case
-            when tbl.relkind = 'v' and mat_views.table_name is not null then 'MATERIALIZED VIEW'
+            when tbl.relkind = 'v' and {{ materialized_view_filter }} then 'MATERIALIZED VIEW'
             when tbl.relkind = 'v' then 'VIEW'
             else 'BASE TABLE'
         end as table_type,
-        tbl_desc.description as table_comment,
+        {{ 'tbl_desc.description' if with_comments else 'null::text' }} as table_comment,
         col.attname as column_name,
         col.attnum as column_index,
         pg_catalog.format_type(col.atttypid, col.atttypmod) as column_type,
-        col_desc.description as column_comment
+        {{ 'col_desc.description' if with_comments else 'null::text' }} as column_comment
     from pg_catalog.pg_namespace sch
     join pg_catalog.pg_class tbl
         on tbl.relnamespace = sch.oid
     join pg_catalog.pg_attribute col
         on col.attrelid = tbl.oid
+    {% if with_comments -%}
     left outer join pg_catalog.pg_description tbl_desc
         on tbl_desc.objoid = tbl.oid
         and tbl_desc.objsubid = 0
     left outer join pg_catalog.pg_description col_desc
         on col_desc.objoid = tbl.oid
         and col_desc.objsubid = col.attnum
-    left outer join information_schema.views mat_views
-        on mat_views.table_schema = sch.nspname
-        and mat_views.table_name = tbl.relname
-        and mat_views.view_definition ilike '%create materialized view%'
-        and mat_views.table_catalog = '{{ database }}'
+    {% endif -%}
     where tbl.relkind in ('r', 'v', 'f', 'p')
     and col.attnum > 0
     and not col.attisdropped
 {% endmacro %}
 
 
-{% macro redshift__get_table_owners_sql() %}
+{% macro redshift__get_table_owners_sql(schemas=none) %}
+    {%- set schema_list -%}
+        {%- for schema in schemas or [] -%}
+            '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+    {%- endset -%}
     select
         schemaname as table_schema,
         tablename as table_name,
         tableowner as table_owner
     from pg_tables
+    {% if schemas is not none -%}
+    where lower(schemaname) in ({{ schema_list }})
+    {% endif -%}
     union all
     select
         schemaname as table_schema,
         viewname as table_name,
         viewowner as table_owner
     from pg_views
+    {% if schemas is not none -%}
+    where lower(schemaname) in ({{ schema_list }})
+    {% endif -%}
 {% endmacro %}
 
 
@@ -149,6 +196,67 @@
 {% endmacro %}
 
 
+{% macro redshift__get_catalog_markers_sql(schemas) %}
+    {#-- Cheap change markers of the relations of the current database, for incremental catalogs,
+      -- with one row per column. These are leader node tables, they cannot be aggregated with
+      -- listagg, so the columns are hashed by the adapter. The adapter fetches the raw rows,
+      -- without building an agate table of every column. #}
+    with
+        comment_lengths as (
+            select objoid as oid, sum(length(description)) as comment_length
+            from pg_catalog.pg_description
+            group by 1
+        )
+    select
+        sch.nspname as table_schema,
+        tbl.relname as table_name,
+        tbl.oid::bigint as relation_oid,
+        tbl.relowner::bigint as owner_oid,
+        coalesce(comment_lengths.comment_length, 0) as comment_length,
+        att.attnum as column_index,
+        att.attname as column_name,
+        att.atttypid::bigint as type_oid,
+        att.atttypmod as type_modifier
+    from pg_catalog.pg_class tbl
+    join pg_catalog.pg_namespace sch
+        on sch.oid = tbl.relnamespace
+    left join pg_catalog.pg_attribute att
+        on att.attrelid = tbl.oid
+        and att.attnum > 0
+        and not att.attisdropped
+    left join comment_lengths
+        on comment_lengths.oid = tbl.oid
+    where tbl.relkind in ('r', 'v', 'f', 'p')
+    and lower(sch.nspname) in (
+        {%- for schema in schemas -%}
+            '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+    )
+{% endmacro %}
+
+
+{% macro redshift__get_catalog_stats_markers_sql(schemas) %}
+    {#-- The svv_table_info stats of the full catalog tier, which change on loads and with the
+      -- dist or sort key of a table, for the markers of incremental catalogs #}
+    select
+        "schema" as table_schema,
+        "table" as table_name,
+        tbl_rows,
+        size,
+        stats_off,
+        unsorted,
+        diststyle,
+        sortkey1,
+        sortkey_num
+    from svv_table_info
+    where lower("schema") in (
+        {%- for schema in schemas -%}
+            '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+    )
+{% endmacro %}
+
+
 {% macro redshift__can_select_from(table_name) %}
 
     {%- call statement('has_table_privilege', fetch_result=True) -%}
@@ -53,15 +53,18 @@
   {{ run_hooks(post_hooks, inside_transaction=True) }}
 
   {% set should_revoke = should_revoke(existing_relation, full_refresh_mode=True) %}
-  {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
-
-  {% do persist_docs(target_relation, model) %}
+  {% do redshift__apply_grants_and_docs(target_relation, grant_config, should_revoke, model) %}
 
   -- `COMMIT` happens here
   {{ adapter.commit() }}
 
+  {% do redshift__submit_grants_and_docs(target_relation, grant_config, should_revoke, model) %}
+
   -- finally, drop the existing/backup relation after the commit
-  {{ drop_relation_if_exists(backup_relation) }}
+  {{ adapter.drop_backup_relation(backup_relation) }}
+
+  {#-- the post-hooks may grant or revoke too #}
+  {% do adapter.wait_for_relation_metadata(target_relation) %}
 
   {{ run_hooks(post_hooks, inside_transaction=False) }}
 
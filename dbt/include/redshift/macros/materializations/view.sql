@@ -60,15 +60,18 @@
   {{ adapter.rename_relation(intermediate_relation, target_relation) }}
 
   {% set should_revoke = should_revoke(existing_relation, full_refresh_mode=True) %}
-  {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
-
-  {% do persist_docs(target_relation, model) %}
+  {% do redshift__apply_grants_and_docs(target_relation, grant_config, should_revoke, model) %}
 
   {{ run_hooks(post_hooks, inside_transaction=True) }}
 
   {{ adapter.commit() }}
 
-  {{ drop_relation_if_exists(backup_relation) }}
+  {% do redshift__submit_grants_and_docs(target_relation, grant_config, should_revoke, model) %}
+
+  {{ adapter.drop_backup_relation(backup_relation) }}
+
+  {#-- the post-hooks may grant or revoke too #}
+  {% do adapter.wait_for_relation_metadata(target_relation) %}
 
   {{ run_hooks(post_hooks, inside_transaction=False) }}
 
@@ -1,29 +1,92 @@
-{% macro redshift__get_relation_last_modified(information_schema, relations) -%}
+{% macro redshift__get_relation_last_modified(information_schema, relations, source=none, lookback_days=none) -%}
+    {#-- Relations without a write in the lookback window come back with a null last_modified,
+      -- which dbt reads as infinitely stale. The writes are read from the metadata `source`,
+      -- any redshift__relation_last_writes_<source>_sql macro that returns one
+      -- (table_id, last_modified) row per table of `relations`. Unless given, the source and
+      -- lookback window are the `last_modified_source` and `last_modified_lookback_days` of the
+      -- profile. #}
+    {%- set options = adapter.get_last_modified_options() -%}
+    {%- set source = source or options.source -%}
+    {%- set lookback_days = lookback_days if lookback_days is not none else options.lookback_days -%}
+    {%- set writes_sql = adapter.dispatch('relation_last_writes_' ~ source ~ '_sql')(relations, lookback_days) -%}
 
     {%- call statement('last_modified', fetch_result=True) -%}
+        with writes as (
+            {{ writes_sql }}
+        )
         select
             ns.nspname as "schema",
             c.relname as identifier,
-            max(qd.start_time) as last_modified,
+            writes.last_modified,
             {{ current_timestamp() }} as snapshotted_at
         from pg_class c
         join pg_namespace ns
             on ns.oid = c.relnamespace
-        join sys_query_detail qd
-            on qd.table_id = c.oid
-        where qd.step_name = 'insert'
-        and (
-            {%- for relation in relations -%}
-                (
-                    upper(ns.nspname) = upper('{{ relation.schema }}')
-                and upper(c.relname) = upper('{{ relation.identifier }}')
-                )
-                {%- if not loop.last %} or {% endif -%}
-            {%- endfor -%}
-        )
-        group by 1, 2, 4
+        left join writes
+            on writes.table_id = c.oid
+        where {{ redshift__relation_filter_sql('ns.nspname', 'c.relname', relations) }}
     {%- endcall -%}
 
     {{ return(load_result('last_modified')) }}
 
 {% endmacro %}
+
+
+{% macro redshift__relation_oids_sql(relations) -%}
+    select c.oid
+    from pg_class c
+    join pg_namespace ns
+        on ns.oid = c.relnamespace
+    where {{ redshift__relation_filter_sql('ns.nspname', 'c.relname', relations) }}
+{%- endmacro %}
+
+
+{% macro redshift__relation_last_writes_sys_query_detail_sql(relations, lookback_days=none) -%}
+    {#-- available on provisioned clusters and serverless #}
+    select table_id, max(start_time) as last_modified
+    from sys_query_detail
+    where step_name = 'insert'
+    and table_id in ({{ redshift__relation_oids_sql(relations) }})
+    {% if lookback_days is not none -%}
+    and start_time >= dateadd(day, -{{ lookback_days | int }}, getdate())
+    {% endif -%}
+    group by 1
+{%- endmacro %}
+
+
+{% macro redshift__relation_last_writes_stl_insert_sql(relations, lookback_days=none) -%}
+    {#-- provisioned clusters only, holds a few days of history #}
+    select tbl as table_id, max(endtime) as last_modified
+    from stl_insert
+    where tbl in ({{ redshift__relation_oids_sql(relations) }})
+    {% if lookback_days is not none -%}
+    and starttime >= dateadd(day, -{{ lookback_days | int }}, getdate())
+    {% endif -%}
+    group by 1
+{%- endmacro %}
+
+
+{% macro redshift__collect_freshness_batch(checks) %}
+    {#-- One branch per loaded_at_field check, see RedshiftAdapter.calculate_freshness_batch.
+      -- max_loaded_at is converted to a UTC timestamp so that the branches union, as dbt reads
+      -- timestamps without a time zone as UTC. #}
+    {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+        select
+            source_index,
+            max_loaded_at,
+            {{ current_timestamp() }} as snapshotted_at
+        from (
+            {%- for check in checks %}
+            select
+                {{ loop.index0 }} as source_index,
+                convert_timezone('UTC', max({{ check.loaded_at_field }})) as max_loaded_at
+            from {{ check.source }}
+            {% if check.filter -%}
+            where {{ check.filter }}
+            {% endif -%}
+            {% if not loop.last %}union all{% endif %}
+            {%- endfor %}
+        ) freshness
+    {%- endcall %}
+    {{ return(load_result('collect_freshness_batch')) }}
+{% endmacro %}
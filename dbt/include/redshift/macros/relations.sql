@@ -1,4 +1,4 @@
-{% macro redshift__get_relations() -%}
+{% macro redshift__get_relations(schemas=none) -%}
 
 {%- call statement('relations', fetch_result=True) -%}
 
@@ -37,9 +37,36 @@ join relation ref
     on dependency.ref_relation_id = ref.relation_id
 join relation dep
     on dependency.dep_relation_id = dep.relation_id
+{%- if schemas is not none %}
+where lower(dep.schema_name) in ({%- for schema in schemas -%}'{{ schema }}'{%- if not loop.last %}, {% endif -%}{%- endfor -%})
+   or lower(ref.schema_name) in ({%- for schema in schemas -%}'{{ schema }}'{%- if not loop.last %}, {% endif -%}{%- endfor -%})
+{%- endif %}
 
 {%- endcall -%}
 
 {{ return(load_result('relations').table) }}
 
 {% endmacro %}
+
+
+{% macro redshift__get_relation_cache_markers() -%}
+
+{%- call statement('relation_cache_markers', fetch_result=True) -%}
+
+select
+    pg_namespace.nspname as schema_name,
+    count(pg_class.oid) as relation_count,
+    coalesce(max(pg_class.oid::bigint), 0) as max_oid
+from pg_namespace
+left join pg_class
+  on pg_class.relnamespace = pg_namespace.oid
+  and pg_class.relkind in ('r', 'v')
+where pg_namespace.nspname != 'information_schema'
+  and pg_namespace.nspname not like 'pg\_%'
+group by 1
+
+{%- endcall -%}
+
+{{ return(load_result('relation_cache_markers').table) }}
+
+{% endmacro %}
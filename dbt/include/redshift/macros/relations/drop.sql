@@ -0,0 +1,42 @@
+{% macro redshift__drop_leaf_relation(relation) -%}
+    {#-- Drop a relation that nothing depends on. Without cascade, the drop cannot reach
+      -- other relations and does not need to run in a fresh transaction. #}
+    {%- if not (relation.is_view or relation.is_table or relation.is_materialized_view) -%}
+        {% do exceptions.raise_compiler_error('Cannot drop ' ~ relation ~ ' of type ' ~ relation.type ~ ' without cascade') %}
+    {%- endif -%}
+    {{- log('Applying DROP to: ' ~ relation) -}}
+    {% call statement('drop_relation', auto_begin=False) -%}
+        {%- if relation.is_view -%}
+            {{ redshift__drop_view(relation, cascade=false) }}
+        {%- elif relation.is_table -%}
+            {{ redshift__drop_table(relation, cascade=false) }}
+        {%- else -%}
+            {{ redshift__drop_materialized_view(relation, cascade=false) }}
+        {%- endif -%}
+    {%- endcall %}
+{%- endmacro %}
+
+
+{% macro redshift__get_relation_dependent_count(relation) -%}
+
+{%- call statement('relation_dependent_count', fetch_result=True, auto_begin=False) -%}
+
+select count(*) as dependent_count
+from pg_depend
+left join pg_rewrite
+  on pg_depend.objid = pg_rewrite.oid
+join pg_class dep
+  on coalesce(pg_rewrite.ev_class, pg_depend.objid) = dep.oid
+join pg_class ref
+  on pg_depend.refobjid = ref.oid
+join pg_namespace ref_schema
+  on ref.relnamespace = ref_schema.oid
+where dep.oid != ref.oid
+  and lower(ref_schema.nspname) = '{{ relation.schema | lower }}'
+  and lower(ref.relname) = '{{ relation.identifier | lower }}'
+
+{%- endcall -%}
+
+{{ return(load_result('relation_dependent_count').table) }}
+
+{% endmacro %}
@@ -55,3 +55,80 @@
     })%}
 
 {% endmacro %}
+
+
+{% macro redshift__describe_materialized_views(schemas) %}
+    {#-
+        Describe every materialized view in `schemas` of the target database, with one query per
+        metadata source like `redshift__describe_materialized_view`. The adapter splits the rows
+        into one description per materialized view, see MaterializedViewDescriptions.
+    -#}
+
+    {%- set _schema_filter -%}
+        {%- for schema in schemas -%}
+            '{{ schema | lower }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+    {%- endset %}
+
+    {%- set _materialized_views_sql -%}
+        select
+            tb.database,
+            tb.schema,
+            tb.table,
+            tb.diststyle,
+            tb.sortkey1,
+            mv.autorefresh
+        from svv_table_info tb
+        join svv_mv_info mv
+            on mv.database_name = tb.database
+            and mv.schema_name = tb.schema
+            and mv.name = tb.table
+        where lower(tb.schema) in ({{ _schema_filter }})
+        and tb.database ilike '{{ target.database }}'
+    {%- endset %}
+    {% set _materialized_views = run_query(_materialized_views_sql) %}
+
+    {%- set _column_descriptors_sql -%}
+        SELECT
+            n.nspname as schema,
+            c.relname as internal_table,
+            a.attname as column,
+            a.attisdistkey as is_dist_key,
+            a.attsortkeyord as sort_key_position
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = c.oid
+        WHERE
+            lower(n.nspname) in ({{ _schema_filter }})
+            AND c.relname LIKE 'mv_tbl__%'
+    {%- endset %}
+    {% set _column_descriptors = run_query(_column_descriptors_sql) %}
+
+    {#-- only the definitions of the materialized views found above are read -#}
+    {%- set _view_filter -%}
+        {%- for mv in _materialized_views -%}
+            (lower(vw.schemaname) = '{{ mv.schema | lower }}' and lower(vw.viewname) = '{{ mv.table | lower }}')
+            {%- if not loop.last %} or {% endif -%}
+        {%- else -%}
+            false
+        {%- endfor -%}
+    {%- endset %}
+
+    {%- set _queries_sql -%}
+        select
+            vw.schemaname as schema,
+            vw.viewname as name,
+            vw.definition
+        from pg_views vw
+        where ({{ _view_filter }})
+        and vw.definition ilike '%create materialized view%'
+    {%- endset %}
+    {% set _queries = run_query(_queries_sql) %}
+
+    {% do return({
+       'materialized_views': _materialized_views,
+       'queries': _queries,
+       'columns': _column_descriptors,
+    })%}
+
+{% endmacro %}
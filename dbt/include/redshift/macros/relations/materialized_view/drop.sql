@@ -1,3 +1,3 @@
-{% macro redshift__drop_materialized_view(relation) -%}
-    drop materialized view if exists {{ relation }} cascade
+{% macro redshift__drop_materialized_view(relation, cascade=true) -%}
+    drop materialized view if exists {{ relation }}{% if cascade %} cascade{% endif %}
 {%- endmacro %}
@@ -1,3 +1,72 @@
 {% macro redshift__refresh_materialized_view(relation) -%}
+    {#-- A materialized view whose base tables did not change since its last refresh is current,
+      -- so its refresh is skipped unless the model sets `always_refresh`. An empty statement is
+      -- reported by the materialization as a skip. -#}
+    {%- set refresh_state = none -%}
+    {%- if not config.get('always_refresh', false) -%}
+        {%- set refresh_state = adapter.get_materialized_view_refresh_state(relation) -%}
+    {%- endif -%}
+    {%- if refresh_state is not none and not refresh_state.is_stale -%}
+        {{- log("Skipping the refresh of " ~ relation ~ ", it is current", info=true) -}}
+    {%- else -%}
+        {%- if refresh_state is not none -%}
+            {{- log("Refreshing " ~ relation ~ " (" ~ refresh_state.refresh_kind ~ ")", info=true) -}}
+        {%- endif %}
     refresh materialized view {{ relation }}
+    {%- endif -%}
+{% endmacro %}
+
+
+{% macro redshift__get_materialized_view_refresh_state(relation) %}
+    {#-- svv_mv_info is queryable by Redshift Serverless, but stv_mv_info is not #}
+    {% call statement('get_materialized_view_refresh_state', fetch_result=True) %}
+        select
+            mv.is_stale,
+            mv.state
+        from svv_mv_info mv
+        where mv.name ilike '{{ relation.identifier }}'
+        and mv.schema_name ilike '{{ relation.schema }}'
+        and mv.database_name ilike '{{ relation.database }}'
+    {% endcall %}
+    {{ return(load_result('get_materialized_view_refresh_state').table) }}
+{% endmacro %}
+
+
+{% macro redshift__get_wlm_concurrency() %}
+    {#-- The slots of the largest manual WLM queue, null with automatic WLM where the user
+      -- queues report -1. Service classes below 6 are reserved for the system. -#}
+    {% call statement('get_wlm_concurrency', fetch_result=True) %}
+        select max(num_query_tasks)
+        from stv_wlm_service_class_config
+        where service_class >= 6
+        and num_query_tasks > 0
+    {% endcall %}
+    {{ return(load_result('get_wlm_concurrency').table) }}
+{% endmacro %}
+
+
+{% macro refresh_materialized_views(schemas=none, max_concurrency=none) %}
+    {#-- Refresh the materialized views of `schemas`, the target schema by default, in dependency
+      -- order and otherwise in parallel, for instance with
+      --   dbt run-operation refresh_materialized_views --args '{schemas: [marts]}' -#}
+    {% set results = adapter.refresh_materialized_views(schemas, max_concurrency) %}
+    {{ log(
+        "Refreshed " ~ results['refreshed'] | length ~ " materialized view(s) in "
+        ~ "%.1f" | format(results['wall_time']) ~ "s on up to " ~ results['max_concurrency']
+        ~ " connection(s), " ~ "%.1f" | format(results['time_saved']) ~ "s faster than "
+        ~ "refreshing them one after another (" ~ "%.1f" | format(results['serial_time']) ~ "s)",
+        info=true
+    ) }}
+    {% for relation, error in results['failed'].items() %}
+        {{ log("Could not refresh " ~ relation ~ ": " ~ error, info=true) }}
+    {% endfor %}
+    {% if results['skipped'] %}
+        {{ log("Skipped the dependents of failed refreshes: " ~ results['skipped'] | join(", "), info=true) }}
+    {% endif %}
+    {% if results['failed'] %}
+        {{ exceptions.raise_compiler_error(
+            "Could not refresh " ~ results['failed'] | length ~ " materialized view(s)"
+        ) }}
+    {% endif %}
+    {{ return(results) }}
 {% endmacro %}
@@ -0,0 +1,78 @@
+{% macro redshift__get_table_configuration_changes(existing_relation, new_config) %}
+    {#-- models without dist and sort leave the table alone, without describing it -#}
+    {% if not new_config.get('dist') and not new_config.get('sort') %}
+        {% do return(none) %}
+    {% endif %}
+    {% set _existing_table = redshift__describe_table(existing_relation) %}
+    {% set _configuration_changes = existing_relation.table_config_changeset(_existing_table, new_config.model) %}
+    {% do return(_configuration_changes) %}
+{% endmacro %}
+
+
+{% macro redshift__get_alter_table_configuration_sql(relation, configuration_changes) %}
+    {#-- One statement per change, Redshift alters a single property of a table at a time -#}
+    {%- set statements = [] -%}
+
+    {%- set dist = configuration_changes.dist -%}
+    {%- if dist -%}
+        {%- if dist.context.diststyle == 'key' -%}
+            {%- do statements.append('alter table ' ~ relation ~ ' alter diststyle key distkey ' ~ dist.context.distkey) -%}
+        {%- else -%}
+            {%- do statements.append('alter table ' ~ relation ~ ' alter diststyle ' ~ dist.context.diststyle) -%}
+        {%- endif -%}
+    {%- endif -%}
+
+    {%- set sort = configuration_changes.sort -%}
+    {%- if sort -%}
+        {%- if sort.context.sortstyle == 'auto' -%}
+            {%- do statements.append('alter table ' ~ relation ~ ' alter sortkey auto') -%}
+        {%- else -%}
+            {%- do statements.append('alter table ' ~ relation ~ ' alter compound sortkey (' ~ sort.context.sortkey | join(', ') ~ ')') -%}
+        {%- endif -%}
+    {%- endif -%}
+
+    {% do return(statements) %}
+{% endmacro %}
+
+
+{% macro redshift__apply_table_configuration_changes(existing_relation, config) %}
+    {#-
+        Bring the dist and sort of an incremental model's table in line with its config, following
+        `on_configuration_change` like materialized views do. Returns whether the table has to be
+        rebuilt instead, for changes Redshift cannot apply in place.
+
+        Redshift does not alter the dist or sort of a table inside a transaction block, so this
+        runs before the model's transaction begins, and commits whatever transaction is still
+        open. Without autocommit the table is rebuilt.
+    -#}
+    {% set _configuration_changes = redshift__get_table_configuration_changes(existing_relation, config) %}
+    {% if _configuration_changes is none %}
+        {% do return(false) %}
+    {% endif %}
+
+    {% set on_configuration_change = config.get('on_configuration_change') %}
+    {% if on_configuration_change == 'continue' %}
+        {{ exceptions.warn("Configuration changes were identified and `on_configuration_change` was set to `continue` for `" ~ existing_relation.render() ~ "`") }}
+        {% do return(false) %}
+    {% elif on_configuration_change == 'fail' %}
+        {{ exceptions.raise_fail_fast_error("Configuration changes were identified and `on_configuration_change` was set to `fail` for `" ~ existing_relation.render() ~ "`") }}
+    {% endif %}
+
+    {% if _configuration_changes.requires_full_refresh %}
+        {{ log("Rebuilding " ~ existing_relation ~ ", Redshift cannot change its dist or sort in place", info=true) }}
+        {% do return(true) %}
+    {% endif %}
+
+    {% if not adapter.leave_transaction_block() %}
+        {{ log("Rebuilding " ~ existing_relation ~ ", Redshift cannot change its dist or sort in place without autocommit", info=true) }}
+        {% do return(true) %}
+    {% endif %}
+
+    {% for _alter_sql in redshift__get_alter_table_configuration_sql(existing_relation, _configuration_changes) %}
+        {{ log('Applying ' ~ _alter_sql) }}
+        {% call statement('alter_table_configuration', auto_begin=False) %}
+            {{ _alter_sql }}
+        {% endcall %}
+    {% endfor %}
+    {% do return(false) %}
+{% endmacro %}
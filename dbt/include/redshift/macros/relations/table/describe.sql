@@ -0,0 +1,39 @@
+{% macro redshift__describe_table(relation) %}
+    {#-
+        The dist and sort configuration of a table, compared by incremental models to their
+        config. Like `redshift__describe_materialized_view`, svv_table_info is queried on its own.
+        It does not list tables without data, so the dist style comes from pg_class.
+    -#}
+
+    {%- set _table_sql -%}
+        select
+            tb.sortkey1
+        from svv_table_info tb
+        where lower(tb.table) = '{{ relation.identifier | lower }}'
+        and lower(tb.schema) = '{{ relation.schema | lower }}'
+        and lower(tb.database) = '{{ relation.database | lower }}'
+    {%- endset %}
+    {% set _table = run_query(_table_sql) %}
+
+    {%- set _column_descriptor_sql -%}
+        SELECT
+            a.attname as column,
+            c.reldiststyle as diststyle,
+            a.attisdistkey as is_dist_key,
+            a.attsortkeyord as sort_key_position
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = c.oid
+        WHERE
+            lower(n.nspname) = '{{ relation.schema | lower }}'
+            AND lower(c.relname) = '{{ relation.identifier | lower }}'
+            AND a.attnum > 0
+    {%- endset %}
+    {% set _column_descriptor = run_query(_column_descriptor_sql) %}
+
+    {% do return({
+       'table': _table,
+       'columns': _column_descriptor,
+    })%}
+
+{% endmacro %}
@@ -1,3 +1,3 @@
-{%- macro redshift__drop_table(relation) -%}
-    drop table if exists {{ relation }} cascade
+{%- macro redshift__drop_table(relation, cascade=true) -%}
+    drop table if exists {{ relation }}{% if cascade %} cascade{% endif %}
 {%- endmacro -%}
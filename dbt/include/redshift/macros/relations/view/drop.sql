@@ -1,3 +1,3 @@
-{%- macro redshift__drop_view(relation) -%}
-    drop view if exists {{ relation }} cascade
+{%- macro redshift__drop_view(relation, cascade=true) -%}
+    drop view if exists {{ relation }}{% if cascade %} cascade{% endif %}
 {%- endmacro -%}
@@ -0,0 +1,153 @@
+"""
+Compare the agate join used to assemble the catalog with the hash join of CatalogAssembler, on
+synthetic catalogs.
+
+    python scripts/benchmark_catalog_merge.py --relations 10000 100000 --columns 8 --shards 4
+
+Timing the agate join on 100k relations takes a while, --skip-agate only times the assembler.
+
+Both sides start from raw cursor rows: the agate side builds the tables the statement blocks
+used to return, joins them and filters and merges the shards; the assembler side goes straight
+to the final table.
+"""
+
+import argparse
+import time
+import tracemalloc
+from decimal import Decimal
+
+from dbt_common.clients.agate_helper import merge_tables, table_from_data_flat
+
+from dbt.adapters.base import BaseAdapter
+from dbt.adapters.redshift.catalog import CatalogAssembler, CatalogRows
+from dbt.adapters.sql.connections import SQLConnectionManager
+
+BASE_COLUMNS = [
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "column_name",
+    "column_index",
+    "column_type",
+    "column_comment",
+    "table_owner",
+]
+STATS = [
+    "encoded",
+    "diststyle",
+    "sortkey1",
+    "max_varchar",
+    "sortkey1_enc",
+    "sortkey_num",
+    "size",
+    "pct_used",
+    "unsorted",
+    "stats_off",
+    "rows",
+    "skew_sortkey1",
+    "skew_rows",
+]
+EXTENDED_COLUMNS = ["table_schema", "table_name"] + [
+    f"stats:{stat}:{part}"
+    for stat in STATS
+    for part in ("label", "value", "description", "include")
+]
+SCHEMAS = 20
+
+
+def make_shards(relations, columns, shards):
+    """Split a synthetic catalog of `relations` tables into `shards` base and extended rows."""
+    result = []
+    for shard in range(shards):
+        base, extended = [], []
+        for index in range(shard, relations, shards):
+            schema, name = f"schema_{index % SCHEMAS}", f"table_{index}"
+            for column in range(1, columns + 1):
+                base.append(
+                    (
+                        "dev",
+                        schema,
+                        name,
+                        "BASE TABLE",
+                        None,
+                        f"column_{column}",
+                        column,
+                        "character varying(256)",
+                        None,
+                        "dbt",
+                    )
+                )
+            # like svv_table_info, views have no stats
+            if index % 4:
+                stats = []
+                for stat in STATS:
+                    stats.extend((stat, Decimal(index), f"about {stat}", True))
+                extended.append((schema, name, *stats))
+        result.append((CatalogRows(BASE_COLUMNS, base), CatalogRows(EXTENDED_COLUMNS, extended)))
+    return result
+
+
+def with_agate(shards, used_schemas):
+    catalogs = []
+    for base, extended in shards:
+        base_table = table_from_data_flat(
+            SQLConnectionManager.process_results(list(base.column_names), base.rows),
+            base.column_names,
+        )
+        extended_table = table_from_data_flat(
+            SQLConnectionManager.process_results(list(extended.column_names), extended.rows),
+            extended.column_names,
+        )
+        catalog = base_table.join(extended_table, ["table_schema", "table_name"])
+        catalogs.append(BaseAdapter._catalog_filter_table(catalog, used_schemas))
+    return merge_tables(catalogs)
+
+
+def with_assembler(shards, used_schemas):
+    catalog = CatalogAssembler(used_schemas)
+    for base, extended in shards:
+        catalog.add(base, extended)
+    return catalog.to_table()
+
+
+def measure(assemble, shards, used_schemas, trace_memory):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    table = assemble(shards, used_schemas)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return table, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--relations", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--columns", type=int, default=8, help="columns per relation")
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--skip-agate", action="store_true", help="only time the assembler")
+    parser.add_argument(
+        "--memory", action="store_true", help="trace peak memory too, which slows both down"
+    )
+    args = parser.parse_args()
+
+    used_schemas = frozenset(("dev", f"schema_{schema}") for schema in range(SCHEMAS))
+    print(f"{'relations':>10} {'rows':>10} {'method':>10} {'seconds':>10} {'peak MiB':>10}")
+    for relations in args.relations:
+        shards = make_shards(relations, args.columns, args.shards)
+        methods = [("assembler", with_assembler)]
+        if not args.skip_agate:
+            methods.insert(0, ("agate", with_agate))
+        for name, assemble in methods:
+            table, elapsed, peak = measure(assemble, shards, used_schemas, args.memory)
+            memory = f"{peak / 2**20:>10.1f}" if peak is not None else f"{'-':>10}"
+            print(f"{relations:>10} {len(table.rows):>10} {name:>10} {elapsed:>10.2f} {memory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import json
+import os
+
+from dbt.contracts.results import CatalogArtifact
+from dbt.tests.util import run_dbt, run_dbt_and_capture
+import pytest
+
+from tests.functional.adapter.catalog_tests import files
+
+
+MACROS__OVERRIDE_GET_CATALOG = """
+{% macro redshift__get_catalog(information_schema, schemas) %}
+    {{ log("Building the catalog with the project macro", info=True) }}
+    {{ return(_redshift__get_base_catalog_by_schema(information_schema.database, schemas)) }}
+{% endmacro %}
+
+{% macro redshift__get_catalog_relations(information_schema, relations) %}
+    {{ log("Building the catalog with the project macro", info=True) }}
+    {{ return(_redshift__get_base_catalog_by_relation(information_schema.database, relations)) }}
+{% endmacro %}
+"""
+
+
+class CatalogOptionsBase:
+    @pytest.fixture(scope="class", autouse=True)
+    def seeds(self):
+        return {"my_seed.csv": files.MY_SEED}
+
+    @pytest.fixture(scope="class", autouse=True)
+    def models(self):
+        yield {
+            "my_table.sql": files.MY_TABLE,
+            "my_view.sql": files.MY_VIEW,
+            "my_materialized_view.sql": files.MY_MATERIALIZED_VIEW,
+        }
+
+    @pytest.fixture(scope="class", autouse=True)
+    def setup(self, project):
+        run_dbt(["seed"])
+        run_dbt(["run"])
+
+    @staticmethod
+    def relation_types(catalog: CatalogArtifact):
+        return {node.metadata.name: node.metadata.type for node in catalog.nodes.values()}
+
+
+class TestCatalogShards(CatalogOptionsBase):
+    """The materialized views are selected apart from the leader-node catalog tables"""
+
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self, dbt_profile_target):
+        return {**dbt_profile_target, "threads": 4}
+
+    def test_relation_types_across_shards(self, project):
+        catalog = run_dbt(["docs", "generate"])
+        assert self.relation_types(catalog) == {
+            "my_seed": "BASE TABLE",
+            "my_table": "BASE TABLE",
+            "my_view": "VIEW",
+            "my_materialized_view": "MATERIALIZED VIEW",
+        }
+        assert "rows" in catalog.nodes["model.test.my_table"].stats
+
+
+class TestCatalogColumnsTier(CatalogOptionsBase):
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self, dbt_profile_target):
+        return {**dbt_profile_target, "catalog_tier": "columns"}
+
+    def test_columns_tier_leaves_out_stats_and_owners(self, project):
+        catalog = run_dbt(["docs", "generate"])
+        table = catalog.nodes["model.test.my_table"]
+        assert table.metadata.type == "BASE TABLE"
+        assert table.metadata.owner is None
+        assert set(table.stats) == {"has_stats"}
+        assert set(table.columns) == {"id", "value", "record_valid_date"}
+        assert self.relation_types(catalog)["my_materialized_view"] == "MATERIALIZED VIEW"
+
+
+class TestIncrementalCatalog(CatalogOptionsBase):
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self, dbt_profile_target, project_root):
+        catalog_path = os.path.join(project_root, "target", "catalog.json")
+        return {**dbt_profile_target, "previous_catalog_path": catalog_path}
+
+    def test_unchanged_tables_are_reused(self, project):
+        first = run_dbt(["docs", "generate"])
+        markers_path = os.path.join(project.project_root, "target", "catalog.json.markers.json")
+        with open(markers_path) as fp:
+            markers = json.load(fp)["markers"]
+        assert f"{project.test_schema}.my_table".lower() in markers
+
+        _, logs = run_dbt_and_capture(["--debug", "docs", "generate"])
+        assert "Reusing 4 table(s) of the previous catalog, querying 0" in logs
+
+        second = CatalogArtifact.read_and_check_versions(
+            os.path.join(project.project_root, "target", "catalog.json")
+        )
+        assert self.relation_types(second) == self.relation_types(first)
+        assert second.nodes["model.test.my_table"].columns.keys() == (
+            first.nodes["model.test.my_table"].columns.keys()
+        )
+
+    def test_changed_tables_are_queried(self, project):
+        run_dbt(["docs", "generate"])
+        project.run_sql(f"alter table {project.test_schema}.my_table add column extra integer")
+
+        _, logs = run_dbt_and_capture(["--debug", "docs", "generate"])
+        assert "Reusing 3 table(s) of the previous catalog, querying 1" in logs
+
+        catalog = CatalogArtifact.read_and_check_versions(
+            os.path.join(project.project_root, "target", "catalog.json")
+        )
+        assert "extra" in catalog.nodes["model.test.my_table"].columns
+
+
+class TestOverriddenCatalogMacros(CatalogOptionsBase):
+    @pytest.fixture(scope="class")
+    def macros(self):
+        return {"catalog.sql": MACROS__OVERRIDE_GET_CATALOG}
+
+    def test_project_catalog_macros_are_kept(self, project):
+        _, logs = run_dbt_and_capture(["docs", "generate"])
+        assert "Building the catalog with the project macro" in logs
@@ -0,0 +1,138 @@
+import pytest
+
+from dbt.tests.util import get_model_file, run_dbt, run_dbt_and_capture, set_model_file
+
+from tests.functional.adapter.materialized_view_tests.utils import query_dist, query_sort
+
+
+MY_INCREMENTAL_MODEL = """
+{{ config(
+    materialized='incremental',
+    on_configuration_change='apply',
+    dist='id',
+    sort=['id'],
+) }}
+select 1 as id, 10 as value
+"""
+
+
+MY_TABLE = """
+{{ config(materialized='table') }}
+select 1 as id, 'a'::varchar(10) as name, 2 as other
+"""
+
+
+MY_SYNCED_INCREMENTAL_MODEL = """
+{{ config(
+    materialized='incremental',
+    on_schema_change='sync_all_columns',
+) }}
+select 1 as id, 'a'::varchar(10) as name, 2 as other
+"""
+
+
+MACROS__WIDEN_COLUMN = """
+{% macro widen_column(identifier, column_name, new_column_type) %}
+    {#-- not looked up, which would begin a transaction and leave the copy as the only way -#}
+    {% set relation = api.Relation.create(
+        database=target.database, schema=target.schema, identifier=identifier, type='table'
+    ) %}
+    {% do alter_column_type(relation, column_name, new_column_type) %}
+{% endmacro %}
+"""
+
+
+def query_column(project, identifier, column_name):
+    sql = f"""
+        select ordinal_position, character_maximum_length
+        from information_schema.columns
+        where table_schema = '{project.test_schema}'
+        and table_name = '{identifier}'
+        and column_name = '{column_name}'
+    """
+    return project.run_sql(sql, fetch="one")
+
+
+class TestIncrementalDistSortInPlace:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"my_incremental_model.sql": MY_INCREMENTAL_MODEL}
+
+    def test_dist_and_sort_changes_keep_the_table(self, project):
+        run_dbt(["run"])
+        relation = project.adapter.Relation.create(
+            database=project.database,
+            schema=project.test_schema,
+            identifier="my_incremental_model",
+        )
+        # a rebuild would lose the rows that the model no longer selects
+        project.run_sql(f"insert into {relation} (id, value) values (2, 20)")
+
+        sql = get_model_file(project, relation)
+        set_model_file(
+            project,
+            relation,
+            sql.replace("dist='id'", "dist='value'").replace("['id']", "['value']"),
+        )
+        _, logs = run_dbt_and_capture(["run"])
+
+        assert "Rebuilding" not in logs
+        assert query_dist(project, relation) == "KEY(value)"
+        assert query_sort(project, relation) == "value"
+        assert project.run_sql(f"select count(*) from {relation}", fetch="one")[0] == 3
+
+    def test_unchanged_config_is_not_altered(self, project):
+        _, logs = run_dbt_and_capture(["--debug", "run"])
+        assert "alter diststyle" not in logs
+        assert "alter compound sortkey" not in logs
+
+
+class TestColumnTypeChanges:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {
+            "my_table.sql": MY_TABLE,
+            "my_synced_incremental_model.sql": MY_SYNCED_INCREMENTAL_MODEL,
+        }
+
+    @pytest.fixture(scope="class")
+    def macros(self):
+        return {"widen_column.sql": MACROS__WIDEN_COLUMN}
+
+    def test_varchar_columns_are_widened_in_place(self, project):
+        run_dbt(["run", "--select", "my_table"])
+
+        run_dbt(
+            [
+                "run-operation",
+                "widen_column",
+                "--args",
+                "{identifier: my_table, column_name: name, new_column_type: varchar(256)}",
+            ]
+        )
+
+        # a copied column would move to the end of the table
+        assert tuple(query_column(project, "my_table", "name")) == (2, 256)
+
+    def test_incremental_models_widen_and_sync_their_columns(self, project):
+        run_dbt(["run", "--select", "my_synced_incremental_model"])
+        relation = project.adapter.Relation.create(
+            database=project.database,
+            schema=project.test_schema,
+            identifier="my_synced_incremental_model",
+        )
+        sql = get_model_file(project, relation)
+        set_model_file(
+            project,
+            relation,
+            sql.replace(
+                "'a'::varchar(10) as name, 2 as other", "'abc'::varchar(64) as name, 3 as added"
+            ),
+        )
+
+        run_dbt(["run", "--select", "my_synced_incremental_model"])
+
+        assert query_column(project, "my_synced_incremental_model", "name")[1] == 64
+        assert query_column(project, "my_synced_incremental_model", "added") is not None
+        assert query_column(project, "my_synced_incremental_model", "other") is None
+        assert project.run_sql(f"select count(*) from {relation}", fetch="one")[0] == 2
@@ -0,0 +1,87 @@
+import pytest
+
+from dbt.tests.adapter.materialized_view.files import MY_SEED
+from dbt.tests.util import get_model_file, run_dbt, run_dbt_and_capture, set_model_file
+
+from tests.functional.adapter.materialized_view_tests.utils import (
+    query_dist,
+    run_dbt_and_capture_with_retries_redshift_mv,
+)
+
+MY_MATERIALIZED_VIEW = """
+{{ config(
+    materialized='materialized_view',
+    dist='id',
+) }}
+select * from {{ ref('my_seed') }}
+"""
+
+
+MY_OTHER_MATERIALIZED_VIEW = """
+{{ config(
+    materialized='materialized_view',
+    dist='id',
+) }}
+select id, value * 2 as value from {{ ref('my_seed') }}
+"""
+
+
+class MaterializedViewRefreshBase:
+    @pytest.fixture(scope="class", autouse=True)
+    def seeds(self):
+        return {"my_seed.csv": MY_SEED}
+
+    @pytest.fixture(scope="class", autouse=True)
+    def models(self):
+        yield {
+            "my_materialized_view.sql": MY_MATERIALIZED_VIEW,
+            "my_other_materialized_view.sql": MY_OTHER_MATERIALIZED_VIEW,
+        }
+
+    @pytest.fixture(scope="class", autouse=True)
+    def setup(self, project):
+        run_dbt(["seed"])
+        run_dbt(["run"])
+
+    @staticmethod
+    def relation(project, identifier):
+        return project.adapter.Relation.create(
+            database=project.database, schema=project.test_schema, identifier=identifier
+        )
+
+
+class TestMaterializedViewRefresh(MaterializedViewRefreshBase):
+    def test_current_materialized_views_are_not_refreshed(self, project):
+        _, logs = run_dbt_and_capture(["run", "--select", "my_materialized_view"])
+        assert "Skipping the refresh of" in logs
+
+    def test_stale_materialized_views_are_refreshed(self, project):
+        seed = self.relation(project, "my_seed")
+        project.run_sql(f"insert into {seed} (id, value) values (4, 400)")
+
+        _, logs = run_dbt_and_capture(["run", "--select", "my_materialized_view"])
+        assert "Skipping the refresh of" not in logs
+        materialized_view = self.relation(project, "my_materialized_view")
+        assert project.run_sql(f"select count(*) from {materialized_view}", fetch="one")[0] == 4
+
+    def test_refresh_materialized_views_operation(self, project):
+        _, logs = run_dbt_and_capture(["run-operation", "refresh_materialized_views"])
+        assert "Refreshed 2 materialized view(s)" in logs
+
+
+class TestMaterializedViewDescribeInBulk(MaterializedViewRefreshBase):
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {"models": {"on_configuration_change": "apply"}}
+
+    def test_changes_of_every_materialized_view_are_applied(self, project):
+        for identifier in ("my_materialized_view", "my_other_materialized_view"):
+            sql = get_model_file(project, self.relation(project, identifier))
+            set_model_file(
+                project, self.relation(project, identifier), sql.replace("dist='id',", "")
+            )
+
+        run_dbt_and_capture_with_retries_redshift_mv(["run"])
+
+        for identifier in ("my_materialized_view", "my_other_materialized_view"):
+            assert query_dist(project, self.relation(project, identifier)) == "EVEN"
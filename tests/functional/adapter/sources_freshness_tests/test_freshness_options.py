@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from dbt.tests.util import run_dbt, run_dbt_and_capture
+
+from tests.functional.adapter.sources_freshness_tests.test_get_relation_last_modified import (
+    SetupGetLastRelationModified,
+)
+
+
+freshness_options_schema_yml = """
+sources:
+  - name: test_source
+    freshness:
+      warn_after: {count: 10, period: hour}
+      error_after: {count: 1, period: day}
+    schema: "{{ env_var('DBT_GET_LAST_RELATION_TEST_SCHEMA') }}"
+    tables:
+      - name: written_table
+      - name: unwritten_table
+      - name: loaded_at_table_1
+        loaded_at_field: loaded_at
+      - name: loaded_at_table_2
+        loaded_at_field: loaded_at
+      - name: stale_loaded_at_table
+        loaded_at_field: loaded_at
+"""
+
+
+class FreshnessOptionsBase(SetupGetLastRelationModified):
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"schema.yml": freshness_options_schema_yml}
+
+    @pytest.fixture(scope="class", autouse=True)
+    def source_tables(self, project, set_env_vars):
+        schema = os.environ["DBT_GET_LAST_RELATION_TEST_SCHEMA"]
+        project.run_sql(f"create table {schema}.written_table (id int)")
+        project.run_sql(f"insert into {schema}.written_table values (1)")
+        project.run_sql(f"create table {schema}.unwritten_table (id int)")
+        for name in ("loaded_at_table_1", "loaded_at_table_2"):
+            project.run_sql(
+                f"create table {schema}.{name} as (select 1 as id, getdate() as loaded_at)"
+            )
+        project.run_sql(
+            f"create table {schema}.stale_loaded_at_table as "
+            f"(select 1 as id, timestamp '2009-09-15 10:59:43' as loaded_at)"
+        )
+
+    @staticmethod
+    def statuses(results):
+        return {result.node.name: str(result.status) for result in results}
+
+
+class TestLastModifiedOptions(FreshnessOptionsBase):
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self, dbt_profile_target):
+        return {
+            **dbt_profile_target,
+            "last_modified_source": "stl_insert",
+            "last_modified_lookback_days": 7,
+        }
+
+    def test_writes_are_read_from_the_configured_source(self, project):
+        results = run_dbt(
+            ["source", "freshness", "--select", "source:test_source"], expect_pass=False
+        )
+        statuses = self.statuses(results)
+        assert statuses["written_table"] == "pass"
+        # never inserted into within the lookback window, so infinitely stale
+        assert statuses["unwritten_table"] == "error"
+
+
+class TestFreshnessBatchWindow(FreshnessOptionsBase):
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self, dbt_profile_target):
+        return {**dbt_profile_target, "threads": 4, "freshness_batch_window": 0.5}
+
+    @pytest.mark.flaky
+    def test_loaded_at_field_checks_are_batched(self, project):
+        results, logs = run_dbt_and_capture(
+            ["--debug", "source", "freshness", "--select", "source:test_source"],
+            expect_pass=False,
+        )
+        statuses = self.statuses(results)
+        assert statuses["loaded_at_table_1"] == "pass"
+        assert statuses["loaded_at_table_2"] == "pass"
+        assert statuses["stale_loaded_at_table"] == "error"
+        # the checks started together are computed by one union all query
+        assert "as source_index" in logs
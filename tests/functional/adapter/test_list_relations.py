@@ -0,0 +1,70 @@
+import os
+
+from dbt.tests.util import get_connection, run_dbt
+import pytest
+
+from tests.functional.adapter.catalog_tests import files
+
+
+class ListRelationsBase:
+    @pytest.fixture(scope="class", autouse=True)
+    def seeds(self):
+        return {"my_seed.csv": files.MY_SEED}
+
+    @pytest.fixture(scope="class", autouse=True)
+    def models(self):
+        yield {
+            "my_table.sql": files.MY_TABLE,
+            "my_view.sql": files.MY_VIEW,
+            "my_materialized_view.sql": files.MY_MATERIALIZED_VIEW,
+        }
+
+    @pytest.fixture(scope="class", autouse=True)
+    def setup(self, project):
+        run_dbt(["seed"])
+        run_dbt(["run"])
+
+    @staticmethod
+    def list_relation_types(project):
+        adapter = project.adapter
+        schema = adapter.Relation.create(database=project.database, schema=project.test_schema)
+        with get_connection(adapter):
+            relations = adapter.list_relations_without_caching(schema)
+        return {relation.identifier: str(relation.type) for relation in relations}
+
+
+class TestListRelations(ListRelationsBase):
+    """The materialized views are found by a query of their own, apart from pg_class"""
+
+    def test_tables_views_and_materialized_views_are_listed(self, project):
+        assert self.list_relation_types(project) == {
+            "my_seed": "table",
+            "my_table": "table",
+            "my_view": "view",
+            "my_materialized_view": "materialized_view",
+        }
+
+    def test_materialized_views_are_not_replaced_by_a_rerun(self, project):
+        # the cache built from the listing sees the materialized view, so it is not replaced
+        run_dbt(["run", "--select", "my_materialized_view"])
+        assert self.list_relation_types(project)["my_materialized_view"] == "materialized_view"
+
+
+class TestRelationCacheSnapshot(ListRelationsBase):
+    @pytest.fixture(scope="class")
+    def dbt_profile_target(self, dbt_profile_target, project_root):
+        snapshot_path = os.path.join(project_root, "target", "relation_cache.json")
+        return {**dbt_profile_target, "relation_cache_snapshot_path": snapshot_path}
+
+    def test_runs_reuse_the_snapshot(self, project):
+        snapshot_path = os.path.join(project.project_root, "target", "relation_cache.json")
+        assert os.path.exists(snapshot_path)
+
+        results = run_dbt(["run"])
+        assert len(results) == 3
+        assert self.list_relation_types(project) == {
+            "my_seed": "table",
+            "my_table": "table",
+            "my_view": "view",
+            "my_materialized_view": "materialized_view",
+        }
@@ -0,0 +1,552 @@
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+import agate
+import pytest
+
+from dbt.adapters.redshift.catalog import (
+    CatalogAssembler,
+    CatalogMarkers,
+    CatalogRows,
+    catalog_markers,
+)
+from dbt.adapters.redshift.relation import RedshiftRelation
+from dbt.adapters.redshift.utility import chunk_relations
+from dbt_common.clients.agate_helper import table_from_rows
+from dbt_common.exceptions import DbtRuntimeError
+from tests.unit.utils import make_adapter, open_fake_connection, use_internal_macros
+
+BASE_COLUMNS = ["table_database", "table_schema", "table_name", "column_name", "column_index"]
+EXTENDED_COLUMNS = ["table_schema", "table_name", "stats:rows:value"]
+
+
+class TestShardedCatalog(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter(threads=2)
+        self.relations = {
+            RedshiftRelation.create(database="dev", schema="analytics", identifier=f"table_{i}")
+            for i in range(5)
+        }
+        self.used_schemas = frozenset({("dev", "analytics")})
+
+    def _execute_macro(self, macro_name, kwargs=None, **_):
+        if macro_name == "redshift__can_select_from":
+            return True
+        if macro_name == "redshift__get_late_binding_view_columns":
+            return []
+        if macro_name == "redshift__get_materialized_views_sql":
+            return macro_name
+        # stands in for the rendered sql, see _fetch_rows
+        return " ".join([macro_name, *(r.identifier for r in kwargs["relations"])])
+
+    @staticmethod
+    def _fetch_rows(sql):
+        macro_name, *identifiers = sql.split()
+        if macro_name == "redshift__get_materialized_views_sql":
+            return ["table_schema", "table_name"], []
+        # late binding views come from the adapter's cache, not from the base query
+        identifiers = [i for i in identifiers if i != "lbv"]
+        if macro_name == "_redshift__get_base_catalog_by_relation_sql":
+            return BASE_COLUMNS, [("dev", "analytics", i, "id", 1) for i in identifiers]
+        return EXTENDED_COLUMNS, [("analytics", i, 10) for i in identifiers]
+
+    def _get_catalog_by_relations(self):
+        with mock.patch.object(
+            self.adapter.connections, "fetch_rows", side_effect=self._fetch_rows
+        ):
+            return self.adapter.get_catalog_by_relations(self.used_schemas, self.relations)
+
+    def test_catalog_is_built_in_shards_and_merged(self):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            catalog, exceptions = self._get_catalog_by_relations()
+
+        assert exceptions == []
+        assert sorted(catalog.columns["table_name"].values()) == sorted(
+            r.identifier for r in self.relations
+        )
+        assert set(catalog.columns["stats:rows:value"].values()) == {10}
+
+        shard_sizes = sorted(
+            len(call.kwargs["kwargs"]["relations"])
+            for call in mock_execute_macro.call_args_list
+            if call.args[0] == "_redshift__get_base_catalog_by_relation_sql"
+        )
+        assert shard_sizes == [2, 3]
+
+    def test_late_binding_views_are_fetched_once_for_all_shards(self):
+        lbv = RedshiftRelation.create(database="dev", schema="analytics", identifier="lbv")
+        self.relations.add(lbv)
+
+        def execute_macro(macro_name, kwargs=None, **_):
+            if macro_name == "redshift__get_late_binding_view_columns":
+                return [
+                    ("analytics", "lbv", "amount", "numeric(18,2)", 2, "dbt"),
+                    ("analytics", "lbv", "id", "integer", 1, "dbt"),
+                    ("analytics", "other_lbv", "id", "integer", 1, "dbt"),
+                ]
+            return self._execute_macro(macro_name, kwargs)
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=execute_macro
+        ) as mock_execute_macro:
+            catalog, exceptions = self._get_catalog_by_relations()
+
+        assert exceptions == []
+        fetches = [
+            call
+            for call in mock_execute_macro.call_args_list
+            if call.args[0] == "redshift__get_late_binding_view_columns"
+        ]
+        assert len(fetches) == 1
+        assert fetches[0].kwargs["kwargs"] == {"schemas": ["analytics"]}
+        base_calls = [
+            call
+            for call in mock_execute_macro.call_args_list
+            if call.args[0] == "_redshift__get_base_catalog_by_relation_sql"
+        ]
+        assert {call.kwargs["kwargs"]["late_binding"] for call in base_calls} == {False}
+
+        lbv_rows = [row for row in catalog if row["table_name"] == "lbv"]
+        assert [(row["column_name"], row["column_index"]) for row in lbv_rows] == [
+            ("id", 1),
+            ("amount", 2),
+        ]
+        assert "other_lbv" not in catalog.columns["table_name"].values()
+
+    def test_svv_table_info_privilege_is_checked_once(self):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self._get_catalog_by_relations()
+            self._get_catalog_by_relations()
+
+        probes = [
+            call
+            for call in mock_execute_macro.call_args_list
+            if call.args[0] == "redshift__can_select_from"
+        ]
+        assert len(probes) == 1
+
+    def test_overridden_catalog_macros_are_kept(self):
+        macros = {
+            "get_catalog_relations": SimpleNamespace(package_name="dbt"),
+            "redshift__get_catalog_relations": SimpleNamespace(package_name="my_project"),
+        }
+        resolver = mock.Mock()
+        resolver.find_macro_by_name.side_effect = lambda name, *_: macros.get(name)
+        self.adapter.set_macro_resolver(resolver)
+
+        with mock.patch(
+            "dbt.adapters.redshift.impl.get_adapter_package_names",
+            return_value=["dbt_redshift", "dbt_postgres", "dbt"],
+        ):
+            with mock.patch(
+                "dbt.adapters.base.impl.BaseAdapter.get_catalog_by_relations",
+                return_value=("catalog", []),
+            ) as mock_get_catalog_by_relations:
+                with mock.patch.object(self.adapter, "execute_macro") as mock_execute_macro:
+                    assert self._get_catalog_by_relations() == ("catalog", [])
+
+        mock_get_catalog_by_relations.assert_called_once_with(self.used_schemas, self.relations)
+        mock_execute_macro.assert_not_called()
+
+    def test_lower_tiers_skip_the_extended_catalog(self):
+        self.adapter = make_adapter(threads=2, catalog_tier="columns")
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            catalog, _ = self._get_catalog_by_relations()
+
+        assert "stats:rows:value" not in catalog.column_names
+        base_calls = [
+            call
+            for call in mock_execute_macro.call_args_list
+            if call.args[0]
+            not in (
+                "redshift__get_late_binding_view_columns",
+                "redshift__get_materialized_views_sql",
+            )
+        ]
+        assert {call.args[0] for call in base_calls} == {
+            "_redshift__get_base_catalog_by_relation_sql"
+        }
+        assert {call.kwargs["kwargs"]["tier"] for call in base_calls} == {"columns"}
+
+    def test_failed_shards_are_reported(self):
+        def execute_macro(macro_name, kwargs=None, **_):
+            if (
+                macro_name == "_redshift__get_extended_catalog_by_relation_sql"
+                and len(kwargs["relations"]) == 2
+            ):
+                raise RuntimeError("permission denied for relation")
+            return self._execute_macro(macro_name, kwargs)
+
+        with mock.patch.object(self.adapter, "execute_macro", side_effect=execute_macro):
+            catalog, exceptions = self._get_catalog_by_relations()
+
+        assert len(exceptions) == 1
+        assert len(catalog.rows) == 3
+
+
+class TestCatalogAssembler(TestCase):
+    def setUp(self):
+        self.base = CatalogRows(
+            BASE_COLUMNS,
+            [
+                ("dev", "Analytics", "orders", "id", 1),
+                ("dev", "Analytics", "orders", "amount", 2),
+                ("dev", "Analytics", "customers", "id", 1),
+                ("dev", "staging", "raw_orders", "id", 1),
+                ("dev", None, "orphan", "id", 1),
+            ],
+        )
+        self.extended = CatalogRows(
+            EXTENDED_COLUMNS,
+            [("Analytics", "orders", 10), ("staging", "raw_orders", 20)],
+        )
+        self.used_schemas = frozenset({("DEV", "analytics")})
+
+    def test_matches_the_agate_join(self):
+        catalog = CatalogAssembler(self.used_schemas)
+        catalog.add(self.base, self.extended)
+
+        expected = agate.Table(self.base.rows, BASE_COLUMNS).join(
+            agate.Table(self.extended.rows, EXTENDED_COLUMNS), ["table_schema", "table_name"]
+        )
+        expected_rows = [
+            tuple(row) for row in expected.rows if row["table_name"] in ("orders", "customers")
+        ]
+        table = catalog.to_table()
+        assert list(table.column_names) == list(expected.column_names)
+        assert [tuple(row) for row in table.rows] == expected_rows
+        assert table.columns["stats:rows:value"].values() == (10, 10, None)
+
+    def test_shards_are_concatenated(self):
+        catalog = CatalogAssembler(frozenset({("dev", "analytics"), ("dev", "staging")}))
+        catalog.add(CatalogRows(BASE_COLUMNS, self.base.rows[:2]), self.extended)
+        catalog.add(
+            CatalogRows(BASE_COLUMNS, self.base.rows[2:]), CatalogRows(EXTENDED_COLUMNS, [])
+        )
+
+        assert catalog.to_table().columns["stats:rows:value"].values() == (10, 10, None, None)
+
+    def test_without_extended_rows(self):
+        catalog = CatalogAssembler(self.used_schemas)
+        catalog.add(self.base)
+
+        table = catalog.to_table()
+        assert list(table.column_names) == BASE_COLUMNS
+        assert len(table.rows) == 3
+
+    def test_mismatched_columns_are_rejected(self):
+        catalog = CatalogAssembler(self.used_schemas)
+        catalog.add(self.base, self.extended)
+
+        with pytest.raises(DbtRuntimeError):
+            catalog.add(self.base)
+
+    def test_entries_alone_bring_their_columns(self):
+        entry = {
+            "metadata": {"type": "VIEW", "schema": "analytics", "name": "v", "database": "dev"},
+            "columns": {
+                "b": {"type": "text", "index": 2, "name": "b"},
+                "a": {"type": "text", "index": 1, "name": "a"},
+            },
+            "stats": {},
+        }
+        catalog = CatalogAssembler(self.used_schemas)
+        catalog.add_entries([entry])
+
+        table = catalog.to_table()
+        assert list(table.column_names)[:7] == BASE_COLUMNS[:3] + [
+            "table_type",
+            "table_comment",
+            "column_name",
+            "column_index",
+        ]
+        assert table.columns["column_name"].values() == ("a", "b")
+
+    def test_empty_catalog(self):
+        assert len(CatalogAssembler(self.used_schemas).to_table().rows) == 0
+
+    def test_column_types_match_the_type_tester(self):
+        column_names = BASE_COLUMNS + ["comment", "size", "encoded", "empty"]
+        rows = [
+            ("dev", "analytics", "orders", "id", 1, "12", Decimal("1.5"), True, None),
+            ("dev", "analytics", "007", "id", 2, "34", 3, False, None),
+        ]
+        catalog = CatalogAssembler(self.used_schemas)
+        catalog.add(CatalogRows(column_names, rows))
+
+        table = catalog.to_table()
+        expected = table_from_rows(
+            rows, column_names, text_only_columns=["table_database", "table_schema", "table_name"]
+        )
+        assert [type(t) for t in table.column_types] == [type(t) for t in expected.column_types]
+        assert [tuple(row) for row in table.rows] == [tuple(row) for row in expected.rows]
+
+
+class TestRelationFilterChunks(TestCase):
+    def setUp(self):
+        self.relations = [
+            RedshiftRelation.create(database="dev", schema="analytics", identifier=f"table_{i}")
+            for i in range(10)
+        ]
+
+    def test_chunks_fit_the_byte_budget(self):
+        # ('analytics', 'table_0'), is 26 bytes
+        chunks = chunk_relations(self.relations, max_bytes=80)
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        assert [r for chunk in chunks for r in chunk] == self.relations
+
+    def test_everything_fits_the_default_budget(self):
+        assert chunk_relations(self.relations) == [self.relations]
+
+    def test_a_relation_over_budget_gets_its_own_chunk(self):
+        assert len(chunk_relations(self.relations[:2], max_bytes=10)) == 2
+
+    @mock.patch("dbt.adapters.redshift.utility.RELATION_FILTER_MAX_BYTES", 80)
+    def test_catalog_shards_are_split_to_the_budget(self):
+        adapter = make_adapter(threads=2)
+        with mock.patch.object(adapter, "execute_macro", return_value=True):
+            with mock.patch.object(
+                adapter, "_get_catalog_in_shards", return_value=(None, [])
+            ) as mock_get_catalog:
+                adapter.get_catalog_by_relations(frozenset(), set(self.relations))
+
+        shards = mock_get_catalog.call_args.args[0]
+        assert sorted(len(kwargs["relations"]) for _, kwargs in shards) == [2, 2, 3, 3]
+
+    @mock.patch("dbt.adapters.redshift.utility.RELATION_FILTER_MAX_BYTES", 80)
+    def test_freshness_is_queried_in_chunks(self):
+        adapter = make_adapter(last_modified_source="stl_insert", last_modified_lookback_days=7)
+        now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        def execute_macro(macro_name, kwargs=None, **_):
+            rows = [
+                (r.schema, r.identifier, None if r.identifier == "table_0" else now, now)
+                for r in kwargs["relations"]
+            ]
+            table = agate.Table(rows, ["schema", "identifier", "last_modified", "snapshotted_at"])
+            return SimpleNamespace(response=None, table=table)
+
+        with mock.patch.object(
+            adapter, "execute_macro", side_effect=execute_macro
+        ) as mock_execute_macro:
+            responses, freshness = adapter.calculate_freshness_from_metadata_batch(self.relations)
+
+        calls = mock_execute_macro.call_args_list
+        assert [len(call.kwargs["kwargs"]["relations"]) for call in calls] == [3, 3, 3, 1]
+        assert {call.args[0] for call in calls} == {"get_relation_last_modified"}
+        assert {tuple(call.kwargs["kwargs"]) for call in calls} == {
+            ("information_schema", "relations")
+        }
+        assert adapter.get_last_modified_options() == {"source": "stl_insert", "lookback_days": 7}
+        assert len(responses) == 4
+        assert freshness[self.relations[1]]["age"] == 0
+        # without a write in the lookback window
+        assert freshness[self.relations[0]]["max_loaded_at"].year == 1
+        assert responses == [None] * 4
+
+
+def test_last_modified_reads_the_profile_options(tmp_path):
+    adapter = make_adapter(last_modified_source="stl_insert", last_modified_lookback_days=7)
+    use_internal_macros(adapter, str(tmp_path))
+    statements = open_fake_connection(adapter, "source_freshness", rows=lambda sql: [])
+    events = RedshiftRelation.create(database="dev", schema="raw", identifier="events")
+
+    adapter.calculate_freshness_from_metadata_batch([events])
+
+    (query,) = [statement for statement in statements if "last_modified" in statement]
+    assert "from stl_insert" in query
+    assert "dateadd(day, -7, getdate())" in query
+
+
+def test_materialized_views_are_selected_apart_from_the_base_catalog(tmp_path):
+    adapter = make_adapter()
+    use_internal_macros(adapter, str(tmp_path))
+
+    def rows(sql):
+        if "svv_mv_info" in sql:
+            return [{"table_schema": "analytics", "table_name": "Orders_MV"}]
+        return []
+
+    statements = open_fake_connection(adapter, "catalog", rows=rows)
+    orders_mv = RedshiftRelation.create(database="dev", schema="analytics", identifier="orders_mv")
+
+    adapter._get_base_catalog_rows(
+        "_redshift__get_base_catalog_by_relation_sql", "dev", {"relations": [orders_mv]}
+    )
+
+    mat_views, base = statements
+    assert "from svv_mv_info" in mat_views
+    assert "lower(mat_views.schema_name) in ('analytics')" in mat_views
+    assert "svv_mv_info" not in base
+    assert (
+        "when tbl.relkind = 'v' and (lower(sch.nspname), lower(tbl.relname)) in "
+        "(('analytics', 'orders_mv')) then 'MATERIALIZED VIEW'"
+    ) in base
+
+
+class TestIncrementalCatalog(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.catalog_path = os.path.join(self.tmp_dir.name, "catalog.json")
+        self.markers_path = f"{self.catalog_path}.markers.json"
+        self.adapter = make_adapter(previous_catalog_path=self.catalog_path)
+        self.relations = {
+            RedshiftRelation.create(database="dev", schema="analytics", identifier=name)
+            for name in ("orders", "customers")
+        }
+        self.used_schemas = frozenset({("dev", "analytics")})
+        self.markers = [
+            ("analytics", "orders", 101, 10, 0, 1, "id", 23, -1),
+            ("analytics", "customers", 102, 10, 0, 1, "id", 23, -1),
+        ]
+        self.stats_markers = [
+            ("analytics", "orders", 10, 5, 0, 0, "EVEN", "id", 1),
+            ("analytics", "customers", 20, 5, 0, 0, "EVEN", "id", 1),
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_previous_catalog(self, markers):
+        key = f"{self.adapter._relation_cache_snapshot_key()}/full"
+        CatalogMarkers(key=key, markers=markers).save(self.markers_path)
+        entry = {
+            "metadata": {
+                "type": "BASE TABLE",
+                "schema": "analytics",
+                "name": "orders",
+                "database": "dev",
+                "comment": None,
+                "owner": "dbt",
+            },
+            "columns": {"id": {"type": "integer", "index": 1, "name": "id", "comment": None}},
+            "stats": {
+                "rows": {
+                    "id": "rows",
+                    "label": "Approximate Row Count",
+                    "value": 10,
+                    "include": True,
+                    "description": "",
+                },
+                "has_stats": {
+                    "id": "has_stats",
+                    "label": "Has Stats?",
+                    "value": True,
+                    "include": False,
+                    "description": "",
+                },
+            },
+            "unique_id": "model.test.orders",
+        }
+        with open(self.catalog_path, "w") as fp:
+            json.dump({"nodes": {"model.test.orders": entry}, "sources": {}}, fp)
+        # dbt writes catalog.json after the markers
+        os.utime(self.markers_path, (0, 0))
+
+    def _execute_macro(self, macro_name, kwargs=None, **_):
+        if macro_name == "redshift__can_select_from":
+            return True
+        if macro_name == "redshift__get_late_binding_view_columns":
+            return []
+        if "relations" not in kwargs:
+            return macro_name
+        return " ".join([macro_name, *sorted(r.identifier for r in kwargs["relations"])])
+
+    def _fetch_rows(self, sql):
+        macro_name, *identifiers = sql.split()
+        if macro_name == "redshift__get_catalog_markers_sql":
+            return [], self.markers
+        if macro_name == "redshift__get_catalog_stats_markers_sql":
+            return [], self.stats_markers
+        if macro_name == "redshift__get_materialized_views_sql":
+            return ["table_schema", "table_name"], []
+        if macro_name == "_redshift__get_base_catalog_by_relation_sql":
+            return BASE_COLUMNS, [("dev", "analytics", i, "id", 1) for i in identifiers]
+        return EXTENDED_COLUMNS, [("analytics", i, 20) for i in identifiers]
+
+    def _get_catalog(self):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            with mock.patch.object(
+                self.adapter.connections, "fetch_rows", side_effect=self._fetch_rows
+            ):
+                catalog, exceptions = self.adapter.get_catalog_by_relations(
+                    self.used_schemas, self.relations
+                )
+        assert exceptions == []
+        queried = [
+            call.kwargs["kwargs"]["relations"]
+            for call in mock_execute_macro.call_args_list
+            if call.args[0] == "_redshift__get_base_catalog_by_relation_sql"
+        ]
+        return catalog, sorted(r.identifier for relations in queried for r in relations)
+
+    def _current_markers(self):
+        return catalog_markers(self.markers, self.stats_markers)
+
+    def test_unchanged_tables_are_reused(self):
+        markers = self._current_markers()
+        markers["analytics.customers"][0] = 99
+        self._write_previous_catalog(markers)
+
+        catalog, queried = self._get_catalog()
+
+        assert queried == ["customers"]
+        rows = {row["table_name"]: row for row in catalog}
+        assert rows["orders"]["column_name"] == "id"
+        assert rows["orders"]["stats:rows:value"] == 10
+        assert rows["customers"]["stats:rows:value"] == 20
+        with open(self.markers_path) as fp:
+            assert json.load(fp)["markers"]["analytics.customers"][0] == 102
+
+    def test_changed_tables_are_queried(self):
+        self._write_previous_catalog({"analytics.orders": [101, 10, 1, 0, 0]})
+
+        _, queried = self._get_catalog()
+
+        assert queried == ["customers", "orders"]
+
+    def test_tables_changed_in_place_are_queried(self):
+        previous = self._current_markers()
+        for markers, stats_markers in [
+            # alter column id type bigint
+            ([("analytics", "orders", 101, 10, 0, 1, "id", 20, -1)], self.stats_markers),
+            # rename column id to order_id
+            ([("analytics", "orders", 101, 10, 0, 1, "order_id", 23, -1)], self.stats_markers),
+            # alter distkey id
+            (self.markers[:1], [("analytics", "orders", 10, 5, 0, 0, "KEY(id)", "id", 1)]),
+            # a load
+            (self.markers[:1], [("analytics", "orders", 12, 5, 0, 0, "EVEN", "id", 1)]),
+        ]:
+            self._write_previous_catalog(previous)
+            with mock.patch.object(self, "markers", markers + self.markers[1:]):
+                with mock.patch.object(self, "stats_markers", stats_markers):
+                    _, queried = self._get_catalog()
+            assert queried == ["customers", "orders"]
+
+    def test_markers_newer_than_the_catalog_are_ignored(self):
+        self._write_previous_catalog(self._current_markers())
+        os.utime(self.markers_path)
+        os.utime(self.catalog_path, (0, 0))
+
+        _, queried = self._get_catalog()
+
+        assert queried == ["customers", "orders"]
+
+    def test_without_a_previous_catalog_everything_is_queried(self):
+        _, queried = self._get_catalog()
+
+        assert queried == ["customers", "orders"]
+        assert os.path.exists(self.markers_path)
@@ -0,0 +1,263 @@
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter, make_node
+
+
+class TestColumnPrefetch(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter(prefetch_columns=True)
+        self.nodes = [
+            make_node("model.X.orders", "analytics", "orders"),
+            make_node("model.X.events", "analytics", "events"),
+            make_node("model.X.new_events", "analytics", "new_events"),
+            make_node("model.X.orders_v", "analytics", "orders_v"),
+        ]
+        for node, materialized in zip(self.nodes, ("incremental", "snapshot", "incremental")):
+            node.config = SimpleNamespace(materialized=materialized)
+        self.adapter.cache.update_schemas([("dev", "analytics")])
+        for identifier in ("orders", "events", "orders_v"):
+            self.adapter.cache.add(
+                RedshiftRelation.create(
+                    database="dev", schema="analytics", identifier=identifier, type="table"
+                )
+            )
+        self.orders = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="orders"
+        )
+
+    @staticmethod
+    def _execute_macro(macro_name, kwargs=None, **_):
+        if macro_name == "redshift__get_late_binding_view_columns":
+            return []
+        if macro_name == "redshift__get_columns_in_relations":
+            return [
+                (relation.schema, relation.identifier, "id", "integer", None, None, None)
+                for relation in kwargs["relations"]
+            ]
+        return []
+
+    def _prefetch(self):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self.adapter._prefetch_columns(self.nodes)
+        return mock_execute_macro
+
+    def test_existing_incremental_models_and_snapshots_are_described_in_bulk(self):
+        mock_execute_macro = self._prefetch()
+
+        bulk_calls = [
+            call
+            for call in mock_execute_macro.call_args_list
+            if call.args[0] == "redshift__get_columns_in_relations"
+        ]
+        assert len(bulk_calls) == 1
+        assert sorted(r.identifier for r in bulk_calls[0].kwargs["kwargs"]["relations"]) == [
+            "events",
+            "orders",
+        ]
+
+        with mock.patch.object(self.adapter, "execute_macro") as mock_execute_macro:
+            columns = self.adapter.get_columns_in_relation(self.orders)
+        assert [(column.name, column.dtype) for column in columns] == [("id", "integer")]
+        mock_execute_macro.assert_not_called()
+
+    def test_altered_relations_are_described_again(self):
+        self._prefetch()
+        self.adapter.forget_columns_in_relation(self.orders)
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self.adapter.get_columns_in_relation(self.orders)
+        assert mock_execute_macro.call_args.args[0] == "get_columns_in_relation"
+
+    def test_recreated_relations_are_described_again(self):
+        self._prefetch()
+        self.adapter.cache_dropped(self.orders)
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self.adapter.get_columns_in_relation(self.orders)
+        mock_execute_macro.assert_called()
+
+
+class TestColumnSources(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.adapter.cache.update_schemas([("dev", "analytics")])
+        for identifier, relation_type in (("orders", "table"), ("orders_v", "view")):
+            self.adapter.cache.add(
+                RedshiftRelation.create(
+                    database="dev", schema="analytics", identifier=identifier, type=relation_type
+                )
+            )
+
+    @staticmethod
+    def _execute_macro(macro_name, kwargs=None, **_):
+        if macro_name == "redshift__get_external_schemas":
+            return [("Spectrum",)]
+        return []
+
+    def _sources(self, database, schema, identifier):
+        relation = RedshiftRelation.create(database=database, schema=schema, identifier=identifier)
+        with mock.patch.object(self.adapter, "execute_macro", side_effect=self._execute_macro):
+            return self.adapter.get_column_sources(relation)
+
+    def test_cached_tables_only_read_information_schema(self):
+        assert self._sources("dev", "analytics", "orders") == ["bound"]
+
+    def test_views_may_be_late_binding(self):
+        assert self._sources("dev", "analytics", "orders_v") == ["bound", "late_binding"]
+
+    def test_relations_of_external_schemas_are_external_tables(self):
+        assert self._sources("dev", "spectrum", "events") == ["external"]
+
+    def test_unknown_relations_of_other_databases_read_everything(self):
+        assert self._sources("other", "analytics", "orders") == [
+            "bound",
+            "late_binding",
+            "external",
+        ]
+
+    def test_external_schemas_are_listed_once(self):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            for identifier in ("orders", "orders_v", "missing"):
+                self.adapter.get_column_sources(
+                    RedshiftRelation.create(
+                        database="dev", schema="analytics", identifier=identifier
+                    )
+                )
+        mock_execute_macro.assert_called_once_with("redshift__get_external_schemas")
+
+    def test_tables_skip_the_late_binding_views(self):
+        relation = RedshiftRelation.create(database="dev", schema="analytics", identifier="orders")
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self.adapter.get_columns_in_relation(relation)
+        assert [call.args[0] for call in mock_execute_macro.call_args_list] == [
+            "get_columns_in_relation"
+        ]
+
+
+class TestAlterColumnTypeInPlace(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.relation = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="events"
+        )
+        self.columns = [
+            self.adapter.Column("name", "character varying", char_size=64),
+            self.adapter.Column("code", "character", char_size=2),
+        ]
+
+    def _alter(self, column_name, new_column_type, transaction_open=False, error=None):
+        connection = mock.Mock(transaction_open=transaction_open)
+        with mock.patch.object(self.adapter, "get_columns_in_relation", return_value=self.columns):
+            with mock.patch.object(
+                self.adapter.connections, "get_if_exists", return_value=connection
+            ):
+                with mock.patch.object(self.adapter.connections, "commit") as mock_commit:
+                    with mock.patch.object(
+                        self.adapter, "execute", side_effect=error
+                    ) as mock_execute:
+                        altered = self.adapter.alter_column_type_in_place(
+                            self.relation, column_name, new_column_type
+                        )
+        self.committed = mock_commit.called
+        return altered, mock_execute
+
+    def test_varchar_columns_are_widened_in_place(self):
+        altered, mock_execute = self._alter("name", "character varying(256)")
+        assert altered
+        mock_execute.assert_called_once_with(
+            'alter table "dev"."analytics"."events" alter column "name" '
+            "type character varying(256)",
+            auto_begin=False,
+        )
+        assert not self.committed
+
+    def test_varchar_columns_are_widened_to_max(self):
+        altered, mock_execute = self._alter("name", "varchar(MAX)")
+        assert altered
+        mock_execute.assert_called_once_with(
+            'alter table "dev"."analytics"."events" alter column "name" type varchar(MAX)',
+            auto_begin=False,
+        )
+
+    def test_other_changes_are_left_to_the_copy(self):
+        self.columns[0] = self.adapter.Column("name", "character varying", char_size=65535)
+        for column_name, new_column_type in [
+            ("name", "character varying(32)"),
+            ("name", "varchar(max)"),
+            ("code", "character varying(256)"),
+            ("missing", "character varying(256)"),
+        ]:
+            altered, mock_execute = self._alter(column_name, new_column_type)
+            assert not altered
+            mock_execute.assert_not_called()
+
+    def test_columns_are_copied_in_open_transactions(self):
+        # the transaction of an incremental model must not be committed halfway
+        altered, mock_execute = self._alter("name", "varchar(256)", transaction_open=True)
+        assert not altered
+        assert not self.committed
+        mock_execute.assert_not_called()
+
+    def test_columns_are_copied_without_autocommit(self):
+        self.adapter = make_adapter(autocommit=False)
+        altered, mock_execute = self._alter("name", "varchar(256)", transaction_open=True)
+        assert not altered
+        assert not self.committed
+        mock_execute.assert_not_called()
+
+    def test_the_transaction_begun_by_the_describe_is_committed(self):
+        relation = self.relation.incorporate(type="table")
+        connection = SimpleNamespace(name="model.test.events", transaction_open=False)
+        calls = []
+
+        def execute_macro(macro_name, kwargs=None, **_):
+            # get_columns_in_relation runs with auto_begin, which sends BEGIN
+            connection.transaction_open = True
+            calls.append(macro_name)
+            return self.columns
+
+        def commit():
+            connection.transaction_open = False
+            calls.append("commit")
+
+        def execute(sql, auto_begin=False, **_):
+            assert not connection.transaction_open
+            calls.append(sql.split(" type ")[-1])
+
+        with mock.patch.object(self.adapter.connections, "get_if_exists", return_value=connection):
+            with mock.patch.object(self.adapter.connections, "commit", side_effect=commit):
+                with mock.patch.object(self.adapter, "execute_macro", side_effect=execute_macro):
+                    with mock.patch.object(self.adapter, "execute", side_effect=execute):
+                        assert self.adapter.alter_column_type_in_place(
+                            relation, "name", "varchar(256)"
+                        )
+        assert calls == ["get_columns_in_relation", "commit", "varchar(256)"]
+
+    def test_rejected_alters_are_left_to_the_copy(self):
+        error = DbtDatabaseError("cannot alter column with encoding bytedict")
+        altered, _ = self._alter("name", "varchar(256)", error=error)
+        assert not altered
+
+
+def test_has_open_transaction():
+    # redshift__alter_relation_add_remove_columns commits the transaction it begins
+    adapter = make_adapter()
+    assert not adapter.has_open_transaction()
+    with mock.patch.object(
+        adapter.connections, "get_if_exists", return_value=mock.Mock(transaction_open=True)
+    ):
+        assert adapter.has_open_transaction()
@@ -0,0 +1,140 @@
+import threading
+
+from dbt.adapters.redshift.connections import DropLock
+from tests.unit.utils import make_adapter, open_fake_connection
+
+
+def _hold_in_thread(lock, keys, entered, release):
+    def hold():
+        with lock.hold(keys):
+            entered.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    return thread
+
+
+def test_disjoint_keys_are_held_at_the_same_time():
+    lock = DropLock()
+    release = threading.Event()
+    first, second = threading.Event(), threading.Event()
+    threads = [
+        _hold_in_thread(lock, {"dev.analytics.orders"}, first, release),
+        _hold_in_thread(lock, {"dev.analytics.customers"}, second, release),
+    ]
+    assert first.wait(5) and second.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert lock.waits == 2
+
+
+def test_overlapping_keys_wait_for_each_other():
+    lock = DropLock()
+    release = threading.Event()
+    first, second = threading.Event(), threading.Event()
+    threads = [
+        _hold_in_thread(lock, {"dev.analytics.orders", "dev.analytics.orders_v"}, first, release)
+    ]
+    assert first.wait(5)
+    threads.append(_hold_in_thread(lock, {"dev.analytics.orders_v"}, second, release))
+    assert not second.wait(0.1)
+    release.set()
+    assert second.wait(5)
+    for thread in threads:
+        thread.join()
+
+
+def test_unknown_keys_wait_for_every_other_drop():
+    lock = DropLock()
+    release = threading.Event()
+    first, second = threading.Event(), threading.Event()
+    threads = [_hold_in_thread(lock, {"dev.analytics.orders"}, first, release)]
+    assert first.wait(5)
+    threads.append(_hold_in_thread(lock, None, second, release))
+    assert not second.wait(0.1)
+    release.set()
+    assert second.wait(5)
+    for thread in threads:
+        thread.join()
+    assert lock.wait_time > 0
+
+
+def test_a_thread_does_not_wait_for_its_own_keys():
+    lock = DropLock()
+    held = lock.acquire({"dev.analytics.orders"})
+    with lock.hold({"dev.analytics.orders", "dev.analytics.orders_v"}):
+        with lock.hold(None):
+            pass
+    lock.release(held)
+
+    release = threading.Event()
+    entered = threading.Event()
+    thread = _hold_in_thread(lock, None, entered, release)
+    assert entered.wait(5)
+    release.set()
+    thread.join()
+
+
+def _run_in_threads(targets):
+    """Run `targets` on threads that all start together, and return those that finished."""
+    barrier = threading.Barrier(len(targets))
+    finished = []
+
+    def run(target):
+        barrier.wait(5)
+        target()
+        finished.append(target)
+
+    threads = [threading.Thread(target=run, args=(target,), daemon=True) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return finished
+
+
+def test_threads_holding_keys_do_not_wait_for_each_other():
+    lock = DropLock()
+    holding = threading.Barrier(2)
+
+    def hold_then_take(held, wanted):
+        def target():
+            lock.acquire({held})
+            holding.wait(5)
+            lock.acquire({wanted})
+
+        return target
+
+    finished = _run_in_threads(
+        [
+            hold_then_take("dev.analytics.orders", "dev.analytics.customers"),
+            hold_then_take("dev.analytics.customers", "dev.analytics.orders"),
+        ]
+    )
+    assert len(finished) == 2
+
+
+def test_fresh_transactions_commit_before_waiting():
+    adapter = make_adapter()
+    connections = adapter.connections
+    holding = threading.Barrier(2)
+
+    def drop_leaf_then_cascade(key):
+        def target():
+            open_fake_connection(adapter, f"model.X.{key}")
+            connections.begin()
+            connections.hold_drop_lock_until_commit({f"dev.analytics.{key}"})
+            holding.wait(5)
+            with connections.fresh_transaction():
+                pass
+            connections.commit()
+
+        return target
+
+    finished = _run_in_threads(
+        [drop_leaf_then_cascade("orders"), drop_leaf_then_cascade("customers")]
+    )
+    assert len(finished) == 2
+    assert not connections.drop_lock._held
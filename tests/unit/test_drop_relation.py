@@ -0,0 +1,193 @@
+import tempfile
+from unittest import TestCase, mock
+
+from dbt.adapters.redshift import RedshiftAdapter
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter, open_fake_connection, use_internal_macros
+
+
+class TestDropRelation(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.adapter.cache.update_schemas([("dev", "analytics"), ("dev", "staging")])
+
+    def _cache_linked_relations(self):
+        orders, orders_v = (
+            RedshiftRelation.create(
+                database="dev", schema="analytics", identifier=identifier, type="table"
+            )
+            for identifier in ("orders", "orders_v")
+        )
+        self.adapter.cache.add(orders)
+        self.adapter.cache.add(orders_v)
+        self.adapter.cache.add_link(referenced=orders, dependent=orders_v)
+        return orders, orders_v
+
+    def test_drop_lock_keys_follow_cached_links(self):
+        orders, orders_v = self._cache_linked_relations()
+
+        assert self.adapter._drop_lock_keys(orders) == {
+            "dev.analytics.orders",
+            "dev.analytics.orders_v",
+        }
+        assert self.adapter._drop_lock_keys(orders_v) == {"dev.analytics.orders_v"}
+        assert (
+            self.adapter._drop_lock_keys(
+                RedshiftRelation.create(database="dev", schema="raw", identifier="events")
+            )
+            is None
+        )
+
+    @staticmethod
+    def _execute_macro(macro_name, kwargs=None, **_):
+        if macro_name == "redshift__get_relation_dependent_count":
+            return [(0,)]
+        return None
+
+    def test_relations_without_dependents_are_dropped_without_cascade(self):
+        self.adapter.config.credentials.check_drop_dependents = True
+        orders, orders_v = self._cache_linked_relations()
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            with mock.patch.object(
+                self.adapter.connections, "fresh_transaction"
+            ) as mock_fresh_transaction:
+                self.adapter.drop_relation(orders)
+        mock_execute_macro.assert_called_once_with("drop_relation", kwargs={"relation": orders})
+        mock_fresh_transaction.assert_called_once_with(
+            {"dev.analytics.orders", "dev.analytics.orders_v"}
+        )
+
+        orders, orders_v = self._cache_linked_relations()
+        with self.adapter.connection_named("test"):
+            with mock.patch.object(
+                self.adapter, "execute_macro", side_effect=self._execute_macro
+            ) as mock_execute_macro:
+                with mock.patch.object(
+                    self.adapter.connections, "fresh_transaction"
+                ) as mock_fresh_transaction:
+                    self.adapter.drop_relation(orders_v)
+        mock_execute_macro.assert_called_with(
+            "redshift__drop_leaf_relation", kwargs={"relation": orders_v}
+        )
+        mock_fresh_transaction.assert_not_called()
+        # orders lost its only dependent
+        with mock.patch.object(self.adapter, "execute_macro", side_effect=self._execute_macro):
+            assert self.adapter._is_leaf_relation(orders)
+
+    def test_relations_are_dropped_with_cascade_unless_dependents_are_checked(self):
+        orders, orders_v = self._cache_linked_relations()
+        assert not self.adapter._is_leaf_relation(orders_v)
+
+    def test_leaf_drops_hold_the_drop_lock_until_commit(self):
+        self.adapter.config.credentials.check_drop_dependents = True
+        _, orders_v = self._cache_linked_relations()
+        drop_lock = self.adapter.connections.drop_lock
+
+        with self.adapter.connection_named("test"):
+            connection = self.adapter.connections.get_thread_connection()
+            connection.transaction_open = True
+            with mock.patch.object(self.adapter, "execute_macro", side_effect=self._execute_macro):
+                self.adapter.drop_relation(orders_v)
+            assert "dev.analytics.orders_v" in drop_lock._held
+
+            with mock.patch.object(self.adapter.connections, "add_commit_query"):
+                self.adapter.connections.commit()
+            assert not drop_lock._held
+
+    def test_only_tables_and_views_are_dropped_without_cascade(self):
+        self.adapter.config.credentials.check_drop_dependents = True
+        external = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="events", type="external"
+        )
+        self.adapter.cache.add(external)
+        with mock.patch.object(self.adapter, "execute_macro", side_effect=self._execute_macro):
+            assert not self.adapter._is_leaf_relation(external)
+
+    def test_relations_in_uncached_schemas_are_dropped_with_cascade(self):
+        self.adapter.config.credentials.check_drop_dependents = True
+        events = RedshiftRelation.create(
+            database="dev", schema="raw", identifier="events", type="table"
+        )
+        assert not self.adapter._is_leaf_relation(events)
+
+    def test_dependents_can_be_checked_live(self):
+        self.adapter.config.credentials.check_drop_dependents = True
+        _, orders_v = self._cache_linked_relations()
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", return_value=[(1,)]
+        ) as mock_execute_macro:
+            assert not self.adapter._is_leaf_relation(orders_v)
+        mock_execute_macro.assert_called_once_with(
+            "redshift__get_relation_dependent_count", kwargs={"relation": orders_v}
+        )
+
+    def test_backup_drops_can_be_deferred_to_the_end_of_the_run(self):
+        self.adapter.config.credentials.defer_backup_drops = True
+        orders, orders_v = self._cache_linked_relations()
+        never_built = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="customers__dbt_backup", type="table"
+        )
+
+        with mock.patch.object(RedshiftAdapter, "drop_relation") as mock_drop_relation:
+            self.adapter.drop_backup_relation(orders)
+            self.adapter.drop_backup_relation(orders_v)
+            self.adapter.drop_backup_relation(never_built)
+            mock_drop_relation.assert_not_called()
+
+            # right before the on-run-end hooks
+            calls = mock.Mock()
+            calls.attach_mock(mock_drop_relation, "drop_relation")
+            with mock.patch.object(self.adapter.connections, "clear_transaction") as mock_clear:
+                calls.attach_mock(mock_clear, "clear_transaction")
+                self.adapter.clear_transaction()
+            self.adapter.cleanup_connections()
+        assert {call.args[0] for call in mock_drop_relation.call_args_list} == {orders, orders_v}
+        assert [name for name, _, _ in calls.mock_calls] == [
+            "drop_relation",
+            "drop_relation",
+            "clear_transaction",
+        ]
+
+    def test_backup_drops_are_immediate_by_default(self):
+        orders, _ = self._cache_linked_relations()
+
+        with mock.patch.object(RedshiftAdapter, "drop_relation") as mock_drop_relation:
+            self.adapter.drop_backup_relation(orders)
+        mock_drop_relation.assert_called_once_with(orders)
+
+
+class TestLeafDropTransactions(TestCase):
+    """Leaf drops through the real macros, on a fake connection."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.backup = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="orders__dbt_backup", type="table"
+        )
+
+    def _drop_after_commit(self, **credentials):
+        adapter = make_adapter(check_drop_dependents=True, **credentials)
+        use_internal_macros(adapter, self.tmp_dir.name)
+        adapter.cache.update_schemas([("dev", "analytics")])
+        adapter.cache.add(self.backup)
+        statements = open_fake_connection(adapter, "model.X.orders", rows=[(0,)])
+        # like the backup drop of a materialization, once its transaction committed
+        adapter.drop_relation(self.backup)
+        transaction_open = adapter.connections.get_thread_connection().transaction_open
+        adapter.release_connection()
+        return [statement.split(" ")[0] for statement in statements], transaction_open
+
+    def test_leaf_drops_are_not_left_in_a_transaction(self):
+        statements, transaction_open = self._drop_after_commit()
+        assert statements == ["select", "drop"]
+        assert not transaction_open
+
+    def test_leaf_drops_are_committed_without_autocommit(self):
+        statements, transaction_open = self._drop_after_commit(autocommit=False)
+        assert statements == ["select", "BEGIN", "drop", "COMMIT"]
+        assert not transaction_open
@@ -0,0 +1,147 @@
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+from dbt.adapters.redshift.freshness import FreshnessBatcher, FreshnessRequest
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter
+
+COLLECT_FRESHNESS_BATCH_MACRO_NAME = "redshift__collect_freshness_batch"
+
+
+class TestFreshnessBatcher(TestCase):
+    def test_concurrent_checks_are_run_together(self):
+        batcher = FreshnessBatcher(window=5, max_size=3)
+        batches = []
+
+        def run_batch(batch):
+            batches.append([request.source for request in batch])
+            for request in batch:
+                request.result = request.source
+
+        requests = [FreshnessRequest(f"source_{i}", "loaded_at", None) for i in range(3)]
+        threads = [
+            threading.Thread(target=batcher.submit, args=(request, run_batch))
+            for request in requests
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert batcher.batches == 1
+        assert sorted(batches[0]) == ["source_0", "source_1", "source_2"]
+        assert [request.result for request in requests] == ["source_0", "source_1", "source_2"]
+
+    def test_a_failed_batch_returns_the_error(self):
+        batcher = FreshnessBatcher(window=0, max_size=3)
+        error = RuntimeError("boom")
+
+        def run_batch(batch):
+            raise error
+
+        request = batcher.submit(FreshnessRequest("source", "loaded_at", None), run_batch)
+        assert request.result is None
+        assert request.error is error
+
+
+class TestCalculateFreshnessBatch(TestCase):
+    def setUp(self):
+        self.relations = [
+            RedshiftRelation.create(database="dev", schema="raw", identifier=f"events_{i}")
+            for i in range(3)
+        ]
+        self.snapshotted_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    def _execute_macro(self, macro_name, kwargs=None, **_):
+        assert macro_name == COLLECT_FRESHNESS_BATCH_MACRO_NAME
+        # rows come back in any order, and a source without rows has a null max_loaded_at
+        table = [
+            (index, None if index == 0 else datetime(2024, 1, 1), self.snapshotted_at)
+            for index in reversed(range(len(kwargs["checks"])))
+        ]
+        return SimpleNamespace(response="OK", table=table)
+
+    def test_results_follow_the_checks(self):
+        adapter = make_adapter()
+        checks = [(relation, "loaded_at", None) for relation in self.relations]
+        checks[2] = (self.relations[2], "loaded_at", "loaded_at > '2024-01-01'")
+
+        with mock.patch.object(
+            adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            results = adapter.calculate_freshness_batch(checks)
+
+        mock_execute_macro.assert_called_once()
+        assert mock_execute_macro.call_args.kwargs["kwargs"]["checks"][2] == {
+            "source": self.relations[2],
+            "loaded_at_field": "loaded_at",
+            "filter": "loaded_at > '2024-01-01'",
+        }
+        assert [response for response, _ in results] == ["OK", "OK", "OK"]
+        assert results[0][1]["max_loaded_at"].year == 1
+        assert results[1][1]["max_loaded_at"].year == 2024
+        assert results[1][1]["age"] == 86400
+
+    def test_missing_rows_are_an_error(self):
+        adapter = make_adapter()
+        checks = [(relation, "loaded_at", None) for relation in self.relations]
+        result = SimpleNamespace(response="OK", table=[(0, None, self.snapshotted_at)])
+
+        with mock.patch.object(adapter, "execute_macro", return_value=result):
+            with self.assertRaises(Exception):
+                adapter.calculate_freshness_batch(checks)
+
+    def test_checks_are_not_batched_by_default(self):
+        adapter = make_adapter(threads=4)
+        with mock.patch(
+            "dbt.adapters.base.impl.BaseAdapter.calculate_freshness", return_value="single"
+        ) as mock_calculate_freshness:
+            assert adapter.calculate_freshness(self.relations[0], "loaded_at", None) == "single"
+        mock_calculate_freshness.assert_called_once()
+
+    def test_failed_batches_fall_back_to_single_checks(self):
+        adapter = make_adapter(threads=4, freshness_batch_window=0.01)
+        with mock.patch.object(adapter, "execute_macro", side_effect=RuntimeError("boom")):
+            with mock.patch(
+                "dbt.adapters.base.impl.BaseAdapter.calculate_freshness", return_value="single"
+            ) as mock_calculate_freshness:
+                assert (
+                    adapter.calculate_freshness(self.relations[0], "loaded_at", None) == "single"
+                )
+        mock_calculate_freshness.assert_called_once()
+
+    def test_overridden_collect_freshness_is_not_batched(self):
+        adapter = make_adapter(threads=4, freshness_batch_window=0.01)
+        macros = {
+            "collect_freshness": SimpleNamespace(package_name="dbt"),
+            "redshift__collect_freshness": SimpleNamespace(package_name="my_project"),
+        }
+        resolver = mock.Mock()
+        resolver.find_macro_by_name.side_effect = lambda name, *_: macros.get(name)
+
+        with mock.patch(
+            "dbt.adapters.redshift.impl.get_adapter_package_names",
+            return_value=["dbt_redshift", "dbt_postgres", "dbt"],
+        ):
+            with mock.patch(
+                "dbt.adapters.redshift.impl.get_adapter_type_names",
+                return_value=["redshift", "postgres"],
+            ):
+                assert not adapter._macro_overridden(
+                    "collect_freshness", SimpleNamespace(find_macro_by_name=lambda *_: None)
+                )
+                with mock.patch.object(adapter, "execute_macro") as mock_execute_macro:
+                    with mock.patch(
+                        "dbt.adapters.base.impl.BaseAdapter.calculate_freshness",
+                        return_value="single",
+                    ) as mock_calculate_freshness:
+                        assert (
+                            adapter.calculate_freshness(
+                                self.relations[0], "loaded_at", None, resolver
+                            )
+                            == "single"
+                        )
+        mock_execute_macro.assert_not_called()
+        mock_calculate_freshness.assert_called_once()
@@ -0,0 +1,99 @@
+from unittest import TestCase, mock
+
+import pytest
+
+from dbt.adapters.base import Column
+
+from dbt.adapters.redshift.late_binding import LateBindingColumn, late_binding_column
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter
+
+LATE_BINDING_MACRO_NAME = "redshift__get_late_binding_view_columns"
+
+
+@pytest.mark.parametrize(
+    "column_type,expected",
+    [
+        ("character varying(256)", ("character varying", 256, None, None)),
+        ("character(10)", ("character(10)", 10, None, None)),
+        ("numeric(18,2)", ("numeric", None, 18, 2)),
+        ("numeric", ("numeric", None, None, None)),
+        ("integer", ("integer", None, None, None)),
+        ("timestamp without time zone", ("timestamp without time zone", None, None, None)),
+    ],
+)
+def test_late_binding_column_types(column_type, expected):
+    column = late_binding_column(Column, LateBindingColumn("col", column_type, 1, None))
+    assert column.name == "col"
+    assert (
+        column.dtype,
+        column.char_size,
+        column.numeric_precision,
+        column.numeric_scale,
+    ) == expected
+
+
+class TestLateBindingViewColumns(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.adapter.cache.update_schemas([("dev", "analytics"), ("dev", "staging")])
+        self.lbv = RedshiftRelation.create(database="dev", schema="analytics", identifier="lbv")
+        self.table = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="orders"
+        )
+
+    @staticmethod
+    def _execute_macro(macro_name, kwargs=None, **_):
+        if macro_name == LATE_BINDING_MACRO_NAME:
+            return [
+                ("analytics", "lbv", "name", "character varying(64)", 2, "dbt"),
+                ("analytics", "lbv", "id", "integer", 1, "dbt"),
+            ]
+        return [Column("id", "integer")]
+
+    def _get_columns(self, relation):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            columns = self.adapter.get_columns_in_relation(relation)
+        return columns, [call.args[0] for call in mock_execute_macro.call_args_list]
+
+    def test_schemas_of_the_run_are_fetched_once(self):
+        columns, macro_names = self._get_columns(self.lbv)
+        assert [(c.name, c.dtype, c.char_size) for c in columns] == [
+            ("id", "integer", None),
+            ("name", "character varying", 64),
+        ]
+        assert macro_names == [LATE_BINDING_MACRO_NAME]
+
+        _, macro_names = self._get_columns(self.lbv)
+        assert macro_names == []
+        _, macro_names = self._get_columns(
+            RedshiftRelation.create(database="dev", schema="staging", identifier="stg")
+        )
+        assert macro_names == ["get_columns_in_relation"]
+
+    def test_other_relations_are_described_without_late_binding_views(self):
+        _, macro_names = self._get_columns(self.table)
+        assert macro_names == [LATE_BINDING_MACRO_NAME, "get_columns_in_relation"]
+        assert self.adapter.late_binding_columns_cached(self.table)
+
+    def test_recreated_views_are_fetched_again_on_their_own(self):
+        self._get_columns(self.lbv)
+        self.adapter.cache_dropped(self.lbv)
+        assert not self.adapter.late_binding_columns_cached(self.lbv)
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self.adapter.get_columns_in_relation(self.lbv)
+        mock_execute_macro.assert_called_once_with(
+            LATE_BINDING_MACRO_NAME, kwargs={"relations": [self.lbv]}
+        )
+        assert self.adapter.late_binding_columns_cached(self.lbv)
+
+    def test_other_databases_are_not_cached(self):
+        relation = RedshiftRelation.create(database="other", schema="analytics", identifier="lbv")
+        _, macro_names = self._get_columns(relation)
+        assert macro_names == ["get_columns_in_relation"]
+        assert not self.adapter.late_binding_columns_cached(relation)
@@ -0,0 +1,49 @@
+import os
+import re
+
+import dbt.include.global_project
+import dbt.include.redshift
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter, open_fake_connection, use_internal_macros
+
+
+def _read(package, *path):
+    with open(os.path.join(os.path.dirname(package.__file__), *path)) as fp:
+        return fp.read()
+
+
+def _without_changes(sql):
+    """`sql` without its materialization header, comments and redshift blocks."""
+    sql = re.sub(r"\{#-- redshift: begin --#\}.*?\{#-- redshift: end --#\}", "", sql, flags=re.S)
+    sql = re.sub(r"\{#.*?#\}", "", sql, flags=re.S)
+    sql = re.sub(r"\{% materialization .*?%\}", "", sql)
+    return [line.strip() for line in sql.splitlines() if line.strip()]
+
+
+def test_incremental_materialization_follows_the_default():
+    default = _read(
+        dbt.include.global_project,
+        "macros",
+        "materializations",
+        "models",
+        "incremental",
+        "incremental.sql",
+    )
+    redshift = _read(dbt.include.redshift, "macros", "materializations", "incremental.sql")
+    assert _without_changes(redshift) == _without_changes(default)
+
+
+def test_tables_without_dist_or_sort_are_not_described(tmp_path):
+    adapter = make_adapter()
+    use_internal_macros(adapter, str(tmp_path))
+    statements = open_fake_connection(adapter, "model.X.orders")
+    relation = RedshiftRelation.create(
+        database="dev", schema="analytics", identifier="orders", type="table"
+    )
+    config = {"materialized": "incremental"}
+    changes = adapter.execute_macro(
+        "redshift__get_table_configuration_changes",
+        kwargs={"existing_relation": relation, "new_config": config},
+    )
+    assert changes is None
+    assert statements == []
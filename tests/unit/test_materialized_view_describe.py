@@ -0,0 +1,186 @@
+import tempfile
+from unittest import TestCase, mock
+
+import agate
+
+from dbt.adapters.redshift.relation import RedshiftRelation
+from dbt.adapters.redshift.relation_cache import (
+    MaterializedViewRefreshState,
+    materialized_view_descriptions,
+)
+from tests.unit.utils import make_adapter, open_fake_connection, use_internal_macros
+
+
+def describe_materialized_views_results():
+    return {
+        "materialized_views": agate.Table.from_object(
+            [
+                {
+                    "database": "dev",
+                    "schema": "analytics",
+                    "table": name,
+                    "diststyle": "EVEN",
+                    "sortkey1": "id",
+                    "autorefresh": "f",
+                }
+                for name in ("mv", "mv__daily")
+            ]
+        ),
+        "columns": agate.Table.from_object(
+            [
+                {
+                    "schema": "analytics",
+                    "internal_table": internal_table,
+                    "column": "id",
+                    "is_dist_key": False,
+                    "sort_key_position": 1,
+                }
+                for internal_table in ("mv_tbl__mv__0", "mv_tbl__mv__daily__0")
+            ]
+        ),
+        "queries": agate.Table.from_object(
+            [
+                {
+                    "schema": "analytics",
+                    "name": name,
+                    "definition": f"create materialized view {name} as (select 1 as id);",
+                }
+                for name in ("mv", "mv__daily")
+            ]
+        ),
+    }
+
+
+def test_materialized_view_descriptions_are_split_by_view():
+    descriptions = materialized_view_descriptions(describe_materialized_views_results())
+    assert set(descriptions) == {("analytics", "mv"), ("analytics", "mv__daily")}
+    daily = descriptions[("analytics", "mv__daily")]
+    assert [row["table"] for row in daily["materialized_view"].rows] == ["mv__daily"]
+    assert [row["internal_table"] for row in daily["columns"].rows] == ["mv_tbl__mv__daily__0"]
+    assert [row["name"] for row in daily["query"].rows] == ["mv__daily"]
+
+
+class TestMaterializedViewDescribe(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.adapter.cache.update_schemas([("dev", "analytics"), ("dev", "staging")])
+        self.mv = RedshiftRelation.create(database="dev", schema="analytics", identifier="mv")
+
+    def _describe(self, relation):
+        with mock.patch.object(
+            self.adapter, "execute_macro", return_value=describe_materialized_views_results()
+        ) as mock_execute_macro:
+            description = self.adapter.describe_materialized_view(relation)
+        return description, mock_execute_macro
+
+    def test_schemas_of_the_run_are_described_once(self):
+        description, mock_execute_macro = self._describe(self.mv)
+        mock_execute_macro.assert_called_once_with(
+            "redshift__describe_materialized_views", kwargs={"schemas": ["analytics", "staging"]}
+        )
+        relation_config = mock.MagicMock()
+        relation_config.identifier = "mv"
+        relation_config.schema = "analytics"
+        relation_config.database = "dev"
+        relation_config.compiled_code = "select 1 as id"
+        relation_config.config.extra = {}
+        relation_config.config.get.return_value = None
+        assert RedshiftRelation.materialized_view_config_changeset(description, relation_config)
+
+        other = RedshiftRelation.create(database="dev", schema="analytics", identifier="mv__daily")
+        description, mock_execute_macro = self._describe(other)
+        mock_execute_macro.assert_not_called()
+        assert description is not None
+
+    def test_descriptions_are_served_once(self):
+        self._describe(self.mv)
+        description, mock_execute_macro = self._describe(self.mv)
+        mock_execute_macro.assert_not_called()
+        assert description is None
+
+    def test_recreated_views_are_described_on_their_own(self):
+        self._describe(RedshiftRelation.create(database="dev", schema="staging", identifier="x"))
+        self.adapter.cache_dropped(self.mv)
+        description, mock_execute_macro = self._describe(self.mv)
+        mock_execute_macro.assert_not_called()
+        assert description is None
+
+    def test_other_databases_are_described_on_their_own(self):
+        relation = RedshiftRelation.create(database="other", schema="analytics", identifier="mv")
+        description, mock_execute_macro = self._describe(relation)
+        mock_execute_macro.assert_not_called()
+        assert description is None
+
+    def test_refresh_states_are_read_after_the_describe(self):
+        # a base table of the materialized view is written after the bulk describe
+        self._describe(self.mv)
+        table = agate.Table.from_object([{"is_stale": "t", "state": 1}])
+        with mock.patch.object(
+            self.adapter, "execute_macro", return_value=table
+        ) as mock_execute_macro:
+            refresh_state = self.adapter.get_materialized_view_refresh_state(self.mv)
+        mock_execute_macro.assert_called_once_with(
+            "redshift__get_materialized_view_refresh_state", kwargs={"relation": self.mv}
+        )
+        assert refresh_state.is_stale
+        assert refresh_state.refresh_kind == "incremental"
+
+    def test_refresh_states_are_queried(self):
+        table = agate.Table.from_object([{"is_stale": "t", "state": 0}])
+        with mock.patch.object(
+            self.adapter, "execute_macro", return_value=table
+        ) as mock_execute_macro:
+            refresh_state = self.adapter.get_materialized_view_refresh_state(self.mv)
+        mock_execute_macro.assert_called_once_with(
+            "redshift__get_materialized_view_refresh_state", kwargs={"relation": self.mv}
+        )
+        assert refresh_state == MaterializedViewRefreshState(is_stale=True, state=0)
+        assert refresh_state.refresh_kind == "full recompute"
+
+
+class TestMaterializedViewDescribeQueries(TestCase):
+    """The bulk describe through the real macros, on a fake connection."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.adapter = make_adapter()
+        use_internal_macros(self.adapter, self.tmp_dir.name)
+        self.adapter.cache.update_schemas([("dev", "analytics")])
+
+    @staticmethod
+    def _rows(sql):
+        if "svv_mv_info" in sql:
+            return [
+                {
+                    "database": "dev",
+                    "schema": "analytics",
+                    "table": "mv",
+                    "diststyle": "EVEN",
+                    "sortkey1": "id",
+                    "autorefresh": "f",
+                }
+            ]
+        return []
+
+    def test_only_the_definitions_of_materialized_views_are_read(self):
+        statements = open_fake_connection(self.adapter, "model.X.mv", rows=self._rows)
+        mv = RedshiftRelation.create(database="dev", schema="analytics", identifier="mv")
+        self.adapter.describe_materialized_view(mv)
+
+        queries = [statement for statement in statements if "from pg_views" in statement]
+        assert len(queries) == 1
+        assert (
+            "where ((lower(vw.schemaname) = 'analytics' and lower(vw.viewname) = 'mv'))"
+            in queries[0]
+        )
+
+    def test_schemas_without_materialized_views_read_no_definitions(self):
+        statements = open_fake_connection(self.adapter, "model.X.mv", rows=lambda sql: [])
+        mv = RedshiftRelation.create(database="dev", schema="analytics", identifier="mv")
+        self.adapter.describe_materialized_view(mv)
+
+        queries = [statement for statement in statements if "from pg_views" in statement]
+        assert [query.split("where ")[1] for query in queries] == [
+            "(false) and vw.definition ilike '%create materialized view%'"
+        ]
@@ -0,0 +1,116 @@
+import threading
+import time
+from unittest import TestCase, mock
+
+from dbt.adapters.contracts.relation import RelationType
+
+from dbt.adapters.redshift.mv_refresh import refresh_in_dependency_order
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter
+
+
+class TestRefreshInDependencyOrder(TestCase):
+    def test_dependents_wait_for_their_upstream_views(self):
+        refreshed = []
+        lock = threading.Lock()
+
+        def refresh(key):
+            with lock:
+                refreshed.append(key)
+
+        report = refresh_in_dependency_order(
+            {"base": set(), "daily": {"base"}, "weekly": {"daily", "base"}, "other": set()},
+            refresh,
+            max_workers=4,
+        )
+        assert refreshed.index("base") < refreshed.index("daily") < refreshed.index("weekly")
+        assert sorted(report.to_dict()["refreshed"]) == ["base", "daily", "other", "weekly"]
+
+    def test_independent_views_are_refreshed_in_parallel(self):
+        # both refreshes have to be running at once for the barrier to let them through
+        barrier = threading.Barrier(2, timeout=5)
+
+        def refresh(key):
+            barrier.wait()
+            time.sleep(0.2)
+
+        report = refresh_in_dependency_order({"a": set(), "b": set()}, refresh, max_workers=2)
+        assert report.failures == {}
+        assert report.serial_time > 0.4
+        assert report.time_saved > 0.1
+
+    def test_dependents_of_failed_refreshes_are_skipped(self):
+        def refresh(key):
+            if key == "base":
+                raise RuntimeError("boom")
+
+        report = refresh_in_dependency_order(
+            {"base": set(), "daily": {"base"}, "weekly": {"daily"}, "other": set()},
+            refresh,
+            max_workers=2,
+        )
+        assert report.failures == {"base": "boom"}
+        assert report.skipped == ["daily", "weekly"]
+        assert report.to_dict()["refreshed"] == ["other"]
+
+    def test_cycles_are_skipped(self):
+        report = refresh_in_dependency_order(
+            {"a": {"b"}, "b": {"a"}, "c": set()}, lambda key: None, max_workers=1
+        )
+        assert report.skipped == ["a", "b"]
+        assert list(report.durations) == ["c"]
+
+
+class TestRefreshMaterializedViews(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter(threads=8)
+        self.relations = [
+            RedshiftRelation.create(
+                database="dev",
+                schema="analytics",
+                identifier=name,
+                type=RelationType.MaterializedView,
+            )
+            for name in ("base", "daily")
+        ] + [RedshiftRelation.create(database="dev", schema="analytics", identifier="orders")]
+
+    def _refresh(self, wlm_slots):
+        def execute_macro(macro_name, kwargs=None, **_):
+            if macro_name == "redshift__get_wlm_concurrency":
+                return [(wlm_slots,)]
+            # daily reads from the table behind base
+            return [("analytics", "daily", "analytics", "mv_tbl__base__0")]
+
+        executed = []
+        with mock.patch.object(
+            self.adapter, "list_relations_in_schemas", return_value=self.relations
+        ):
+            with mock.patch.object(self.adapter, "execute_macro", side_effect=execute_macro):
+                with mock.patch.object(
+                    self.adapter, "execute", side_effect=lambda sql: executed.append(sql)
+                ):
+                    with mock.patch(
+                        "dbt.adapters.redshift.impl.refresh_in_dependency_order",
+                        wraps=refresh_in_dependency_order,
+                    ) as mock_refresh:
+                        results = self.adapter.refresh_materialized_views(["Analytics"])
+        return results, executed, mock_refresh
+
+    def test_views_are_refreshed_after_their_upstream_views(self):
+        results, executed, mock_refresh = self._refresh(wlm_slots=None)
+        assert executed == [
+            'refresh materialized view "dev"."analytics"."base"',
+            'refresh materialized view "dev"."analytics"."daily"',
+        ]
+        dependencies = mock_refresh.call_args.args[0]
+        assert {str(k): {str(v) for v in vs} for k, vs in dependencies.items()} == {
+            '"dev"."analytics"."base"': set(),
+            '"dev"."analytics"."daily"': {'"dev"."analytics"."base"'},
+        }
+        assert results["max_concurrency"] == 8
+        assert results["failed"] == {}
+
+    def test_concurrency_is_bounded_by_wlm(self):
+        results, _, mock_refresh = self._refresh(wlm_slots=5)
+        assert results["max_concurrency"] == 5
+        assert mock_refresh.call_args.args[2] == 5
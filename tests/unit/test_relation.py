@@ -1,3 +1,4 @@
+from unittest import mock
 from unittest.mock import Mock
 
 import agate
@@ -10,6 +11,7 @@ from dbt.adapters.contracts.relation import (
 )
 
 from dbt.adapters.redshift.relation_configs.sort import RedshiftSortStyle
+from tests.unit.utils import make_adapter
 
 
 def test_renameable_relation():
@@ -155,3 +157,106 @@ def test_materialized_view_config_changeset_multiple_sort_key_with_changes_in_or
 
     assert change_set is not None
     assert change_set.sort.context.sortkey == ("my_column2", "my_column")
+
+
+def table_from_db(diststyle=0, distkey=None, sortkey=(), sortkey1=None):
+    """The description of a table with two columns, `sortkey` gives their sort key positions."""
+    positions = dict(zip(["id", "loaded_at"], sortkey))
+    return {
+        "table": agate.Table.from_object([{"sortkey1": sortkey1}] if sortkey1 else []),
+        "columns": agate.Table(
+            [
+                (column, diststyle, column == distkey, positions.get(column, 0))
+                for column in ("id", "loaded_at")
+            ],
+            ["column", "diststyle", "is_dist_key", "sort_key_position"],
+            [agate.Text(), agate.Number(), agate.Boolean(), agate.Number()],
+        ),
+    }
+
+
+def table_config(**extra):
+    relation_config = Mock(spec=RelationConfig)
+    relation_config.config = Mock()
+    relation_config.config.extra = extra
+    relation_config.config.get.side_effect = extra.get
+    return relation_config
+
+
+def test_table_config_changeset_without_dist_or_sort_config():
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(diststyle=1, distkey="id", sortkey=(1,)), table_config()
+    )
+    assert change_set is None
+
+
+def test_table_config_changeset_without_changes():
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(diststyle=1, distkey="id", sortkey=(2, 1)),
+        table_config(dist="id", sort=["loaded_at", "id"]),
+    )
+    assert change_set is None
+
+
+def test_table_config_changeset_in_place():
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(diststyle=0, sortkey=(1,)),
+        table_config(dist="loaded_at", sort="loaded_at"),
+    )
+    assert change_set.dist.context.distkey == "loaded_at"
+    assert change_set.sort.context.sortkey == ("loaded_at",)
+    assert not change_set.requires_full_refresh
+
+
+def test_table_config_changeset_auto_sort_key():
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(diststyle=12, sortkey=(1,), sortkey1="AUTO(SORTKEY(id))"),
+        table_config(dist="auto"),
+    )
+    assert change_set is None
+
+
+def test_table_config_changeset_ignores_the_case_of_columns():
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(diststyle=1, distkey="id", sortkey=(2, 1)),
+        table_config(dist="ID", sort=["Loaded_At", '"id"']),
+    )
+    assert change_set is None
+
+
+def test_table_config_changeset_needs_a_sort_key_to_change_it():
+    # a sort_type alone never set a sort key
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(sortkey=(1,)), table_config(sort_type="interleaved")
+    )
+    assert change_set is None
+
+
+@pytest.mark.parametrize(
+    "sortkey,extra",
+    [
+        # a table with an interleaved sort key cannot change its dist
+        ((-1, -2), {"dist": "all"}),
+        # nor can a sort key become interleaved
+        ((1,), {"sort_type": "interleaved", "sort": ["id", "loaded_at"]}),
+    ],
+)
+def test_table_config_changeset_requires_full_refresh(sortkey, extra):
+    change_set = RedshiftRelation.table_config_changeset(
+        table_from_db(sortkey=sortkey), table_config(**extra)
+    )
+    assert change_set.requires_full_refresh
+
+
+@pytest.mark.parametrize(
+    "autocommit,transaction_open,left,committed",
+    [(True, True, True, True), (True, False, True, False), (False, True, False, False)],
+)
+def test_leave_transaction_block(autocommit, transaction_open, left, committed):
+    # the dist and sort of a table change outside of a transaction block
+    adapter = make_adapter(autocommit=autocommit)
+    connection = Mock(transaction_open=transaction_open)
+    with mock.patch.object(adapter.connections, "get_thread_connection", return_value=connection):
+        with mock.patch.object(adapter.connections, "commit") as mock_commit:
+            assert adapter.leave_transaction_block() == left
+    assert mock_commit.called == committed
@@ -0,0 +1,371 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+import agate
+import pytest
+
+from dbt.adapters.contracts.relation import RelationType
+from dbt.adapters.base import BaseAdapter
+from dbt.adapters.exceptions import ApproximateMatchError
+from dbt.adapters.redshift import RedshiftAdapter
+from dbt.adapters.redshift.relation import RedshiftRelation
+from dbt.adapters.redshift.relation_cache import (
+    RelationCacheSnapshot,
+    relation_cache_markers,
+)
+from tests.unit.utils import make_adapter, make_node, open_fake_connection, use_internal_macros
+
+
+@pytest.fixture
+def snapshot():
+    return RelationCacheSnapshot(
+        key="host/dev/user",
+        markers={"analytics": [2, 1002], "staging": [1, 1003]},
+        relations={
+            "analytics": [
+                {"schema": "analytics", "identifier": "orders", "type": "table"},
+                {"schema": "analytics", "identifier": "orders_v", "type": "view"},
+            ],
+            "staging": [{"schema": "staging", "identifier": "stg_orders", "type": "table"}],
+        },
+        links=[
+            ["analytics", "orders_v", "analytics", "orders"],
+            ["analytics", "orders", "staging", "stg_orders"],
+        ],
+    )
+
+
+def test_snapshot_round_trip(tmp_path, snapshot):
+    path = str(tmp_path / "cache" / "relations.json")
+    snapshot.save(path)
+    assert RelationCacheSnapshot.load(path, "host/dev/user") == snapshot
+
+
+def test_snapshot_for_another_target_is_ignored(tmp_path, snapshot):
+    path = str(tmp_path / "relations.json")
+    snapshot.save(path)
+    assert RelationCacheSnapshot.load(path, "host/prod/user") is None
+
+
+@pytest.mark.parametrize("contents", ["", "{not json", json.dumps({"version": 1})])
+def test_unreadable_snapshot_is_ignored(tmp_path, contents):
+    path = tmp_path / "relations.json"
+    path.write_text(contents)
+    assert RelationCacheSnapshot.load(str(path), "host/dev/user") is None
+
+
+def test_missing_snapshot_is_ignored(tmp_path):
+    assert RelationCacheSnapshot.load(str(tmp_path / "nope.json"), "host/dev/user") is None
+
+
+def test_changed_schemas(snapshot):
+    markers = {"analytics": [2, 1002], "staging": [2, 1010], "new_schema": [0, 0]}
+    assert snapshot.unchanged_schemas(markers) == {"analytics"}
+    assert snapshot.changed_schemas(markers) == {"staging", "new_schema"}
+
+
+def test_links_are_only_reused_between_unchanged_schemas(snapshot):
+    assert snapshot.get_links({"analytics"}) == [("analytics", "orders_v", "analytics", "orders")]
+
+
+def test_relation_cache_markers_are_lowercased():
+    rows = [("Analytics", 2, 1002), ("empty", 0, None)]
+    assert relation_cache_markers(rows) == {"analytics": [2, 1002], "empty": [0, 0]}
+
+
+class TestRelationCacheWarmup(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.snapshot_path = os.path.join(tmp_dir.name, "relations.json")
+        self.adapter = make_adapter(relation_cache_snapshot_path=self.snapshot_path)
+
+        self.cache_schemas = {
+            RedshiftRelation.create(database="dev", schema="analytics"),
+            RedshiftRelation.create(database="dev", schema="staging"),
+        }
+
+    def _warm_cache(self, markers, listed_relations, links):
+        def execute_macro(macro_name, kwargs=None, **_):
+            if macro_name == "redshift__get_relation_cache_markers":
+                return agate.Table(markers, ["schema_name", "relation_count", "max_oid"])
+            return links
+
+        def list_schemas(adapter, cache_schemas):
+            for cache_schema in cache_schemas:
+                for relation in listed_relations.get(cache_schema.schema, []):
+                    adapter.cache.add(relation)
+            adapter.cache.update_schemas((s.database, s.schema) for s in cache_schemas)
+
+        self.adapter.cache.clear()
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=execute_macro
+        ) as mock_execute_macro:
+            with mock.patch.object(
+                RedshiftAdapter,
+                "_cache_relations_in_schemas",
+                autospec=True,
+                side_effect=list_schemas,
+            ) as mock_list:
+                self.adapter._relations_cache_for_schemas([], self.cache_schemas)
+        return mock_execute_macro, mock_list
+
+    def test_unchanged_schemas_are_restored_from_disk(self):
+        listed_relations = {
+            "analytics": [
+                RedshiftRelation.create(
+                    database="dev", schema="analytics", identifier="orders", type="table"
+                )
+            ],
+            "staging": [
+                RedshiftRelation.create(
+                    database="dev", schema="staging", identifier="stg_orders", type="table"
+                )
+            ],
+        }
+        links = [("analytics", "orders", "staging", "stg_orders")]
+
+        _, mock_list = self._warm_cache(
+            [("analytics", 1, 1002), ("staging", 1, 1003)], listed_relations, links
+        )
+        assert {s.schema for s in mock_list.call_args.args[1]} == {"analytics", "staging"}
+
+        # staging changed since the first invocation, analytics did not
+        mock_execute_macro, mock_list = self._warm_cache(
+            [("analytics", 1, 1002), ("staging", 2, 1010)], listed_relations, links
+        )
+        assert {s.schema for s in mock_list.call_args.args[1]} == {"staging"}
+        mock_execute_macro.assert_any_call(
+            "redshift__get_relations", kwargs={"schemas": ["staging"]}
+        )
+
+        restored = self.adapter.get_relation("dev", "analytics", "orders")
+        assert restored is not None
+        assert restored.type == RelationType.Table
+        assert ("dev", "analytics") in self.adapter.cache
+
+    def test_schemas_are_listed_with_one_query_per_database(self):
+        def execute_macro(macro_name, kwargs=None, **_):
+            rows = [
+                (kwargs["database"], f"{schema}_table", schema, "table")
+                for schema in kwargs["schemas"]
+            ]
+            return agate.Table(rows, ["database", "name", "schema", "type"])
+
+        cache_schemas = self.cache_schemas | {
+            RedshiftRelation.create(database="other_db", schema="raw"),
+        }
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=execute_macro
+        ) as mock_execute_macro:
+            self.adapter._cache_relations_in_schemas(cache_schemas)
+
+        mock_execute_macro.assert_has_calls(
+            [
+                mock.call(
+                    "redshift__list_relations_in_schemas",
+                    kwargs={"database": "dev", "schemas": ["analytics", "staging"]},
+                ),
+                mock.call(
+                    "redshift__list_relations_in_schemas",
+                    kwargs={"database": "other_db", "schemas": ["raw"]},
+                ),
+            ],
+            any_order=True,
+        )
+        assert mock_execute_macro.call_count == 2
+        assert self.adapter.cache.get_relations("dev", "staging")[0].identifier == "staging_table"
+        assert ("other_db", "raw") in self.adapter.cache
+
+
+class TestSelectiveCacheWarmup(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.nodes = [
+            make_node("model.X.orders", "analytics", "orders", ["model.X.stg_orders"]),
+            make_node("model.X.orders_v", "analytics", "orders_v", ["model.X.orders"]),
+            make_node("model.X.stg_orders", "staging", "stg_orders"),
+            make_node("model.X.report", "marts", "report", ["model.X.stg_customers"]),
+            make_node("model.X.stg_customers", "staging", "stg_customers"),
+        ]
+
+    def _execute_macro(self, macro_name, kwargs=None, **_):
+        rows = [
+            ("dev", relation.identifier, relation.schema, "table")
+            for relation in kwargs["relations"]
+            if relation.identifier != "missing"
+        ]
+        return agate.Table(rows, ["database", "name", "schema", "type"])
+
+    def _warm_cache(self, cache_schemas):
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            with mock.patch.object(
+                RedshiftAdapter,
+                "_cache_relations_in_schemas",
+                autospec=True,
+                side_effect=lambda adapter, schemas: adapter.cache.update_schemas(
+                    (schema.database, schema.schema) for schema in schemas
+                ),
+            ):
+                with mock.patch.object(RedshiftAdapter, "_link_cached_relations"):
+                    self.adapter.set_relations_cache(
+                        self.nodes, clear=True, required_schemas=cache_schemas
+                    )
+        return mock_execute_macro
+
+    def test_only_direct_parents_of_selected_schemas_are_looked_up(self):
+        mock_execute_macro = self._warm_cache(
+            {RedshiftRelation.create(database="dev", schema="analytics")}
+        )
+        mock_execute_macro.assert_called_once_with(
+            "redshift__get_relations_by_name",
+            kwargs={
+                "database": "dev",
+                "relations": [
+                    RedshiftRelation.create(
+                        database="dev", schema="staging", identifier="stg_orders"
+                    )
+                ],
+            },
+        )
+
+        with mock.patch.object(self.adapter, "execute_macro") as mock_execute_macro:
+            parent = self.adapter.get_relation("dev", "staging", "stg_orders")
+        assert parent.identifier == "stg_orders"
+        mock_execute_macro.assert_not_called()
+        assert ("dev", "staging") not in self.adapter.cache
+
+    def test_lookups_outside_selected_schemas_are_targeted(self):
+        self._warm_cache({RedshiftRelation.create(database="dev", schema="analytics")})
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            assert self.adapter.get_relation("dev", "raw", "events").identifier == "events"
+            assert self.adapter.get_relation("dev", "raw", "events").identifier == "events"
+        assert mock_execute_macro.call_count == 1
+        mock_execute_macro.assert_called_with(
+            "redshift__get_relations_by_name",
+            kwargs={
+                "database": "dev",
+                "relations": [
+                    RedshiftRelation.create(database="dev", schema="raw", identifier="events")
+                ],
+            },
+        )
+
+    def test_missing_relations_are_looked_up_again(self):
+        # e.g. created by a hook or run_query, which dbt does not add to the cache
+        self._warm_cache({RedshiftRelation.create(database="dev", schema="analytics")})
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            assert self.adapter.get_relation("dev", "raw", "missing") is None
+            assert self.adapter.get_relation("dev", "raw", "missing") is None
+        assert mock_execute_macro.call_count == 2
+
+    def test_looked_up_relations_are_matched_like_listed_ones(self):
+        self._warm_cache({RedshiftRelation.create(database="dev", schema="analytics")})
+        rows = [("dev", "Events", "raw", "table")]
+        table = agate.Table(rows, ["database", "name", "schema", "type"])
+
+        with mock.patch.object(self.adapter, "execute_macro", return_value=table):
+            assert self.adapter.get_relation("dev", "raw", "Events").identifier == "Events"
+            with pytest.raises(ApproximateMatchError):
+                self.adapter.get_relation("dev", "raw", "events")
+
+        # the same as listing the schema
+        with mock.patch.object(
+            RedshiftAdapter,
+            "list_relations",
+            return_value=self.adapter._relations_from_rows(table),
+        ):
+            with pytest.raises(ApproximateMatchError):
+                BaseAdapter.get_relation(self.adapter, "dev", "raw", "events")
+
+    def test_dropped_relations_are_looked_up_again(self):
+        self._warm_cache({RedshiftRelation.create(database="dev", schema="analytics")})
+
+        stg_orders = RedshiftRelation.create(
+            database="dev", schema="staging", identifier="stg_orders"
+        )
+        self.adapter.cache_dropped(stg_orders)
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            self.adapter.get_relation("dev", "staging", "stg_orders")
+        mock_execute_macro.assert_called_once()
+
+    def test_full_warmup_does_not_look_up_relations(self):
+        mock_execute_macro = self._warm_cache(None)
+        mock_execute_macro.assert_not_called()
+
+    def test_misses_are_looked_up_by_name_after_a_full_warmup(self):
+        self._warm_cache(None)
+
+        with mock.patch.object(
+            self.adapter, "execute_macro", side_effect=self._execute_macro
+        ) as mock_execute_macro:
+            assert self.adapter.get_relation("dev", "raw", "events").identifier == "events"
+        mock_execute_macro.assert_called_once_with(
+            "redshift__get_relations_by_name",
+            kwargs={
+                "database": "dev",
+                "relations": [
+                    RedshiftRelation.create(database="dev", schema="raw", identifier="events")
+                ],
+            },
+        )
+        assert self.adapter._relation_lookups.schema_listings == 0
+
+    def test_full_schema_listings_are_counted(self):
+        self._warm_cache({RedshiftRelation.create(database="dev", schema="analytics")})
+
+        with mock.patch.object(
+            RedshiftAdapter, "list_relations_without_caching", return_value=[]
+        ) as mock_list:
+            self.adapter.list_relations("dev", "raw")
+            self.adapter.list_relations("dev", "analytics")
+        mock_list.assert_called_once()
+        assert self.adapter._relation_lookups.schema_listings == 1
+
+
+class TestRelationListingQueries(TestCase):
+    """The relation listings through the real macros, on a fake connection."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.adapter = make_adapter()
+        use_internal_macros(self.adapter, self.tmp_dir.name)
+
+    @staticmethod
+    def _rows(sql):
+        if "from svv_mv_info" in sql:
+            return [{"schema": "analytics", "name": "Orders_MV"}]
+        return [
+            {"database": "dev", "name": name, "schema": "analytics", "type": relation_type}
+            for name, relation_type in (("orders", "table"), ("orders_mv", "materialized_view"))
+        ]
+
+    def test_materialized_views_are_found_by_a_query_of_their_own(self):
+        statements = open_fake_connection(self.adapter, "list_analytics", rows=self._rows)
+        relations = self.adapter.list_relations_in_schemas("dev", {"analytics"})
+
+        queries = [statement for statement in statements if statement.startswith("select")]
+        assert len(queries) == 2
+        # Redshift does not join the leader-node catalog with svv_mv_info
+        assert "pg_class" not in queries[0] and "svv_mv_info" in queries[0]
+        assert "svv_mv_info" not in queries[1] and "pg_class" in queries[1]
+        assert "in (('analytics', 'orders_mv')) then 'materialized_view'" in queries[1]
+        assert [relation.type for relation in relations] == ["table", "materialized_view"]
+
+    def test_schemas_without_materialized_views(self):
+        statements = open_fake_connection(self.adapter, "list_analytics", rows=lambda sql: [])
+        self.adapter.list_relations_in_schemas("dev", {"analytics"})
+        assert "when tbl.relkind = 'v' and false then" in statements[-1]
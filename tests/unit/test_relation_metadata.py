@@ -0,0 +1,86 @@
+import threading
+from unittest import TestCase, mock
+
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.redshift.relation import RedshiftRelation
+from tests.unit.utils import make_adapter
+
+
+class TestMetadataOnSideConnections(TestCase):
+    def setUp(self):
+        self.adapter = make_adapter(metadata_threads=2)
+        self.addCleanup(self.adapter.cleanup_connections)
+
+    def test_grants_and_docs_can_run_on_side_connections(self):
+        orders = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="orders", type="table"
+        )
+        docs_sql = ["comment on table orders is 'Orders'"]
+
+        with mock.patch.object(self.adapter, "execute_macro") as mock_execute_macro:
+            with mock.patch.object(self.adapter, "execute") as mock_execute:
+                self.adapter.submit_relation_metadata(
+                    orders, {"select": ["reporter"]}, True, docs_sql
+                )
+                self.adapter.wait_for_relation_metadata(orders)
+        mock_execute_macro.assert_called_once_with(
+            "apply_grants",
+            kwargs={
+                "relation": orders,
+                "grant_config": {"select": ["reporter"]},
+                "should_revoke": True,
+            },
+        )
+        mock_execute.assert_called_once_with(docs_sql[0])
+
+    def test_side_connection_failures_are_raised_on_the_model(self):
+        orders = RedshiftRelation.create(
+            database="dev", schema="analytics", identifier="orders", type="table"
+        )
+
+        with mock.patch.object(
+            self.adapter, "execute", side_effect=DbtRuntimeError("permission denied")
+        ):
+            self.adapter.submit_relation_metadata(orders, None, True, ["comment on table orders"])
+            with pytest.raises(DbtRuntimeError, match="permission denied"):
+                self.adapter.wait_for_relation_metadata(orders)
+
+    def test_side_connections_are_kept_between_steps(self):
+        relations = [
+            RedshiftRelation.create(database="dev", schema="analytics", identifier=identifier)
+            for identifier in ("orders", "customers")
+        ]
+
+        with mock.patch.object(self.adapter, "execute"):
+            with mock.patch.object(self.adapter.connections, "release") as mock_release:
+                for relation in relations:
+                    self.adapter.submit_relation_metadata(relation, None, True, ["comment"])
+                    self.adapter.wait_for_relation_metadata(relation)
+        mock_release.assert_not_called()
+
+    def test_metadata_of_failed_models_is_cancelled(self):
+        adapter = make_adapter(metadata_threads=1)
+        self.addCleanup(adapter.cleanup_connections)
+        orders, customers = (
+            RedshiftRelation.create(database="dev", schema="analytics", identifier=identifier)
+            for identifier in ("orders", "customers")
+        )
+        started, release = threading.Event(), threading.Event()
+
+        def execute(sql):
+            started.set()
+            release.wait(5)
+
+        with mock.patch.object(adapter, "execute", side_effect=execute) as mock_execute:
+            adapter.submit_relation_metadata(orders, None, True, ["comment on orders"])
+            adapter.submit_relation_metadata(customers, None, True, ["comment on customers"])
+            assert started.wait(5)
+            # the model fails before waiting, then dbt releases its connection
+            timer = threading.Timer(0.1, release.set)
+            timer.start()
+            adapter.release_connection()
+            timer.join()
+        mock_execute.assert_called_once_with("comment on orders")
+        assert adapter._metadata_futures == {}
@@ -5,6 +5,7 @@ issues.
 
 import string
 import os
+from types import SimpleNamespace
 from unittest import TestCase, mock
 
 import agate
@@ -260,6 +261,64 @@ def load_internal_manifest_macros(config, macro_hook=lambda m: None):
     return ManifestLoader.load_macros(config, macro_hook)
 
 
+def use_internal_macros(adapter, project_root):
+    """Let `adapter` execute the macros of dbt and of the adapter packages, as in a run."""
+    from dbt.context.providers import generate_runtime_macro_context
+
+    with open(os.path.join(project_root, "dbt_project.yml"), "w") as fp:
+        fp.write(f"name: {adapter.config.project_name}\n")
+    adapter.config.project_root = project_root
+    adapter.config.args.profile = None
+    adapter.config.args.target = None
+    adapter.set_macro_resolver(load_internal_manifest_macros(adapter.config))
+    adapter.set_macro_context_generator(generate_runtime_macro_context)
+
+
+class FakeCursor:
+    """
+    A cursor that records the statements it runs. Those that select return `rows`, or the rows
+    `rows(sql)` returns as dictionaries.
+    """
+
+    def __init__(self, statements, rows):
+        self.statements = statements
+        self.rows = rows
+        self.description = None
+        self.rowcount = 0
+        self.fetched = []
+
+    def execute(self, sql, bindings=None):
+        self.statements.append(" ".join(sql.split()))
+        self.description = None
+        if not sql.lstrip().lower().startswith(("select", "with")):
+            return
+        if callable(self.rows):
+            rows = self.rows(sql)
+            # text columns, unless there are no rows to name them
+            names = list(rows[0]) if rows else ["column"]
+            self.description = [(name, 25) for name in names]
+            self.fetched = [tuple(row.values()) for row in rows]
+        else:
+            self.description = [("column", 23)]
+            self.fetched = list(self.rows)
+
+    def fetchall(self):
+        return self.fetched
+
+
+def open_fake_connection(adapter, name, rows=()):
+    """
+    Open the connection `name` of this thread on a fake handle, and return the statements it
+    runs, BEGIN and COMMIT included.
+    """
+    statements = []
+    connection = adapter.acquire_connection(name)
+    connection.handle = mock.Mock()
+    connection.handle.cursor.side_effect = lambda: FakeCursor(statements, rows)
+    connection.state = "open"
+    return statements
+
+
 def dict_replace(dct, **kwargs):
     dct = dct.copy()
     dct.update(kwargs)
@@ -271,3 +330,51 @@ def replace_config(n, **kwargs):
         config=n.config.replace(**kwargs),
         unrendered_config=dict_replace(n.unrendered_config, **kwargs),
     )
+
+
+def make_adapter(**credentials):
+    """A single-threaded Redshift adapter for a "dev" target, with extra profile fields."""
+    from multiprocessing import get_context
+
+    from dbt.adapters.redshift import Plugin as RedshiftPlugin, RedshiftAdapter
+
+    profile_cfg = {
+        "outputs": {
+            "test": {
+                "type": "redshift",
+                "dbname": "dev",
+                "user": "user",
+                "host": "host",
+                "pass": "password",
+                "port": 5439,
+                "schema": "analytics",
+                **credentials,
+            }
+        },
+        "target": "test",
+    }
+
+    project_cfg = {
+        "name": "X",
+        "version": "0.1",
+        "profile": "test",
+        "project-root": "/tmp/dbt/does-not-exist",
+        "config-version": 2,
+    }
+
+    config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+    config.args.single_threaded = True
+    adapter = RedshiftAdapter(config, get_context("spawn"))
+    inject_adapter(adapter, RedshiftPlugin)
+    return adapter
+
+
+def make_node(unique_id, schema, identifier, parents=()):
+    return SimpleNamespace(
+        unique_id=unique_id,
+        database="dev",
+        schema=schema,
+        identifier=identifier,
+        quoting_dict={},
+        depends_on=SimpleNamespace(nodes=list(parents)),
+    )